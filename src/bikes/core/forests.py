@@ -0,0 +1,322 @@
+"""Compile tree ensembles into flat arrays for fast inference."""
+
+# %% IMPORTS
+
+import typing as T
+import weakref
+
+import numba
+import numpy as np
+import pydantic as pdt
+from sklearn import ensemble
+from sklearn.base import BaseEstimator, RegressorMixin
+
+# %% TYPES
+
+# Tree ensembles supported by the compiled forests: their prediction is the mean of their trees
+Ensemble: T.TypeAlias = ensemble.RandomForestRegressor | ensemble.ExtraTreesRegressor
+
+# Precisions of the thresholds and leaf values of the compiled forests
+Precision = T.Literal["float64", "float32"]
+
+# Nodes of a compiled forest: the left child is the next node, and the threshold holds the value of the leaves
+NODES: dict[Precision, np.dtype] = {
+    precision: np.dtype(
+        [
+            ("threshold", precision),
+            ("right", np.int32),
+            ("feature", np.int16),  # -1 for the leaves
+            ("missing_left", np.bool_),
+        ],
+        align=True,
+    )
+    for precision in T.get_args(Precision)
+}
+NODE = NODES["float64"]
+
+# %% KERNELS
+
+
+@numba.njit(cache=True, nogil=True)
+def preorder(children_left: np.ndarray, children_right: np.ndarray, leaves: np.ndarray) -> np.ndarray:
+    """Order the nodes of a tree depth-first, with the left child right after its parent.
+
+    Args:
+        children_left (np.ndarray): left child of each node, or -1 for the leaves.
+        children_right (np.ndarray): right child of each node, or -1 for the leaves.
+        leaves (np.ndarray): mask of the nodes to keep as leaves (i.e., without their subtree).
+
+    Returns:
+        np.ndarray: ids of the nodes in preorder.
+    """
+    order = np.empty(children_left.shape[0], dtype=np.int32)
+    stack = np.empty(children_left.shape[0], dtype=np.int32)
+    stack[0], size, count = 0, 1, 0
+    while size:
+        size -= 1
+        node = stack[size]
+        order[count] = node
+        count += 1
+        if not leaves[node]:
+            stack[size] = children_right[node]
+            stack[size + 1] = children_left[node]
+            size += 2
+    return order[:count]
+
+
+@numba.njit(cache=True, nogil=True)
+def prune(children_left: np.ndarray, children_right: np.ndarray, values: np.ndarray, tolerance: float) -> np.ndarray:
+    """Find the nodes whose subtree changes the tree predictions by at most the tolerance.
+
+    Replacing such a subtree by a leaf with the value of its root changes the predictions
+    of the tree, and of the forest, by at most the tolerance.
+
+    Args:
+        children_left (np.ndarray): left child of each node, or -1 for the leaves.
+        children_right (np.ndarray): right child of each node, or -1 for the leaves.
+        values (np.ndarray): value of each node (i.e., its mean target).
+        tolerance (float): maximum change of the predictions.
+
+    Returns:
+        np.ndarray: mask of the nodes to keep as leaves (including the leaves).
+    """
+    leaves = children_left == -1
+    lows, highs = values.copy(), values.copy()
+    order = preorder(children_left, children_right, leaves)
+    for node in order[::-1]:  # children first
+        if not leaves[node]:
+            left, right = children_left[node], children_right[node]
+            lows[node] = min(lows[left], lows[right])
+            highs[node] = max(highs[left], highs[right])
+    return leaves | ((highs - values <= tolerance) & (values - lows <= tolerance))
+
+
+@numba.njit(cache=True, nogil=True, parallel=True)
+def traverse(features: np.ndarray, roots: np.ndarray, nodes: np.ndarray, block: int) -> np.ndarray:
+    """Average the leaf values reached by the rows in each tree of a compiled forest.
+
+    The blocks of rows run in parallel, and each block goes through the trees one at a time:
+    the nodes of a tree stay in cache for all the rows of the block. The values are added
+    in the order of the trees, and divided by their number, like scikit-learn does.
+
+    Args:
+        features (np.ndarray): float32 features of the rows.
+        roots (np.ndarray): node of the root of each tree.
+        nodes (np.ndarray): nodes of the trees, with a NODES dtype.
+        block (int): number of rows per block.
+
+    Returns:
+        np.ndarray: mean of the leaf values for each row.
+    """
+    rows = features.shape[0]
+    outputs = np.empty(rows)
+    for chunk in numba.prange((rows + block - 1) // block):
+        start = chunk * block
+        stop = min(start + block, rows)
+        totals = np.zeros(stop - start)
+        for root in roots:
+            for row in range(start, stop):
+                node = root
+                record = nodes[node]
+                while record.feature >= 0:
+                    value = features[row, record.feature]
+                    left = (value <= record.threshold) | (np.isnan(value) & record.missing_left)
+                    node = node + 1 if left else record.right
+                    record = nodes[node]
+                totals[row - start] += record.threshold
+        outputs[start:stop] = totals / roots.shape[0]
+    return outputs
+
+
+# %% FORESTS
+
+
+class Compaction(pdt.BaseModel, strict=True, frozen=True, extra="forbid"):
+    """Settings to compact the forests, e.g., to save them with the models.
+
+    The compiled forests only keep the nodes needed for prediction: the sklearn bookkeeping arrays
+    (e.g., impurities and sample counts) are dropped, and the pruned subtrees are replaced by leaves.
+
+    Parameters:
+        precision (Precision): dtype of the thresholds and leaf values (float64 predicts like sklearn).
+        tolerance (float): maximum change of the predictions from the pruned subtrees (0 to keep them).
+    """
+
+    precision: Precision = "float32"
+    tolerance: float = pdt.Field(0.0, ge=0)
+
+
+class Forest:
+    """Tree ensemble flattened into contiguous arrays, and evaluated by a compiled kernel.
+
+    Without compaction, the predictions match scikit-learn exactly: the features are cast to
+    float32 like the scikit-learn trees do, and the thresholds and leaf values stay in float64.
+    In float32, the thresholds are rounded down to keep the same decisions: only the leaf
+    values lose precision, and the pruned subtrees change the predictions within the tolerance.
+
+    Parameters:
+        roots (np.ndarray): node of the root of each tree.
+        nodes (np.ndarray): nodes of the trees, with a NODES dtype.
+    """
+
+    def __init__(self, roots: np.ndarray, nodes: np.ndarray) -> None:
+        """Initialize the forest from its flat arrays.
+
+        Args:
+            roots (np.ndarray): node of the root of each tree.
+            nodes (np.ndarray): nodes of the trees, with a NODES dtype.
+        """
+        self.roots = roots
+        self.nodes = nodes
+
+    @classmethod
+    def from_sklearn(cls, regressor: Ensemble, compaction: Compaction | None = None) -> T.Self:
+        """Flatten the trees of a fitted scikit-learn ensemble.
+
+        Args:
+            regressor (Ensemble): fitted scikit-learn ensemble.
+            compaction (Compaction | None): settings to compact the forest, or None to predict like sklearn.
+
+        Raises:
+            ValueError: if the ensemble has several outputs or too many features.
+
+        Returns:
+            T.Self: forest of the ensemble.
+        """
+        compaction = compaction or Compaction(precision="float64")
+        if regressor.n_outputs_ != 1:
+            raise ValueError("Forest only supports single output ensembles!")
+        if regressor.n_features_in_ > np.iinfo(np.int16).max:
+            raise ValueError("Forest only supports ensembles with less than 32768 features!")
+        dtype = NODES[compaction.precision]
+        roots, trees, offset = [], [], 0
+        for estimator in regressor.estimators_:
+            tree = estimator.tree_
+            values = tree.value[:, 0, 0]
+            if compaction.tolerance > 0:
+                leaves = prune(tree.children_left, tree.children_right, values, compaction.tolerance)
+            else:
+                leaves = tree.children_left == -1
+            order = preorder(tree.children_left, tree.children_right, leaves)
+            positions = np.empty(tree.node_count, dtype=np.int32)
+            positions[order] = np.arange(offset, offset + len(order), dtype=np.int32)
+            thresholds = tree.threshold[order].astype(dtype["threshold"])
+            # round down: for float32 features, x <= threshold iff x <= rounded threshold
+            thresholds = np.where(thresholds > tree.threshold[order], np.nextafter(thresholds, -np.inf), thresholds)
+            leaves = leaves[order]
+            nodes = np.zeros(len(order), dtype=dtype)
+            nodes["threshold"] = np.where(leaves, values[order], thresholds)
+            nodes["right"] = np.where(leaves, -1, positions[tree.children_right[order]])
+            nodes["feature"] = np.where(leaves, -1, tree.feature[order])
+            nodes["missing_left"] = tree.missing_go_to_left[order]
+            roots.append(offset)
+            trees.append(nodes)
+            offset += len(order)
+        return cls(roots=np.array(roots, dtype=np.int32), nodes=np.concatenate(trees))
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        """Predict the outputs of the forest for the given features.
+
+        Args:
+            features (np.ndarray): features of the rows (e.g., the outputs of a transformer).
+
+        Returns:
+            np.ndarray: predictions of the forest.
+        """
+        features = np.ascontiguousarray(features, dtype=np.float32)
+        block = max(1, -(-len(features) // numba.get_num_threads()))  # one block per thread
+        return traverse(features, self.roots, self.nodes, block)
+
+
+class ForestRegressor(RegressorMixin, BaseEstimator):
+    """Regressor predicting with a compact forest, in place of a fitted ensemble (e.g., in a pipeline).
+
+    Parameters:
+        forest (Forest): compiled forest of the ensemble.
+        feature_importances (np.ndarray): feature importances of the ensemble.
+    """
+
+    def __init__(self, forest: Forest, feature_importances: np.ndarray) -> None:
+        """Initialize the regressor from a compiled forest.
+
+        Args:
+            forest (Forest): compiled forest of the ensemble.
+            feature_importances (np.ndarray): feature importances of the ensemble.
+        """
+        self.forest = forest
+        self.feature_importances = feature_importances
+
+    @classmethod
+    def from_sklearn(cls, regressor: Ensemble, compaction: Compaction) -> T.Self:
+        """Compact a fitted scikit-learn ensemble into a regressor.
+
+        Args:
+            regressor (Ensemble): fitted scikit-learn ensemble.
+            compaction (Compaction): settings to compact the forest.
+
+        Returns:
+            T.Self: regressor of the compact forest.
+        """
+        forest = Forest.from_sklearn(regressor, compaction=compaction)
+        return cls(forest=forest, feature_importances=regressor.feature_importances_)
+
+    @property
+    def feature_importances_(self) -> np.ndarray:
+        """Return the feature importances of the ensemble, like scikit-learn ensembles.
+
+        Returns:
+            np.ndarray: feature importances of the ensemble.
+        """
+        return self.feature_importances
+
+    def __sklearn_is_fitted__(self) -> bool:
+        """Return True: the regressor is built from a fitted ensemble.
+
+        Returns:
+            bool: True.
+        """
+        return True
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> T.Self:  # noqa: ARG002, N803  # sklearn fit interface
+        """Reject the fitting: the compact forests are built from fitted ensembles.
+
+        Args:
+            X (np.ndarray): features of the rows.
+            y (np.ndarray): targets of the rows.
+
+        Raises:
+            TypeError: always, fit the ensemble before compacting it instead.
+        """
+        raise TypeError("Compact forest can't be fitted: fit the ensemble before compacting it!")
+
+    def predict(self, X: np.ndarray) -> np.ndarray:  # noqa: N803  # sklearn predict interface
+        """Predict the outputs of the forest for the given features.
+
+        Args:
+            X (np.ndarray): features of the rows.
+
+        Returns:
+            np.ndarray: predictions of the forest.
+        """
+        return self.forest.predict(X)
+
+
+# Forests compiled from the ensembles, as long as they exist (i.e., never persisted with the models)
+FORESTS: weakref.WeakKeyDictionary[Ensemble, Forest] = weakref.WeakKeyDictionary()
+
+
+def compile_forest(regressor: Ensemble | ForestRegressor) -> Forest:
+    """Compile a fitted scikit-learn ensemble, or reuse its compiled forest.
+
+    Args:
+        regressor (Ensemble | ForestRegressor): fitted scikit-learn ensemble, or compact regressor.
+
+    Returns:
+        Forest: compiled forest of the ensemble.
+    """
+    if isinstance(regressor, ForestRegressor):
+        return regressor.forest
+    forest = FORESTS.get(regressor)
+    if forest is None or len(forest.roots) != len(regressor.estimators_):  # e.g., grown with warm start
+        forest = FORESTS[regressor] = Forest.from_sklearn(regressor)
+    return forest
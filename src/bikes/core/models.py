@@ -3,15 +3,20 @@
 # %% IMPORTS
 
 import abc
+import contextvars
+import functools
 import typing as T
+import warnings
 
+import joblib
+import numpy as np
 import pandas as pd
 import pydantic as pdt
 import shap
 from sklearn import compose, ensemble, pipeline, preprocessing
 from sklearn.base import BaseEstimator, RegressorMixin
 
-from bikes.core import schemas
+from bikes.core import forests, schemas
 
 # %% TYPES
 
@@ -20,6 +25,53 @@ ParamKey = str
 ParamValue = T.Any
 Params = dict[ParamKey, ParamValue]
 
+# Inference engines: the scikit-learn pipeline, or its forest compiled with numba (same predictions)
+Engine = T.Literal["sklearn", "numba"]
+
+# %% CACHES
+
+
+class Memory:
+    """Cache the fitted transformers and trees of the model pipelines in memory.
+
+    Provide the joblib.Memory interface of the scikit-learn pipelines, without writing to disk:
+    the cache key is the hash of the transformer config and of its fit data (e.g., a fold),
+    so the pipelines of a search reuse the fitted transformers and features of each fold.
+
+    The memory also keeps the trees of the largest forest fitted on each fold, so the forests
+    of the next candidates grow from these trees with warm start (e.g., to tune n_estimators).
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self.results: dict[str, T.Any] = {}
+        self.trees: dict[str, list[T.Any]] = {}
+
+    def cache(self, func: T.Callable[..., T.Any], ignore: list[str] | None = None) -> T.Callable[..., T.Any]:
+        """Cache the results of a function by the hash of its arguments.
+
+        Args:
+            func (T.Callable[..., T.Any]): function to cache.
+            ignore (list[str] | None): keyword arguments to exclude from the cache key.
+
+        Returns:
+            T.Callable[..., T.Any]: function with cached results.
+        """
+
+        @functools.wraps(func)
+        def cached(*args: T.Any, **kwargs: T.Any) -> T.Any:
+            keys = {name: value for name, value in kwargs.items() if name not in (ignore or [])}
+            key = joblib.hash((func.__module__, func.__qualname__, args, keys))
+            if key not in self.results:
+                self.results[key] = func(*args, **kwargs)
+            return self.results[key]
+
+        return cached
+
+
+# Cache of the model pipelines in the current context (e.g., a search), or None to disable it
+MEMORY: contextvars.ContextVar[Memory | None] = contextvars.ContextVar("memory", default=None)
+
 # %% MODELS
 
 
@@ -36,6 +88,9 @@ class Model(abc.ABC, pdt.BaseModel, strict=True, frozen=False, extra="forbid"):
 
     KIND: str
 
+    # the model implements `compact` (e.g., to validate the savers before the training)
+    COMPACTABLE: T.ClassVar[bool] = False
+
     def __sklearn_tags__(self) -> T.Any:
         """Return scikit-learn estimator tags.
 
@@ -112,6 +167,20 @@ class Model(abc.ABC, pdt.BaseModel, strict=True, frozen=False, extra="forbid"):
         """
         raise NotImplementedError
 
+    def compact(self, compaction: forests.Compaction) -> T.Self:
+        """Return a compact copy of the fitted model, e.g., to save it as a smaller artifact.
+
+        Args:
+            compaction (forests.Compaction): settings to compact the model.
+
+        Raises:
+            NotImplementedError: method not implemented.
+
+        Returns:
+            T.Self: compact copy of the model.
+        """
+        raise NotImplementedError
+
     def get_internal_model(self) -> T.Any:
         """Return the internal model in the object.
 
@@ -124,21 +193,12 @@ class Model(abc.ABC, pdt.BaseModel, strict=True, frozen=False, extra="forbid"):
         raise NotImplementedError
 
 
-class BaselineSklearnModel(Model):
-    """Simple baseline model based on scikit-learn.
+class SklearnModel(Model):
+    """Base class for the models based on a scikit-learn pipeline.
 
-    Parameters:
-        max_depth (int): maximum depth of the random forest.
-        n_estimators (int): number of estimators in the random forest.
-        random_state (int, optional): random state of the machine learning pipeline.
+    The pipeline chains a transformer step for the features and a regressor step for the trees.
     """
 
-    KIND: T.Literal["BaselineSklearnModel"] = "BaselineSklearnModel"
-
-    # params
-    max_depth: int = 20
-    n_estimators: int = 200
-    random_state: int | None = 42
     # private
     _pipeline: pipeline.Pipeline | None = None
     _numericals: list[str] = [
@@ -160,39 +220,268 @@ class BaselineSklearnModel(Model):
         "weathersit",
     ]
 
+    @T.override
+    def predict(self, inputs: schemas.Inputs) -> schemas.Outputs:
+        prediction = self._predict(model=self.get_internal_model(), inputs=inputs)
+        outputs_ = pd.DataFrame(data={schemas.OutputsSchema.prediction: prediction}, index=inputs.index)
+        return schemas.OutputsSchema.check(data=outputs_)
+
+    @T.override
+    def explain_samples(self, inputs: schemas.Inputs) -> schemas.SHAPValues:
+        model = self.get_internal_model()
+        regressor = model.named_steps["regressor"]
+        transformer = model.named_steps["transformer"]
+        transformed = transformer.transform(X=inputs)
+        explainer = shap.TreeExplainer(model=regressor)
+        shap_values_ = pd.DataFrame(
+            data=explainer.shap_values(X=transformed),
+            columns=transformer.get_feature_names_out(),
+        )
+        return schemas.SHAPValuesSchema.check(data=shap_values_)
+
+    @T.override
+    def get_internal_model(self) -> pipeline.Pipeline:
+        model = self._pipeline
+        if model is None:
+            raise ValueError("Model is not fitted yet!")
+        return model
+
+    def _predict(self, model: pipeline.Pipeline, inputs: schemas.Inputs) -> np.ndarray:
+        """Predict the outputs of the fitted pipeline.
+
+        Args:
+            model (pipeline.Pipeline): fitted pipeline of the model.
+            inputs (schemas.Inputs): model inputs.
+
+        Returns:
+            np.ndarray: predictions of the pipeline.
+        """
+        return model.predict(inputs)
+
+
+class BaselineSklearnModel(SklearnModel):
+    """Simple baseline model based on scikit-learn.
+
+    The inputs keep their compact storage dtypes (e.g., float16, uint8, bool),
+    but the transformer builds a single contiguous matrix in the compute dtype:
+    the random forest consumes it as is, without converting the features again.
+
+    With warm start, the forest grows from the trees fitted on the same data in the memory
+    (e.g., the smaller candidates of a search), and only fits the missing trees. With a
+    random state, the forest is the same as a forest fitted from scratch: tuning the number
+    of trees costs about as much as fitting the largest forest once.
+
+    With early stopping, the forest grows by n_estimators_step trees until n_estimators,
+    and stops when its out-of-bag score doesn't improve by tol for n_iter_no_change steps.
+
+    Parameters:
+        max_depth (int): maximum depth of the random forest.
+        n_estimators (int): number of estimators in the random forest (maximum with early stopping).
+        random_state (int, optional): random state of the machine learning pipeline.
+        engine (Engine): inference engine of the random forest.
+        warm_start (bool): grow the forest from the trees fitted on the same data in the memory.
+        early_stopping (bool): stop adding trees when the out-of-bag score plateaus.
+        n_estimators_step (int): number of trees added between the out-of-bag scores.
+        n_iter_no_change (int): number of steps without improvement before stopping.
+        tol (float): minimum improvement of the out-of-bag score (R2) for a step.
+    """
+
+    KIND: T.Literal["BaselineSklearnModel"] = "BaselineSklearnModel"
+    COMPACTABLE: T.ClassVar[bool] = True
+
+    # params
+    max_depth: int = 20
+    n_estimators: int = 200
+    random_state: int | None = 42
+    engine: Engine = "sklearn"
+    warm_start: bool = True
+    early_stopping: bool = False
+    n_estimators_step: int = pdt.Field(default=25, ge=1)
+    n_iter_no_change: int = pdt.Field(default=2, ge=1)
+    tol: float = pdt.Field(default=1e-4, ge=0)
+    # private
+    _compute_dtype: type[np.floating] = np.float32  # dtype of the random forest features
+
     @T.override
     def fit(self, inputs: schemas.Inputs, targets: schemas.Targets) -> BaselineSklearnModel:
         # subcomponents
-        categoricals_transformer = preprocessing.OneHotEncoder(sparse_output=False, handle_unknown="ignore")
+        categoricals_transformer = preprocessing.OneHotEncoder(
+            sparse_output=False, handle_unknown="ignore", dtype=self._compute_dtype
+        )
+        numericals_transformer = preprocessing.FunctionTransformer(
+            func=pd.DataFrame.to_numpy, kw_args={"dtype": self._compute_dtype}, feature_names_out="one-to-one"
+        )
         # components
         transformer = compose.ColumnTransformer(
             [
                 ("categoricals", categoricals_transformer, self._categoricals),
-                ("numericals", "passthrough", self._numericals),
+                ("numericals", numericals_transformer, self._numericals),
             ],
             remainder="drop",
         )
+        sizes = [self.n_estimators]
+        if self.early_stopping:
+            sizes = [*range(self.n_estimators_step, self.n_estimators, self.n_estimators_step), self.n_estimators]
         regressor = ensemble.RandomForestRegressor(
             max_depth=self.max_depth,
-            n_estimators=self.n_estimators,
+            n_estimators=sizes[0],
             random_state=self.random_state,
+            oob_score=self.early_stopping,
+            warm_start=True,
+        )
+        # trees
+        memory = MEMORY.get()
+        key = (
+            joblib.hash((self.KIND, self.max_depth, self.random_state, inputs, targets)) if memory is not None else None
         )
+        if memory is not None and key is not None and self.warm_start and key in memory.trees:
+            regressor.estimators_ = memory.trees[key][: sizes[0]]
         # pipeline
         self._pipeline = pipeline.Pipeline(
             steps=[
                 ("transformer", transformer),
                 ("regressor", regressor),
-            ]
+            ],
+            memory=memory,
         )
-        self._pipeline.fit(X=inputs, y=targets[schemas.TargetsSchema.cnt])
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="Warm-start fitting without increasing")  # all trees reused
+            self._pipeline.fit(X=inputs, y=targets[schemas.TargetsSchema.cnt])
+        if self.early_stopping:
+            features = self._pipeline.named_steps["transformer"].transform(X=inputs)
+            best, no_change = regressor.oob_score_, 0
+            for size in sizes[1:]:
+                regressor.set_params(n_estimators=size).fit(X=features, y=targets[schemas.TargetsSchema.cnt])
+                if regressor.oob_score_ > best + self.tol:
+                    best, no_change = regressor.oob_score_, 0
+                else:
+                    no_change += 1
+                if no_change >= self.n_iter_no_change:
+                    break
+        if memory is not None and key is not None and len(regressor.estimators_) > len(memory.trees.get(key, [])):
+            memory.trees[key] = list(regressor.estimators_)
+        # the cache only lives in its context, and the forest only grows during the fit
+        self._pipeline.set_params(memory=None, regressor__warm_start=False)
         return self
 
     @T.override
-    def predict(self, inputs: schemas.Inputs) -> schemas.Outputs:
+    def explain_model(self) -> schemas.FeatureImportances:
         model = self.get_internal_model()
-        prediction = model.predict(inputs)
-        outputs_ = pd.DataFrame(data={schemas.OutputsSchema.prediction: prediction}, index=inputs.index)
-        return schemas.OutputsSchema.check(data=outputs_)
+        regressor = model.named_steps["regressor"]
+        transformer = model.named_steps["transformer"]
+        feature = transformer.get_feature_names_out()
+        feature_importances_ = pd.DataFrame(
+            data={
+                "feature": feature,
+                "importance": regressor.feature_importances_,
+            }
+        )
+        return schemas.FeatureImportancesSchema.check(data=feature_importances_)
+
+    @T.override
+    def explain_samples(self, inputs: schemas.Inputs) -> schemas.SHAPValues:
+        if isinstance(self.get_internal_model().named_steps["regressor"], forests.ForestRegressor):
+            raise TypeError("Compact model can't explain samples: its trees have no sample counts!")
+        return super().explain_samples(inputs=inputs)
+
+    @T.override
+    def compact(self, compaction: forests.Compaction) -> BaselineSklearnModel:
+        model = self.get_internal_model()
+        regressor = forests.ForestRegressor.from_sklearn(model.named_steps["regressor"], compaction=compaction)
+        compacted = self.model_copy()  # the private attributes are copied too
+        compacted._pipeline = pipeline.Pipeline(  # noqa: SLF001  # copy of the same class
+            steps=[
+                ("transformer", model.named_steps["transformer"]),
+                ("regressor", regressor),
+            ]
+        )
+        return compacted
+
+    @T.override
+    def _predict(self, model: pipeline.Pipeline, inputs: schemas.Inputs) -> np.ndarray:
+        if self.engine == "numba":
+            features = model.named_steps["transformer"].transform(X=inputs)
+            return forests.compile_forest(model.named_steps["regressor"]).predict(features)
+        return super()._predict(model=model, inputs=inputs)
+
+
+class HistGradientBoostingModel(SklearnModel):
+    """Histogram-based gradient boosting model based on scikit-learn.
+
+    The regressor handles the categoricals natively (i.e., without one-hot encoding),
+    and stops the boosting early when the score on a validation split stops improving.
+    The samples are explained by permutations of their features, since the tree explainer
+    of SHAP does not follow the categorical splits.
+
+    Parameters:
+        learning_rate (float): shrinkage of the boosting iterations.
+        max_iter (int): maximum number of boosting iterations.
+        max_leaf_nodes (int): maximum number of leaves for each tree.
+        max_depth (int, optional): maximum depth of each tree.
+        min_samples_leaf (int): minimum number of samples per leaf.
+        l2_regularization (float): L2 regularization of the leaf values.
+        early_stopping (bool): stop the boosting when the validation score stops improving.
+        validation_fraction (float): fraction of the training data used for early stopping.
+        n_iter_no_change (int): number of iterations without improvement before stopping.
+        random_state (int, optional): random state of the machine learning pipeline.
+    """
+
+    KIND: T.Literal["HistGradientBoostingModel"] = "HistGradientBoostingModel"
+
+    # params
+    learning_rate: float = 0.1
+    max_iter: int = 500
+    max_leaf_nodes: int = 31
+    max_depth: int | None = None
+    min_samples_leaf: int = 20
+    l2_regularization: float = 0.0
+    early_stopping: bool = True
+    validation_fraction: float = pdt.Field(default=0.1, gt=0, lt=1)
+    n_iter_no_change: int = pdt.Field(default=10, ge=1)
+    random_state: int | None = 42
+    # private
+    _compute_dtype: type[np.floating] = np.float64  # dtype of the gradient boosting features
+    _background_size: int = 100  # samples of the background of the SHAP values
+    _permutations: int = 3  # antithetic permutations of the features per sample
+
+    @T.override
+    def fit(self, inputs: schemas.Inputs, targets: schemas.Targets) -> HistGradientBoostingModel:
+        # subcomponents
+        features_transformer = preprocessing.FunctionTransformer(
+            func=pd.DataFrame.to_numpy, kw_args={"dtype": self._compute_dtype}, feature_names_out="one-to-one"
+        )
+        # components
+        transformer = compose.ColumnTransformer(
+            [
+                ("categoricals", features_transformer, self._categoricals),
+                ("numericals", features_transformer, self._numericals),
+            ],
+            remainder="drop",
+        )
+        regressor = ensemble.HistGradientBoostingRegressor(
+            learning_rate=self.learning_rate,
+            max_iter=self.max_iter,
+            max_leaf_nodes=self.max_leaf_nodes,
+            max_depth=self.max_depth,
+            min_samples_leaf=self.min_samples_leaf,
+            l2_regularization=self.l2_regularization,
+            categorical_features=list(range(len(self._categoricals))),
+            early_stopping=self.early_stopping,
+            validation_fraction=self.validation_fraction,
+            n_iter_no_change=self.n_iter_no_change,
+            random_state=self.random_state,
+        )
+        # pipeline
+        self._pipeline = pipeline.Pipeline(
+            steps=[
+                ("transformer", transformer),
+                ("regressor", regressor),
+            ],
+            memory=MEMORY.get(),
+        )
+        self._pipeline.fit(X=inputs, y=targets[schemas.TargetsSchema.cnt])
+        self._pipeline.set_params(memory=None)  # the cache only lives in its context
+        return self
 
     @T.override
     def explain_model(self) -> schemas.FeatureImportances:
@@ -200,10 +489,17 @@ class BaselineSklearnModel(Model):
         regressor = model.named_steps["regressor"]
         transformer = model.named_steps["transformer"]
         feature = transformer.get_feature_names_out()
+        # the regressor has no feature importances: sum the split gains of its trees
+        gains = np.zeros(len(feature))
+        for predictors in regressor._predictors:  # noqa: SLF001  # no public tree structure
+            for predictor in predictors:
+                splits = predictor.nodes[~predictor.nodes["is_leaf"].astype(bool)]
+                np.add.at(gains, splits["feature_idx"], splits["gain"])
+        total = gains.sum()
         feature_importances_ = pd.DataFrame(
             data={
                 "feature": feature,
-                "importance": regressor.feature_importances_,
+                "importance": gains / total if total > 0 else gains,
             }
         )
         return schemas.FeatureImportancesSchema.check(data=feature_importances_)
@@ -214,19 +510,17 @@ class BaselineSklearnModel(Model):
         regressor = model.named_steps["regressor"]
         transformer = model.named_steps["transformer"]
         transformed = transformer.transform(X=inputs)
-        explainer = shap.TreeExplainer(model=regressor)
+        # the tree explainer ignores the bitsets of the categorical splits: permute the features instead,
+        # so the SHAP values and the base value add up to the predictions of the regressor
+        masker = shap.maskers.Independent(data=transformed, max_samples=self._background_size)
+        explainer = shap.explainers.Permutation(model=regressor.predict, masker=masker, seed=self.random_state)
+        max_evals = self._permutations * (2 * transformed.shape[1] + 1)
+        explanation = explainer(transformed, max_evals=max_evals, silent=True)
         shap_values_ = pd.DataFrame(
-            data=explainer.shap_values(X=transformed),
+            data=explanation.values,
             columns=transformer.get_feature_names_out(),
         )
         return schemas.SHAPValuesSchema.check(data=shap_values_)
 
-    @T.override
-    def get_internal_model(self) -> pipeline.Pipeline:
-        model = self._pipeline
-        if model is None:
-            raise ValueError("Model is not fitted yet!")
-        return model
-
 
-ModelKind = BaselineSklearnModel
+ModelKind = BaselineSklearnModel | HistGradientBoostingModel
@@ -2,17 +2,46 @@
 
 # %% IMPORTS
 
+import concurrent.futures as CF
+import contextvars
+import functools
+import json
 import typing as T
+import weakref
+import zlib
 
+import numpy as np
 import pandas as pd
+import pandera.errors
 import pandera.pandas as pa
 import pandera.typing.pandas as papd
+import pyarrow
+import pyarrow.compute as pc
+import pydantic as pdt
 
 # %% TYPES
 
 # Generic type for a dataframe container
 TSchema = T.TypeVar("TSchema", bound="pa.DataFrameModel")
 
+# Validation engines: pandera checks, or a compiled numpy plan falling back to pandera
+Engine = T.Literal["pandera", "numpy"]
+
+# Validation modes: check all the rows, a random sample, the first and last rows, the chunks in parallel, or none
+Mode = T.Literal["full", "sample", "head_tail", "chunks", "off"]
+
+# Coverage of the validation modes: none, a subset, or all the rows (i.e., a subset token only skips its own mode)
+COVERAGES: dict[Mode, int] = {"off": 0, "sample": 1, "head_tail": 1, "chunks": 2, "full": 2}
+
+# Validation pools: run the chunks on threads (e.g., numpy engine) or processes (e.g., python checks)
+Pool = T.Literal["thread", "process"]
+
+# Index or column of a dataframe
+Values: T.TypeAlias = pd.Index | pd.Series
+
+# Shape, dtypes, buffers, and hash of the values of a dataframe, to detect its mutations
+Fingerprint: T.TypeAlias = tuple[T.Any, ...]
+
 # %% SCHEMAS
 
 
@@ -35,16 +64,89 @@ class Schema(pa.DataFrameModel):
         strict: bool = True
 
     @classmethod
-    def check(cls: type[TSchema], data: pd.DataFrame) -> papd.DataFrame[TSchema]:
+    def check(
+        cls: type[TSchema], data: pd.DataFrame, engine: Engine | None = None, mode: Mode | None = None
+    ) -> papd.DataFrame[TSchema]:
         """Check the dataframe with this schema.
 
+        The numpy engine validates the dataframe with the plan compiled from this schema,
+        and falls back to pandera if the plan is not supported or the dataframe is invalid:
+        the pass/fail semantics and the errors are the ones of pandera.
+
+        The validated dataframes are marked with a token: checking them again with this schema
+        is a no-op until they are mutated, unless the mode checks more rows (e.g., full after sample).
+        The other settings come from the validation context:
+        the sample and head_tail modes coerce all the rows but only check a subset of them,
+        the chunks mode checks row ranges in parallel, and the off mode returns the dataframe as is.
+
         Args:
             data (pd.DataFrame): dataframe to check.
+            engine (Engine | None): validation engine, or None for the one of the validation context.
+            mode (Mode | None): validation mode, or None for the one of the validation context.
+
+        Raises:
+            pandera.errors.SchemaErrors: failure cases of all the invalid chunks (chunks mode).
 
         Returns:
             papd.DataFrame[TSchema]: validated dataframe.
         """
-        return cls.validate(data)
+        validation = VALIDATION.get()
+        mode = validation.mode if mode is None else mode
+        engine = validation.engine if engine is None else engine
+        if mode == "off" or is_validated(data=data, schema=cls, mode=mode):
+            return T.cast(papd.DataFrame[TSchema], data)
+        rows = validation.rows(mode=mode, length=len(data))
+        if mode == "chunks" and len(data) > validation.chunk_size:
+            validated = validate_chunks(schema=cls, data=data, engine=engine, validation=validation)
+        elif rows is not None:
+            validated = validate_rows(schema=cls, data=data, rows=rows, engine=engine)
+        else:
+            validated = validate(schema=cls, data=data, engine=engine)
+        mark(data=validated, schema=cls, mode=mode if rows is not None else "full")  # subset or all the rows
+        return T.cast(papd.DataFrame[TSchema], validated)
+
+    @classmethod
+    def names(cls) -> list[str]:
+        """Return the index and column names of this schema.
+
+        Returns:
+            list[str]: field names in the order of declaration.
+        """
+        return list(cls.__fields__)
+
+    @classmethod
+    def arrow_schema(cls) -> pyarrow.Schema:
+        """Return the arrow schema of the index and columns of this schema.
+
+        Returns:
+            pyarrow.Schema: arrow field of each typed name, in the order of declaration.
+        """
+        frame = cls.to_schema()
+        dtypes = {name: column.dtype for name, column in frame.columns.items()}
+        for name in cls.names():  # the index field is unnamed in the frame schema
+            if name not in dtypes and frame.index is not None:
+                dtypes[name] = frame.index.dtype
+        fields = [(name, dtypes[name]) for name in cls.names() if dtypes.get(name) is not None]
+        return pyarrow.schema([(name, pyarrow.from_numpy_dtype(str(dtype))) for name, dtype in fields])
+
+    @classmethod
+    def check_arrow(cls, table: pyarrow.Table) -> pyarrow.Table:
+        """Check an arrow table with this schema, before its conversion to pandas.
+
+        The table is cast and checked with arrow compute kernels: the failures are reported
+        by pandera on the failing rows only, with the errors of the pandas check.
+        The index field is read from the pandas metadata, or from the column of the same name.
+
+        Args:
+            table (pyarrow.Table): arrow table to check.
+
+        Raises:
+            pandera.errors.SchemaError: first failure of the table, as reported by pandera.
+
+        Returns:
+            pyarrow.Table: validated table, with the arrow types of this schema.
+        """
+        return validate_arrow(schema=cls, table=table)
 
 
 class InputsSchema(Schema):
@@ -117,3 +219,682 @@ class FeatureImportancesSchema(Schema):
 
 
 FeatureImportances = papd.DataFrame[FeatureImportancesSchema]
+
+
+# %% VALIDATORS
+
+
+class FieldPlan:
+    """Vectorized checks of an index or column compiled from a pandera component.
+
+    The range checks (ge, gt, le, lt, in_range, eq, isin on a contiguous integer range)
+    are fused into a single min/max reduction, and the other membership checks use numpy.
+
+    Parameters:
+        dtype (np.dtype): numpy dtype of the values after coercion.
+        coerce (bool): coerce the values to the dtype with pandera.
+        nullable (bool): allow missing values (ignored by the checks).
+        pandera_dtype (T.Any): pandera data type used to coerce the values.
+    """
+
+    def __init__(self, dtype: np.dtype, coerce: bool, nullable: bool, pandera_dtype: T.Any) -> None:
+        """Initialize a plan without checks.
+
+        Args:
+            dtype (np.dtype): numpy dtype of the values after coercion.
+            coerce (bool): coerce the values to the dtype with pandera.
+            nullable (bool): allow missing values (ignored by the checks).
+            pandera_dtype (T.Any): pandera data type used to coerce the values.
+        """
+        self.dtype = dtype
+        self.coerce = coerce
+        self.nullable = nullable
+        self.pandera_dtype = pandera_dtype
+        self.low: T.Any = None
+        self.low_inclusive = True
+        self.high: T.Any = None
+        self.high_inclusive = True
+        self.allowed: np.ndarray | None = None
+        self.forbidden: np.ndarray | None = None
+
+    def add(self, check: pa.Check) -> bool:
+        """Compile a pandera check into the plan.
+
+        Args:
+            check (pa.Check): built-in pandera check.
+
+        Returns:
+            bool: True if the check is supported by the plan.
+        """
+        if check.raise_warning or check.groupby is not None or not check.ignore_na:
+            return False
+        stats = check.statistics
+        match check.name:
+            case "greater_than_or_equal_to":
+                self._bound(low=stats["min_value"], inclusive=True)
+            case "greater_than":
+                self._bound(low=stats["min_value"], inclusive=False)
+            case "less_than_or_equal_to":
+                self._bound(high=stats["max_value"], inclusive=True)
+            case "less_than":
+                self._bound(high=stats["max_value"], inclusive=False)
+            case "in_range":
+                self._bound(low=stats["min_value"], inclusive=stats["include_min"])
+                self._bound(high=stats["max_value"], inclusive=stats["include_max"])
+            case "equal_to":
+                self._bound(low=stats["value"], inclusive=True)
+                self._bound(high=stats["value"], inclusive=True)
+            case "isin":
+                values = np.unique(np.asarray(list(stats["allowed_values"])))
+                contiguous = values.dtype.kind in "iu" and values.size and values[-1] - values[0] + 1 == values.size
+                if self.dtype.kind in "iu" and contiguous:  # e.g., isin=[1, 2, 3, 4] -> 1 <= x <= 4
+                    self._bound(low=values[0].item(), inclusive=True)
+                    self._bound(high=values[-1].item(), inclusive=True)
+                else:
+                    self.allowed = values if self.allowed is None else np.intersect1d(self.allowed, values)
+            case "notin":
+                self.forbidden = np.asarray(list(stats["forbidden_values"]))
+            case "not_equal_to":
+                self.forbidden = np.asarray([stats["value"]])
+            case _:
+                return False
+        return True
+
+    def validate(self, values: Values) -> Values | None:
+        """Coerce and check the values of an index or column.
+
+        Args:
+            values (Values): index or column to validate.
+
+        Returns:
+            Values | None: coerced values, or None if they are invalid or not supported.
+        """
+        if values.dtype != self.dtype:
+            if not self.coerce:
+                return None
+            try:
+                values = self.pandera_dtype.try_coerce(values)
+            except pandera.errors.ParserError, TypeError, ValueError:
+                return None
+            if values.dtype != self.dtype:
+                return None
+        array = values.to_numpy()
+        if self.dtype.kind in "fM":  # only floats and datetimes hold missing values
+            missing = np.isnan(array) if self.dtype.kind == "f" else np.isnat(array)
+            if missing.any():
+                if not self.nullable:
+                    return None
+                array = array[~missing]
+        if array.size == 0:
+            return values
+        if self.low is not None or self.high is not None:
+            low, high = array.min(), array.max()  # fused range checks
+            if self.low is not None and not (low >= self.low if self.low_inclusive else low > self.low):
+                return None
+            if self.high is not None and not (high <= self.high if self.high_inclusive else high < self.high):
+                return None
+        if self.allowed is not None and not np.isin(array, self.allowed).all():
+            return None
+        if self.forbidden is not None and np.isin(array, self.forbidden).any():
+            return None
+        return values
+
+    def _bound(self, low: T.Any = None, high: T.Any = None, inclusive: bool = True) -> None:
+        """Tighten the range of the values with a lower or upper bound.
+
+        Args:
+            low (T.Any): lower bound of the values.
+            high (T.Any): upper bound of the values.
+            inclusive (bool): include the bound in the range.
+        """
+        if self.dtype.kind == "M":  # compare datetimes as numpy values
+            low = None if low is None else pd.Timestamp(low).to_datetime64()
+            high = None if high is None else pd.Timestamp(high).to_datetime64()
+        if low is not None and (self.low is None or low > self.low or (low == self.low and not inclusive)):
+            self.low, self.low_inclusive = low, inclusive
+        if high is not None and (self.high is None or high < self.high or (high == self.high and not inclusive)):
+            self.high, self.high_inclusive = high, inclusive
+
+
+class SchemaPlan:
+    """Vectorized validation of a dataframe compiled from a pandera schema.
+
+    The plan only certifies valid dataframes: it returns None for anything else,
+    so the caller falls back to pandera to report the failures.
+
+    Parameters:
+        columns (dict[str, FieldPlan]): plans of the columns.
+        index (FieldPlan | None): plan of the index, or None if the schema has no index.
+        index_name (str | None): name required for the index, or None for any name.
+    """
+
+    def __init__(self, columns: dict[str, FieldPlan], index: FieldPlan | None, index_name: str | None) -> None:
+        """Initialize the plan from the plans of its fields.
+
+        Args:
+            columns (dict[str, FieldPlan]): plans of the columns.
+            index (FieldPlan | None): plan of the index, or None if the schema has no index.
+            index_name (str | None): name required for the index, or None for any name.
+        """
+        self.columns = columns
+        self.index = index
+        self.index_name = index_name
+        self.names = set(columns)
+
+    def validate(self, data: pd.DataFrame) -> pd.DataFrame | None:
+        """Coerce and check a dataframe with the plan.
+
+        Args:
+            data (pd.DataFrame): dataframe to validate.
+
+        Returns:
+            pd.DataFrame | None: validated copy of the dataframe, or None if it is invalid or not supported.
+        """
+        if not isinstance(data, pd.DataFrame) or data.columns.has_duplicates or set(data.columns) != self.names:
+            return None
+        if isinstance(data.index, pd.MultiIndex):
+            return None
+        index = data.index
+        if self.index is not None:
+            if self.index_name is not None and index.name != self.index_name:
+                return None
+            index = self.index.validate(values=index)
+            if index is None:
+                return None
+        arrays = {}
+        for name in data.columns:
+            column = data[name]
+            values = self.columns[name].validate(values=column)
+            if values is None:
+                return None
+            # like pandera, return a copy: the coerced columns are already new arrays
+            arrays[name] = column.to_numpy(copy=True) if values is column else values.to_numpy()
+        result = pd.DataFrame(arrays, index=index.copy() if index is data.index else index, copy=False)
+        result.columns.name = data.columns.name
+        result.attrs = data.attrs.copy()
+        return result
+
+
+def compile_field(component: T.Any, coerce: bool) -> FieldPlan | None:
+    """Compile the checks of a pandera index or column.
+
+    Args:
+        component (T.Any): pandera index or column.
+        coerce (bool): coerce the values as set in the schema config.
+
+    Returns:
+        FieldPlan | None: plan of the field, or None if it is not supported.
+    """
+    if getattr(component, "regex", False) or getattr(component, "unique", False) or component.dtype is None:
+        return None
+    dtype = component.dtype.type
+    if not isinstance(dtype, np.dtype) or dtype.kind not in "biufM" or getattr(dtype, "tz", None) is not None:
+        return None  # e.g., strings or categories are checked element-wise by pandera
+    plan = FieldPlan(
+        dtype=dtype, coerce=coerce or component.coerce, nullable=component.nullable, pandera_dtype=component.dtype
+    )
+    if not all(plan.add(check=check) for check in component.checks):
+        return None
+    return plan
+
+
+@functools.cache
+def compile_schema(schema: type[Schema]) -> SchemaPlan | None:
+    """Compile a schema into a vectorized validation plan (once per schema).
+
+    Args:
+        schema (type[Schema]): schema to compile.
+
+    Returns:
+        SchemaPlan | None: plan of the schema, or None if it is not supported (e.g., regex, unique, strings).
+    """
+    frame = schema.to_schema()
+    if (
+        frame.strict is not True
+        or frame.ordered
+        or frame.checks
+        or frame.dtype is not None
+        or frame.unique
+        or frame.add_missing_columns
+        or frame.drop_invalid_rows
+        or isinstance(frame.index, pa.MultiIndex)
+    ):
+        return None
+    columns = {}
+    for name, column in frame.columns.items():
+        if not column.required:
+            return None
+        plan = compile_field(component=column, coerce=frame.coerce)
+        if plan is None:
+            return None
+        columns[name] = plan
+    index = None
+    if frame.index is not None:
+        index = compile_field(component=frame.index, coerce=frame.coerce)
+        if index is None:
+            return None
+    return SchemaPlan(columns=columns, index=index, index_name=None if frame.index is None else frame.index.name)
+
+
+def validate(schema: type[pa.DataFrameModel], data: pd.DataFrame, engine: Engine) -> pd.DataFrame:
+    """Validate all the rows of a dataframe with a schema.
+
+    Args:
+        schema (type[pa.DataFrameModel]): schema of the dataframe.
+        data (pd.DataFrame): dataframe to validate.
+        engine (Engine): validation engine of the dataframe.
+
+    Returns:
+        pd.DataFrame: validated dataframe.
+    """
+    if engine == "numpy" and (plan := compile_schema(schema=schema)) is not None:
+        validated = plan.validate(data=data)
+        if validated is not None:
+            return validated
+    return schema.validate(data)
+
+
+def validate_rows(
+    schema: type[pa.DataFrameModel], data: pd.DataFrame, rows: np.ndarray, engine: Engine
+) -> pd.DataFrame:
+    """Validate a subset of the rows of a dataframe, and coerce all of them.
+
+    Args:
+        schema (type[pa.DataFrameModel]): schema of the dataframe.
+        data (pd.DataFrame): dataframe to validate.
+        rows (np.ndarray): sorted positions of the rows to validate.
+        engine (Engine): validation engine of the dataframe.
+
+    Returns:
+        pd.DataFrame: dataframe coerced to the dtypes of the schema.
+    """
+    validate(schema=schema, data=data.iloc[rows], engine=engine)
+    try:
+        return schema.to_schema().coerce_dtype(data.copy())
+    except pandera.errors.SchemaError, pandera.errors.SchemaErrors:  # rows outside the subset: report them
+        return validate(schema=schema, data=data, engine=engine)
+
+
+def validate_chunk(schema: type[pa.DataFrameModel], data: pd.DataFrame, engine: Engine) -> pd.DataFrame | None:
+    """Validate a chunk of a dataframe in a worker.
+
+    Pandera errors don't keep their state when pickled: the failures are reported by the caller.
+
+    Args:
+        schema (type[pa.DataFrameModel]): schema of the dataframe.
+        data (pd.DataFrame): chunk to validate.
+        engine (Engine): validation engine of the chunk.
+
+    Returns:
+        pd.DataFrame | None: validated chunk, or None if the chunk is invalid.
+    """
+    try:
+        return validate(schema=schema, data=data, engine=engine)
+    except pandera.errors.SchemaError, pandera.errors.SchemaErrors:
+        return None
+
+
+def validate_chunks(
+    schema: type[pa.DataFrameModel], data: pd.DataFrame, engine: Engine, validation: Validation
+) -> pd.DataFrame:
+    """Validate the chunks of a dataframe in parallel, and merge the failure cases of the invalid chunks.
+
+    Args:
+        schema (type[pa.DataFrameModel]): schema of the dataframe.
+        data (pd.DataFrame): dataframe to validate.
+        engine (Engine): validation engine of the chunks.
+        validation (Validation): chunk size, pool, and workers of the validation.
+
+    Raises:
+        pandera.errors.SchemaErrors: failure cases of all the invalid chunks.
+
+    Returns:
+        pd.DataFrame: validated dataframe.
+    """
+    starts = range(0, len(data), validation.chunk_size)
+    chunks = [data.iloc[start : start + validation.chunk_size] for start in starts]
+    pool = CF.ProcessPoolExecutor if validation.pool == "process" else CF.ThreadPoolExecutor
+    with pool(max_workers=validation.max_workers) as executor:
+        validated = list(executor.map(validate_chunk, [schema] * len(chunks), chunks, [engine] * len(chunks)))
+    errors: list[pandera.errors.SchemaError] = []
+    for chunk, result in zip(chunks, validated, strict=True):
+        if result is None:  # collect all the failure cases of the chunk
+            try:
+                schema.validate(chunk, lazy=True)
+            except pandera.errors.SchemaErrors as error:
+                errors.extend(error.schema_errors)
+            except pandera.errors.SchemaError as error:
+                errors.append(error)
+    if errors:
+        raise pandera.errors.SchemaErrors(schema=schema.to_schema(), schema_errors=errors, data=data)
+    return pd.concat(T.cast(list[pd.DataFrame], validated), copy=False)
+
+
+# %% ARROW
+
+
+class ArrowField:
+    """Compute-kernel checks of an arrow field compiled from a field plan.
+
+    Parameters:
+        dtype (pyarrow.DataType): arrow type of the values after the cast.
+        numpy_dtype (np.dtype): numpy dtype of the values after the conversion to pandas.
+        coerce (bool): cast the values to the type.
+        missing (bool): report the missing values (null, or NaN for floats) as failures.
+    """
+
+    def __init__(self, plan: FieldPlan, dtype: pyarrow.DataType) -> None:
+        """Compile the bounds and value sets of a field plan to arrow scalars and arrays.
+
+        Args:
+            plan (FieldPlan): vectorized checks of the field.
+            dtype (pyarrow.DataType): arrow type of the values after the cast.
+        """
+        self.dtype = dtype
+        self.numpy_dtype = plan.dtype
+        self.coerce = plan.coerce
+        self.missing = not plan.nullable or plan.dtype.kind not in "fM"  # e.g., no null integers in numpy
+        # no float16 kernels: compare their values as float32 (exact)
+        self.compare = pyarrow.float32() if pyarrow.types.is_float16(dtype) else dtype
+        self.low = None if plan.low is None else pyarrow.scalar(plan.low, type=self.compare)
+        self.low_inclusive = plan.low_inclusive
+        self.high = None if plan.high is None else pyarrow.scalar(plan.high, type=self.compare)
+        self.high_inclusive = plan.high_inclusive
+        self.allowed = None if plan.allowed is None else pyarrow.array(plan.allowed, type=self.compare)
+        self.forbidden = None if plan.forbidden is None else pyarrow.array(plan.forbidden, type=self.compare)
+
+    def failures(self, values: pyarrow.ChunkedArray) -> pyarrow.ChunkedArray:
+        """Compute the failing values of a field.
+
+        Args:
+            values (pyarrow.ChunkedArray): values of the field, cast to its type.
+
+        Returns:
+            pyarrow.ChunkedArray: True for the failing values (null if undecided).
+        """
+        values = values.cast(self.compare) if values.type != self.compare else values
+        missing = pc.is_null(values, nan_is_null=True)
+        checks = []
+        if self.low is not None:
+            checks.append(pc.less(values, self.low) if self.low_inclusive else pc.less_equal(values, self.low))
+        if self.high is not None:
+            checks.append(pc.greater(values, self.high) if self.high_inclusive else pc.greater_equal(values, self.high))
+        if self.allowed is not None:
+            checks.append(pc.invert(pc.is_in(values, value_set=self.allowed)))
+        if self.forbidden is not None:
+            checks.append(pc.is_in(values, value_set=self.forbidden))
+        # like pandera, the checks ignore the missing values (kleene logic: null comparisons are undecided)
+        failures = [pc.and_not_kleene(functools.reduce(pc.or_kleene, checks), missing)] if checks else []
+        if self.missing:
+            failures.append(missing)
+        return functools.reduce(pc.or_kleene, failures) if failures else pc.and_not(missing, missing)
+
+
+class ArrowPlan:
+    """Compute-kernel validation of an arrow table compiled from a schema plan.
+
+    Like the schema plan, it only certifies valid tables: the caller reports the failures with pandera.
+
+    Parameters:
+        fields (dict[str, ArrowField]): checks of the columns and of the index field.
+        index_name (str): name of the index field.
+    """
+
+    def __init__(self, fields: dict[str, ArrowField], index_name: str) -> None:
+        """Initialize the plan from the checks of its fields.
+
+        Args:
+            fields (dict[str, ArrowField]): checks of the columns and of the index field.
+            index_name (str): name of the index field.
+        """
+        self.fields = fields
+        self.index_name = index_name
+
+    def cast(self, table: pyarrow.Table) -> pyarrow.Table | None:
+        """Cast an arrow table to the types of the plan.
+
+        Args:
+            table (pyarrow.Table): arrow table to cast.
+
+        Returns:
+            pyarrow.Table | None: cast table, or None if its fields differ or can't be cast safely.
+        """
+        names = table.column_names
+        if len(names) != len(set(names)) or set(names) != set(self.fields):
+            return None
+        metadata = table.schema.metadata
+        pandas = table.schema.pandas_metadata
+        if pandas is not None:
+            if pandas.get("index_columns") not in ([], [self.index_name]):
+                return None  # e.g., the index field is a column of the dataframe
+            for column in pandas["columns"]:  # convert the fields to numpy dtypes, not the ones of the source
+                if column["field_name"] in self.fields:
+                    column["numpy_type"] = str(self.fields[column["field_name"]].numpy_dtype)
+            metadata = {**metadata, b"pandas": json.dumps(pandas).encode()}
+        fields = []
+        for field in table.schema:
+            plan = self.fields[field.name]
+            if field.type != plan.dtype and not plan.coerce:
+                return None
+            fields.append(field.with_type(plan.dtype))
+        schema = pyarrow.schema(fields, metadata=metadata)
+        if schema.equals(table.schema):
+            return table.replace_schema_metadata(metadata)
+        try:
+            return table.cast(schema, safe=True)
+        except pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError:
+            return None
+
+    def failures(self, table: pyarrow.Table) -> pyarrow.ChunkedArray | None:
+        """Compute the failing rows of an arrow table.
+
+        Args:
+            table (pyarrow.Table): arrow table cast by the plan.
+
+        Returns:
+            pyarrow.ChunkedArray | None: True for the failing rows, or None if all the rows are valid.
+        """
+        columns = (plan.failures(table.column(name)) for name, plan in self.fields.items())
+        failures = functools.reduce(pc.or_kleene, columns)
+        failures = pc.fill_null(failures, False)
+        return failures if pc.any(failures).as_py() else None
+
+
+@functools.cache
+def compile_arrow(schema: type[Schema]) -> ArrowPlan | None:
+    """Compile a schema into an arrow validation plan (once per schema).
+
+    Args:
+        schema (type[Schema]): schema to compile.
+
+    Returns:
+        ArrowPlan | None: plan of the schema, or None if it is not supported (e.g., no index, strings).
+    """
+    plan = compile_schema(schema=schema)
+    if plan is None or plan.index is None:
+        return None
+    types = {field.name: field.type for field in schema.arrow_schema()}
+    index_name = next(name for name in schema.names() if name not in plan.columns)
+    try:
+        fields = {name: ArrowField(plan=field, dtype=types[name]) for name, field in plan.columns.items()}
+        fields[index_name] = ArrowField(plan=plan.index, dtype=types[index_name])
+    except pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError, OverflowError, TypeError, ValueError:
+        return None  # e.g., bounds out of the range of the type
+    return ArrowPlan(fields=fields, index_name=index_name)
+
+
+def arrow_frame(schema: type[pa.DataFrameModel], table: pyarrow.Table) -> pd.DataFrame:
+    """Convert an arrow table to a dataframe indexed by the index field of a schema.
+
+    Args:
+        schema (type[pa.DataFrameModel]): schema of the dataframe.
+        table (pyarrow.Table): arrow table to convert.
+
+    Returns:
+        pd.DataFrame: dataframe representation, as checked by pandera.
+    """
+    data = table.to_pandas()
+    columns = schema.to_schema().columns
+    index = [name for name in schema.names() if name not in columns and name in data.columns]
+    return data.set_index(index[0]) if index else data
+
+
+def validate_arrow(schema: type[Schema], table: pyarrow.Table) -> pyarrow.Table:
+    """Validate an arrow table with a schema, before its conversion to pandas.
+
+    Args:
+        schema (type[Schema]): schema of the table.
+        table (pyarrow.Table): arrow table to validate.
+
+    Raises:
+        pandera.errors.SchemaError: first failure of the table, as reported by pandera.
+
+    Returns:
+        pyarrow.Table: validated table, with the arrow types of the schema.
+    """
+    plan = compile_arrow(schema=schema)
+    if plan is not None and (validated := plan.cast(table=table)) is not None:
+        failures = plan.failures(table=validated)
+        if failures is None:
+            return validated
+        # pandera reports the same errors on the failing rows as on the whole table
+        schema.validate(arrow_frame(schema=schema, table=table.filter(failures)))
+    # not supported, not castable, or false alarm: check the whole table with pandera
+    data = schema.validate(arrow_frame(schema=schema, table=table))
+    return pyarrow.Table.from_pandas(data)
+
+
+# %% SETTINGS
+
+
+class Validation(pdt.BaseModel, strict=True, frozen=True, extra="forbid"):
+    """Settings of the dataframe validation.
+
+    Parameters:
+        mode (Mode): check all the rows, a subset of them, their chunks in parallel, or none of them.
+        engine (Engine): validation engine of the dataframes.
+        fraction (float): fraction of the rows checked by the sample mode.
+        seed (int): random seed of the rows checked by the sample mode.
+        head_tail (int): number of rows checked at each end of the dataframes by the head_tail mode.
+        min_rows (int): dataframes up to this number of rows are fully checked by the subset modes.
+        chunk_size (int): number of rows checked by each task of the chunks mode.
+        pool (Pool): run the tasks of the chunks mode on threads or processes.
+        max_workers (int | None): maximum number of workers of the chunks mode, or None for the default.
+    """
+
+    mode: Mode = "full"
+    engine: Engine = "pandera"
+    fraction: float = pdt.Field(default=0.01, gt=0, le=1)
+    seed: int = 0
+    head_tail: int = pdt.Field(default=5_000, ge=1)
+    min_rows: int = pdt.Field(default=10_000, ge=0)
+    chunk_size: int = pdt.Field(default=1_000_000, ge=1)
+    pool: Pool = "thread"
+    max_workers: int | None = pdt.Field(default=None, ge=1)
+
+    def rows(self, mode: Mode, length: int) -> np.ndarray | None:
+        """Select the rows checked by a validation mode.
+
+        Args:
+            mode (Mode): validation mode of the dataframe.
+            length (int): number of rows of the dataframe.
+
+        Returns:
+            np.ndarray | None: sorted positions of the rows to check, or None to check all of them.
+        """
+        if length <= self.min_rows:
+            return None
+        if mode == "sample":
+            size = max(round(length * self.fraction), 1)
+            rows = np.random.default_rng(seed=self.seed).choice(length, size=size, replace=False, shuffle=False)
+            return np.sort(rows)  # sorted: cheaper to take and to check
+        if mode == "head_tail" and 2 * self.head_tail < length:
+            head = np.arange(self.head_tail)
+            return np.concatenate([head, head + (length - self.head_tail)])
+        return None
+
+
+# Validation settings of the current context (e.g., set by the running job), frozen: safe to share
+VALIDATION: contextvars.ContextVar[Validation] = contextvars.ContextVar("validation", default=Validation())  # noqa: B039
+
+# %% TOKENS
+
+# Schema, validation mode, and fingerprint of the validated dataframes, by object id (removed when collected)
+TOKENS: dict[int, tuple[type[pa.DataFrameModel], Mode, Fingerprint]] = {}
+
+
+def checksum(series: pd.Series) -> int:
+    """Compute the checksum of the values of a column, without copying its buffers.
+
+    Args:
+        series (pd.Series): column to checksum.
+
+    Returns:
+        int: CRC32 of the column buffers.
+    """
+    if isinstance(series.dtype, pd.ArrowDtype):  # arrow buffers (edits replace the chunks)
+        arrow = pyarrow.array(series.array)  # zero-copy: the arrow data of the column
+        chunks = arrow.chunks if isinstance(arrow, pyarrow.ChunkedArray) else [arrow]
+        buffers = [buffer for chunk in chunks for buffer in chunk.buffers() if buffer is not None]
+    else:  # view of the numpy block, or conversion of the extension array (e.g., nullable)
+        values = series.to_numpy()
+        values = pd.util.hash_array(values) if values.dtype.kind == "O" else values  # objects: content, not pointers
+        buffers = [np.ascontiguousarray(values).view(np.uint8)]
+    crc = 0
+    for buffer in buffers:
+        crc = zlib.crc32(buffer, crc)  # memory bound, and releases the GIL on large buffers
+    return crc
+
+
+def fingerprint(data: pd.DataFrame) -> Fingerprint:
+    """Compute the fingerprint of a dataframe to detect its mutations.
+
+    The fingerprint covers the shape, the columns and dtypes, the identity of the index,
+    and a CRC32 of the column buffers: replacing a column or editing a value in place changes it.
+    CRC32 runs at memory speed, a small fraction of the cost of checking the values again.
+
+    Args:
+        data (pd.DataFrame): dataframe to fingerprint.
+
+    Returns:
+        Fingerprint: fingerprint of the dataframe.
+    """
+    checksums = tuple(checksum(data[column]) for column in data.columns)
+    dtypes = (str(data.index.dtype), *map(str, data.dtypes))
+    return data.shape, tuple(data.columns), tuple(data.index.names), dtypes, id(data.index), checksums
+
+
+def mark(data: pd.DataFrame, schema: type[pa.DataFrameModel], mode: Mode = "full") -> None:
+    """Mark a dataframe as validated by a schema.
+
+    Args:
+        data (pd.DataFrame): validated dataframe.
+        schema (type[pa.DataFrameModel]): schema of the dataframe.
+        mode (Mode): validation mode of the rows checked (e.g., full for all of them).
+    """
+    key = id(data)
+    if key not in TOKENS:  # forget the dataframe once collected, before its id is reused
+        weakref.finalize(data, TOKENS.pop, key, None)
+    TOKENS[key] = (schema, mode, fingerprint(data=data))
+
+
+def is_validated(data: pd.DataFrame, schema: type[pa.DataFrameModel], mode: Mode = "full") -> bool:
+    """Check if a dataframe was validated by a schema, in the same mode or on all the rows, and not mutated since.
+
+    Args:
+        data (pd.DataFrame): dataframe to check.
+        schema (type[pa.DataFrameModel]): schema of the dataframe.
+        mode (Mode): validation mode required (e.g., full to skip the full checks).
+
+    Returns:
+        bool: True if the dataframe is still valid for the schema and mode.
+    """
+    if not isinstance(data, pd.DataFrame):
+        return False
+    token = TOKENS.get(id(data))
+    if token is None or token[0] is not schema:
+        return False
+    # the subsets check different rows (e.g., sample vs head_tail), so they only skip their own mode
+    if token[1] != mode and COVERAGES[token[1]] < COVERAGES["full"] and COVERAGES[mode] > COVERAGES["off"]:
+        return False
+    return token[2] == fingerprint(data=data)
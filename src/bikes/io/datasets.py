@@ -3,42 +3,1589 @@
 # %% IMPORTS
 
 import abc
+import collections
+import concurrent.futures as CF
+import contextlib
+import contextvars
+import functools
+import glob
+import hashlib
+import importlib
+import io
+import pathlib
+import threading
 import typing as T
+import urllib.request
+import uuid
 
 import mlflow.data.pandas_dataset as lineage
+import mlflow.types
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
 import pydantic as pdt
 
+from bikes.core import schemas
+
 # %% TYPINGS
 
-Lineage: T.TypeAlias = lineage.PandasDataset
+Lineage: T.TypeAlias = lineage.PandasDataset
+
+# Dtype backends for converting arrow data to pandas
+Backend = T.Literal["pyarrow", "numpy_nullable"]
+
+# Columns to read: explicit names, the schema names, or all (None)
+Columns = list[str] | T.Literal["schema"] | None
+
+# Read method of a reader, decorated by the caches
+ReadMethod = T.Callable[..., pd.DataFrame]
+
+# Lineage modes: hash the full dataframe, the metadata of its sources, or a sample of its rows
+LineageMode = T.Literal["full", "metadata", "sample"]
+
+# DB-API connection of a database driver (e.g., sqlite3.Connection)
+Connection: T.TypeAlias = T.Any
+
+# Bound parameters of a query: positional, or a mapping for the named paramstyle
+Parameters = tuple[T.Any, ...] | dict[str, T.Any]
+
+# Maximum number of rows used to digest the dataframes and infer their lineage schema
+LINEAGE_SAMPLE_SIZE = 10_000
+
+# %% HELPERS
+
+# Arrow types to pandas nullable dtypes (mirrors pandas `dtype_backend="numpy_nullable"`)
+NULLABLE_DTYPES: dict[pa.DataType, pd.api.extensions.ExtensionDtype] = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.uint8(): pd.UInt8Dtype(),
+    pa.uint16(): pd.UInt16Dtype(),
+    pa.uint32(): pd.UInt32Dtype(),
+    pa.uint64(): pd.UInt64Dtype(),
+    pa.bool_(): pd.BooleanDtype(),
+    pa.string(): pd.StringDtype(),
+    pa.large_string(): pd.StringDtype(),
+    pa.float32(): pd.Float32Dtype(),
+    pa.float64(): pd.Float64Dtype(),
+}
+
+
+def arrow_types(schema: type[schemas.Schema]) -> dict[str, pa.DataType]:
+    """Return the arrow types of the index and columns of a schema.
+
+    Args:
+        schema (type[schemas.Schema]): schema of the dataframe.
+
+    Returns:
+        dict[str, pa.DataType]: arrow type of each field name.
+    """
+    return {field.name: field.type for field in schema.arrow_schema()}
+
+
+def cast(table: pa.Table, types: dict[str, pa.DataType]) -> pa.Table:
+    """Cast the fields of an arrow table to the given types.
+
+    The table is returned unchanged if a field cannot be cast, to let the schema check report it.
+
+    Args:
+        table (pa.Table): arrow table to cast.
+        types (dict[str, pa.DataType]): arrow type of each field name.
+
+    Returns:
+        pa.Table: arrow table with the given types.
+    """
+    fields = [field.with_type(types.get(field.name, field.type)) for field in table.schema]
+    schema = pa.schema(fields, metadata=table.schema.metadata)
+    if schema.equals(table.schema):
+        return table
+    try:
+        return table.cast(schema)
+    except pa.ArrowInvalid, pa.ArrowNotImplementedError:
+        return table
+
+
+def to_pandas(
+    table: pa.Table,
+    backend: Backend,
+    schema: type[schemas.Schema] | None = None,
+    check: type[schemas.Schema] | None = None,
+    index: str | None = None,
+) -> pd.DataFrame:
+    """Convert an arrow table to a pandas dataframe.
+
+    With a schema, the fields are cast to the schema types in arrow memory and converted
+    to numpy dtypes, so the schema check finds them typed and does not coerce them.
+    With a check schema, the table is validated in arrow memory (invalid tables fail before
+    their conversion) and the dataframe is marked as validated, so its schema check is a no-op.
+
+    Args:
+        table (pa.Table): arrow table to convert.
+        backend (Backend): dtype backend of the dataframe.
+        schema (type[schemas.Schema] | None): schema to cast the fields to.
+        check (type[schemas.Schema] | None): schema to validate the table with.
+        index (str | None): column to set as the index of the dataframe (e.g., without pandas metadata).
+
+    Returns:
+        pd.DataFrame: dataframe representation.
+    """
+    if check is not None:
+        data = check.check_arrow(table).to_pandas(split_blocks=True)
+    elif schema is not None:
+        data = cast(table, types=arrow_types(schema=schema)).to_pandas(split_blocks=True)
+    else:
+        types_mapper = pd.ArrowDtype if backend == "pyarrow" else NULLABLE_DTYPES.get
+        data = table.to_pandas(types_mapper=types_mapper)
+    if index is not None and index in data.columns:
+        data = data.set_index(index)
+    if check is not None:
+        schemas.mark(data=data, schema=check)
+    return data
+
+
+def index_columns(schema: pa.Schema) -> list[str]:
+    """Return the columns storing the pandas index of an arrow schema.
+
+    Args:
+        schema (pa.Schema): arrow schema with pandas metadata.
+
+    Returns:
+        list[str]: names of the index columns (range indexes are not stored).
+    """
+    metadata = schema.pandas_metadata or {}
+    return [column for column in metadata.get("index_columns", []) if isinstance(column, str)]
+
+
+def parquet_footer(path: str) -> bytes:
+    """Read the footer of a parquet file (i.e., its schema, row groups, and statistics).
+
+    Args:
+        path (str): local path of the file.
+
+    Returns:
+        bytes: serialized footer, or empty bytes if the file is not a parquet file.
+    """
+    with pathlib.Path(path).open("rb") as file:
+        size = file.seek(0, 2)
+        if size < 12:  # magic bytes at both ends and footer length
+            return b""
+        file.seek(size - 8)
+        tail = file.read(8)
+        if tail[4:] != b"PAR1":
+            return b""
+        length = int.from_bytes(tail[:4], "little")
+        file.seek(size - 8 - length)
+        return file.read(length)
+
+
+@contextlib.contextmanager
+def replacing(path: str) -> T.Iterator[str]:
+    """Write a file to a temporary path, swapped in for the file once complete.
+
+    The temporary path is unique for each writer, and in the folder of the file (i.e., same filesystem):
+    the readers never see a partial file, and concurrent writers don't interleave their bytes.
+    The temporary file is removed on errors, and the file is left untouched if nothing was written.
+    Remote paths (e.g., s3://) are written in place: the object stores publish them once complete.
+
+    Args:
+        path (str): local or remote path of the file.
+
+    Yields:
+        str: path to write the file to.
+    """
+    if "://" in path:
+        yield path
+        return
+    file = pathlib.Path(path)
+    temp = file.with_name(f".{file.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        yield str(temp)
+        if temp.exists():
+            temp.replace(file)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+
+def quote(identifier: str) -> str:
+    """Quote an SQL identifier (e.g., table or column name) with the ANSI double quotes.
+
+    Args:
+        identifier (str): name of the table or column.
+
+    Returns:
+        str: quoted identifier.
+    """
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def placeholders(driver: str, count: int, offset: int = 0) -> list[str]:
+    """Return the markers of positional query parameters in the paramstyle of a DB-API driver.
+
+    The named paramstyle has no positional markers: the parameters are named by position (e.g., :p1).
+
+    Args:
+        driver (str): module name of the DB-API driver (e.g., sqlite3, psycopg).
+        count (int): number of parameters.
+        offset (int): number of parameters before these ones in the query.
+
+    Raises:
+        ValueError: if the paramstyle of the driver is unknown.
+
+    Returns:
+        list[str]: marker of each parameter.
+    """
+    paramstyle = importlib.import_module(driver).paramstyle
+    positions = range(offset + 1, offset + count + 1)
+    if paramstyle == "qmark":
+        return ["?"] * count
+    if paramstyle in ("format", "pyformat"):
+        return ["%s"] * count
+    if paramstyle == "numeric":
+        return [f":{position}" for position in positions]
+    if paramstyle == "named":
+        return [f":p{position}" for position in positions]
+    raise ValueError(f"Driver '{driver}' has an unknown paramstyle: {paramstyle}")
+
+
+def bind(driver: str, rows: T.Iterable[tuple[T.Any, ...]]) -> list[Parameters]:
+    """Bind rows of positional query parameters in the paramstyle of a DB-API driver.
+
+    The named paramstyle takes a mapping per row, keyed by the names of the placeholders
+    (e.g., {"p1": ...} for :p1). The other paramstyles take the rows as they are.
+
+    Args:
+        driver (str): module name of the DB-API driver (e.g., sqlite3, psycopg).
+        rows (T.Iterable[tuple[T.Any, ...]]): values of the parameters of each row.
+
+    Returns:
+        list[Parameters]: bound parameters of each row.
+    """
+    if importlib.import_module(driver).paramstyle != "named":
+        return T.cast(list[Parameters], list(rows))
+    return [{f"p{position}": value for position, value in enumerate(row, start=1)} for row in rows]
+
+
+def request(
+    url: str, headers: dict[str, str], timeout: float, byte_range: tuple[int, int] | None = None
+) -> tuple[int, dict[str, str], bytes]:
+    """Send an HTTP GET request, optionally for a range of bytes (inclusive bounds).
+
+    Args:
+        url (str): URL of the remote object (http or https).
+        headers (dict[str, str]): headers of the request (e.g., authorization).
+        timeout (float): timeout of the request, in seconds.
+        byte_range (tuple[int, int] | None): first and last bytes to fetch, or None for all.
+
+    Raises:
+        ValueError: if the URL scheme is not http or https.
+
+    Returns:
+        tuple[int, dict[str, str], bytes]: status, headers (lowercase names), and body of the response.
+    """
+    if not url.startswith(("http://", "https://")):
+        raise ValueError(f"URL scheme should be http or https: {url}")
+    if byte_range is not None:
+        headers = {**headers, "Range": f"bytes={byte_range[0]}-{byte_range[1]}"}
+    message = urllib.request.Request(url, headers=headers)  # noqa: S310
+    with urllib.request.urlopen(message, timeout=timeout) as response:  # noqa: S310
+        return response.status, {key.lower(): value for key, value in response.headers.items()}, response.read()
+
+
+class LineageDataset(lineage.PandasDataset):
+    """Lineage of a dataframe with a precomputed digest, and a schema inferred from a sample of its rows.
+
+    MLflow hashes the full dataframe for its digest and infers its schema from all the rows,
+    which takes minutes on large dataframes.
+    """
+
+    @functools.cached_property
+    @T.override
+    def schema(self) -> mlflow.types.Schema | None:
+        sample = self.df.head(LINEAGE_SAMPLE_SIZE)
+        return lineage.PandasDataset(df=sample, source=self.source, digest=self.digest).schema
+
+
+def to_lineage(
+    data: pd.DataFrame,
+    name: str,
+    source: str | None = None,
+    targets: str | None = None,
+    predictions: str | None = None,
+    digest: str | None = None,
+) -> Lineage:
+    """Generate lineage information of a dataframe.
+
+    Args:
+        data (pd.DataFrame): dataframe of the dataset.
+        name (str): dataset name.
+        source (str | None): source of the dataset, or None for the code location.
+        targets (str | None): name of the target column.
+        predictions (str | None): name of the prediction column.
+        digest (str | None): digest of the dataset, or None to hash the full dataframe.
+
+    Returns:
+        Lineage: lineage information.
+    """
+    dataset = lineage.from_pandas(
+        df=data, name=name, source=source, targets=targets, predictions=predictions, digest=digest
+    )
+    if digest is None:
+        return dataset
+    return LineageDataset(
+        df=data, source=dataset.source, name=name, targets=targets, predictions=predictions, digest=digest
+    )
+
+
+# %% CACHES
+
+
+class MemoryCache:
+    """Size-bounded LRU cache of dataframes shared by the readers of a process.
+
+    Parameters:
+        max_bytes (int): maximum memory usage of the cached dataframes.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes (int): maximum memory usage of the cached dataframes.
+        """
+        self.max_bytes = max_bytes
+        self._frames: collections.OrderedDict[str, pd.DataFrame] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """Get a dataframe and mark it as recently used.
+
+        Args:
+            key (str): key of the dataframe.
+
+        Returns:
+            pd.DataFrame | None: cached dataframe, or None if it is missing.
+        """
+        with self._lock:
+            data = self._frames.get(key)
+            if data is not None:
+                self._frames.move_to_end(key)
+            return data
+
+    def put(self, key: str, data: pd.DataFrame) -> None:
+        """Put a dataframe and evict the least recently used ones above the maximum size.
+
+        Args:
+            key (str): key of the dataframe.
+            data (pd.DataFrame): dataframe to cache.
+        """
+        with self._lock:
+            self._frames[key] = data
+            self._frames.move_to_end(key)
+            while self._frames and self.nbytes() > self.max_bytes:
+                self._frames.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the dataframes from the cache."""
+        with self._lock:
+            self._frames.clear()
+
+    def nbytes(self) -> int:
+        """Return the memory usage of the cached dataframes.
+
+        Returns:
+            int: memory usage in bytes.
+        """
+        return sum(int(data.memory_usage(index=True).sum()) for data in self._frames.values())
+
+
+# Memory cache shared by all the readers
+CACHE = MemoryCache(max_bytes=1 << 30)
+
+
+def cached(read: ReadMethod) -> ReadMethod:
+    """Serve the read method of a reader from its memory and disk caches.
+
+    Only reads with a schema are cached, and the cached dataframes are validated by the schema:
+    they are cached by validation mode, and the copies are marked with the mode of their check.
+    The disk cache stores them as uncompressed arrow IPC files, memory-mapped when loaded.
+    Each read returns a copy of the cached dataframe: the changes of a caller stay its own.
+
+    Args:
+        read (ReadMethod): read method of the reader.
+
+    Returns:
+        ReadMethod: read method using the caches.
+    """
+
+    @functools.wraps(read)
+    def wrapper(self: Reader, schema: type[schemas.Schema] | None = None) -> pd.DataFrame:
+        if schema is None or (not self.memory_cache and self.disk_cache is None):
+            return read(self, schema=schema)
+        mode = schemas.VALIDATION.get().mode
+        key = f"{self.fingerprint(schema=schema)}-{mode}"  # e.g., unchecked with the off mode
+        data = CACHE.get(key) if self.memory_cache else None
+        if data is None:
+            file = None if self.disk_cache is None else pathlib.Path(self.disk_cache) / f"{key}.arrow"
+            if file is not None and file.exists():
+                with pa.memory_map(str(file)) as source:
+                    data = pa.ipc.open_file(source).read_all().to_pandas()
+            else:
+                data = schema.check(read(self, schema=schema))
+                if file is not None:
+                    file.parent.mkdir(parents=True, exist_ok=True)
+                    table = pa.Table.from_pandas(data, preserve_index=True)
+                    with replacing(str(file)) as path, pa.ipc.new_file(path, schema=table.schema) as writer:
+                        writer.write_table(table)
+            if self.memory_cache:
+                CACHE.put(key, data)
+        copy = data.copy(deep=True)  # callers can't change the cached dataframe (no copy-on-write)
+        if mode != "off":  # same values as the validated dataframe, checked in this mode
+            schemas.mark(data=copy, schema=schema, mode=mode)
+        return copy
+
+    return wrapper
+
+
+# %% CONNECTIONS
+
+
+class ConnectionPool:
+    """Small pool of DB-API connections reused by the readers and writers of a process.
+
+    Connections are keyed by driver and connection arguments, and each one is used by a single
+    read or write at a time. Note: sqlite3 requires `check_same_thread=False` to share them across threads.
+
+    Parameters:
+        max_size (int): maximum number of idle connections kept per key.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            max_size (int): maximum number of idle connections kept per key.
+        """
+        self.max_size = max_size
+        self._idle: dict[str, list[Connection]] = collections.defaultdict(list)
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def connect(self, driver: str, arguments: dict[str, T.Any]) -> T.Iterator[Connection]:
+        """Borrow an idle connection, or open a new one, and give it back once done.
+
+        A connection that raised an error is closed (rolling back its changes) instead of kept.
+
+        Args:
+            driver (str): module name of the DB-API driver (e.g., sqlite3, psycopg).
+            arguments (dict[str, T.Any]): keyword arguments of the driver `connect` function.
+
+        Yields:
+            Connection: DB-API connection of the driver.
+        """
+        key = repr((driver, sorted(arguments.items())))
+        with self._lock:
+            idle = self._idle[key]
+            connection = idle.pop() if idle else None
+        if connection is None:
+            connection = importlib.import_module(driver).connect(**arguments)
+        try:
+            yield connection
+            connection.rollback()  # end the read transactions before the next use
+        except BaseException:
+            connection.close()
+            raise
+        with self._lock:
+            if len(idle) < self.max_size:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def clear(self) -> None:
+        """Close and remove all the idle connections from the pool."""
+        with self._lock:
+            connections = [connection for idle in self._idle.values() for connection in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+    def size(self) -> int:
+        """Return the number of idle connections in the pool.
+
+        Returns:
+            int: number of idle connections.
+        """
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+
+# Connection pool shared by all the readers and writers
+POOL = ConnectionPool(max_size=4)
+
+
+# %% REMOTES
+
+
+class BlockCache:
+    """Size-bounded LRU cache of byte blocks stored in a local folder.
+
+    Blocks are marked as used by their mtime, and the least recently used ones
+    are evicted above the maximum size, down to 90% of it to scan the folder only once in a while.
+    The size is tracked incrementally between the scans. The folder can be shared across processes:
+    the blocks of the other processes are counted at the next scan.
+
+    Parameters:
+        path (str): local folder of the blocks.
+        max_bytes (int): maximum size of the cached blocks.
+    """
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        """Initialize the cache on a local folder.
+
+        Args:
+            path (str): local folder of the blocks.
+            max_bytes (int): maximum size of the cached blocks.
+        """
+        self.path = pathlib.Path(path)
+        self.max_bytes = max_bytes
+        self._total: int | None = None  # size of the blocks, scanned on the first put and the evictions
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        """Get a block and mark it as recently used.
+
+        Args:
+            key (str): key of the block.
+
+        Returns:
+            bytes | None: cached block, or None if it is missing.
+        """
+        file = self.path / f"{key}.block"
+        try:
+            data = file.read_bytes()
+            file.touch()
+        except FileNotFoundError:  # missing or evicted meanwhile
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Put a block and evict the least recently used ones above the maximum size.
+
+        Args:
+            key (str): key of the block.
+            data (bytes): block to cache.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        file = self.path / f"{key}.block"
+        with replacing(str(file)) as path:
+            pathlib.Path(path).write_bytes(data)
+        with self._lock:
+            self._total = self.nbytes() if self._total is None else self._total + len(data)
+            if self._total > self.max_bytes:
+                self._total = self._evict(max_bytes=self.max_bytes * 9 // 10)
+
+    def _evict(self, max_bytes: int) -> int:
+        """Evict the least recently used blocks until their size is below a limit.
+
+        Args:
+            max_bytes (int): maximum size of the remaining blocks.
+
+        Returns:
+            int: size of the remaining blocks.
+        """
+        stats = []
+        for block in self.path.glob("*.block"):
+            with contextlib.suppress(FileNotFoundError):
+                stats.append((block.stat(), block))
+        total = sum(stat.st_size for stat, _ in stats)
+        for stat, block in sorted(stats, key=lambda item: item[0].st_mtime_ns):
+            if total <= max_bytes:
+                break
+            block.unlink(missing_ok=True)
+            total -= stat.st_size
+        return total
+
+    def nbytes(self) -> int:
+        """Return the size of the cached blocks.
+
+        Returns:
+            int: size in bytes.
+        """
+        total = 0
+        for block in self.path.glob("*.block"):
+            with contextlib.suppress(FileNotFoundError):  # evicted meanwhile
+                total += block.stat().st_size
+        return total
+
+
+class RemoteFile(io.RawIOBase):
+    """Seekable binary file reading a remote object by blocks with HTTP range requests.
+
+    The fetched blocks are kept in memory in a bounded LRU, and in the block cache if any:
+    the blocks of the current read or prefetch are always kept, and the least recently used
+    ones beyond them are evicted, so streaming a large object keeps the memory bounded.
+    Use `prefetch` to fetch the blocks of several byte ranges concurrently.
+
+    Parameters:
+        url (str): URL of the remote object (http or https).
+        headers (dict[str, str]): headers of the requests (e.g., authorization).
+        block_size (int): size of the blocks fetched by each request, in bytes.
+        cache (BlockCache, optional): local cache of the blocks. Defaults to None.
+        max_workers (int): number of concurrent requests.
+        timeout (float): timeout of each request, in seconds.
+        max_blocks (int): number of blocks kept in memory beyond the current read or prefetch.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: dict[str, str],
+        block_size: int,
+        cache: BlockCache | None = None,
+        max_workers: int = 8,
+        timeout: float = 30.0,
+        max_blocks: int = 16,
+    ) -> None:
+        """Open the remote object and fetch its size and version with a 1-byte range request.
+
+        Args:
+            url (str): URL of the remote object (http or https).
+            headers (dict[str, str]): headers of the requests (e.g., authorization).
+            block_size (int): size of the blocks fetched by each request, in bytes.
+            cache (BlockCache, optional): local cache of the blocks. Defaults to None.
+            max_workers (int): number of concurrent requests.
+            timeout (float): timeout of each request, in seconds.
+            max_blocks (int): number of blocks kept in memory beyond the current read or prefetch.
+        """
+        super().__init__()
+        self.url = url
+        self.headers = headers
+        self.block_size = block_size
+        self.cache = cache
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_blocks = max_blocks
+        self.fetched = 0  # number of blocks fetched from the remote object
+        self._blocks: collections.OrderedDict[int, bytes] = collections.OrderedDict()  # LRU order
+        self._position = 0
+        self._lock = threading.Lock()
+        # a ranged GET (not a HEAD) also works with presigned URLs
+        response, _ = self._request(byte_range=(0, 0))
+        self.size = int(response["content-range"].rsplit("/", 1)[1])
+        self.version = response.get("etag") or response.get("last-modified") or ""
+
+    @T.override
+    def readable(self) -> bool:
+        return True
+
+    @T.override
+    def seekable(self) -> bool:
+        return True
+
+    @T.override
+    def tell(self) -> int:
+        return self._position
+
+    @T.override
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        origin = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: self.size}[whence]
+        self._position = origin + offset
+        return self._position
+
+    @T.override
+    def readinto(self, buffer: T.Any) -> int:
+        data = self.pread(start=self._position, length=len(buffer))
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def pread(self, start: int, length: int) -> bytes:
+        """Read a range of bytes from the blocks, fetching the missing ones.
+
+        Args:
+            start (int): position of the first byte.
+            length (int): maximum number of bytes to read.
+
+        Returns:
+            bytes: bytes read (fewer at the end of the object).
+        """
+        end = min(start + length, self.size)
+        if start >= end:
+            return b""
+        self.prefetch(ranges=[(start, end)])
+        first, last = start // self.block_size, (end - 1) // self.block_size
+        with self._lock:
+            blocks = [self._blocks.get(index) for index in range(first, last + 1)]
+        # blocks evicted meanwhile by a concurrent read are fetched again (e.g., from the block cache)
+        data = b"".join(
+            block if block is not None else self._block(index) for index, block in enumerate(blocks, start=first)
+        )
+        offset = first * self.block_size
+        return data[start - offset : end - offset]
+
+    def nbytes(self) -> int:
+        """Return the size of the blocks kept in memory.
+
+        Returns:
+            int: size in bytes.
+        """
+        with self._lock:
+            return sum(map(len, self._blocks.values()))
+
+    def prefetch(self, ranges: list[tuple[int, int]]) -> None:
+        """Fetch the missing blocks of several byte ranges concurrently.
+
+        Args:
+            ranges (list[tuple[int, int]]): start (inclusive) and end (exclusive) of each range.
+        """
+        indexes = {
+            index
+            for start, end in ranges
+            if start < end
+            for index in range(start // self.block_size, (min(end, self.size) - 1) // self.block_size + 1)
+        }
+        with self._lock:
+            missing = sorted(indexes - self._blocks.keys())
+        if len(missing) > 1 and self.max_workers > 1:
+            with CF.ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                blocks = list(executor.map(self._block, missing))
+        else:
+            blocks = [self._block(index) for index in missing]
+        with self._lock:
+            self._blocks.update(zip(missing, blocks, strict=True))
+            for index in sorted(indexes):  # the blocks of this window are the most recently used
+                self._blocks.move_to_end(index)
+            while len(self._blocks) > max(self.max_blocks, len(indexes)):
+                self._blocks.popitem(last=False)
+
+    def _block(self, index: int) -> bytes:
+        """Get a block from the cache, or fetch and cache it.
+
+        Args:
+            index (int): index of the block in the object.
+
+        Returns:
+            bytes: content of the block.
+        """
+        key = hashlib.sha256(repr((self.url, self.version, self.size, self.block_size, index)).encode()).hexdigest()
+        data = None if self.cache is None else self.cache.get(key)
+        if data is None:
+            start = index * self.block_size
+            end = min(start + self.block_size, self.size) - 1
+            _, data = self._request(byte_range=(start, end))
+            with self._lock:
+                self.fetched += 1
+            if self.cache is not None:
+                self.cache.put(key, data)
+        return data
+
+    def _request(self, byte_range: tuple[int, int]) -> tuple[dict[str, str], bytes]:
+        """Request a range of bytes from the remote object.
+
+        Args:
+            byte_range (tuple[int, int]): first and last bytes to fetch.
+
+        Raises:
+            ValueError: if the server does not support range requests.
+
+        Returns:
+            tuple[dict[str, str], bytes]: headers and body of the response.
+        """
+        status, headers, body = request(self.url, headers=self.headers, timeout=self.timeout, byte_range=byte_range)
+        if status != 206:
+            raise ValueError(f"Remote object does not support range requests: {self.url} (status {status})")
+        return headers, body
+
+
+class RemoteParquetFile(pq.ParquetFile):
+    """Parquet file read from a remote object, with the column chunks to decode fetched concurrently.
+
+    Parameters:
+        source (RemoteFile): remote object of the parquet file.
+    """
+
+    def __init__(self, source: RemoteFile) -> None:
+        """Open the parquet file and fetch its footer.
+
+        Args:
+            source (RemoteFile): remote object of the parquet file.
+        """
+        super().__init__(source)
+        self.source = source
+
+    def prefetch(self, columns: list[str] | None, row_groups: list[int]) -> None:
+        """Fetch the column chunks of the row groups concurrently.
+
+        Args:
+            columns (list[str] | None): columns to decode (and the index columns), or None for all.
+            row_groups (list[int]): indexes of the row groups to read.
+        """
+        names = None if columns is None else {*columns, *index_columns(self.schema_arrow)}
+        ranges = []
+        for row_group in row_groups:
+            metadata = self.metadata.row_group(row_group)
+            for position in range(metadata.num_columns):
+                chunk = metadata.column(position)
+                if names is not None and chunk.path_in_schema.split(".")[0] not in names:
+                    continue
+                start = chunk.data_page_offset
+                if chunk.has_dictionary_page and chunk.dictionary_page_offset is not None:
+                    start = min(start, chunk.dictionary_page_offset)
+                ranges.append((start, start + chunk.total_compressed_size))
+        self.source.prefetch(ranges=ranges)
+
+
+# Remote object opened by the current read of a remote reader (i.e., its size and version are fetched once)
+OPENED: contextvars.ContextVar[tuple[RemoteParquetReader, RemoteFile] | None] = contextvars.ContextVar(
+    "opened", default=None
+)
+
+
+# %% READERS
+
+
+class Reader(abc.ABC, pdt.BaseModel, strict=True, frozen=True, extra="forbid"):
+    """Base class for a dataset reader.
+
+    Use a reader to load a dataset in memory.
+    e.g., to read file, database, cloud storage, ...
+
+    Parameters:
+        limit (int, optional): maximum number of rows to read. Defaults to None.
+        columns (Columns): column names to read, "schema" to read only the
+            index and columns of the schema given to `read`, or None for all.
+        cast (bool): cast the columns to the types of the schema given to `read`
+            before the conversion to pandas (numpy dtypes instead of the backend).
+            Worth it for files stored with wider types (e.g., int64/double/string):
+            it lowers the peak memory, but it costs time on files stored with the schema types.
+        check (bool): check the arrow tables with the schema given to `read` before the conversion
+            to pandas (invalid batches fail early, and the dataframes are marked as validated).
+        memory_cache (bool): share the validated dataframes of this reader in memory.
+        disk_cache (str, optional): local folder to store the validated dataframes. Defaults to None.
+        lineage_mode (LineageMode): digest the lineage from the full dataframe,
+            the metadata of the sources (e.g., parquet footer, size, mtime), or a sample of the rows.
+    """
+
+    KIND: str
+
+    limit: int | None = None
+    columns: Columns = None
+    cast: bool = False
+    check: bool = False
+    memory_cache: bool = False
+    disk_cache: str | None = None
+    lineage_mode: LineageMode = "full"
+
+    @abc.abstractmethod
+    def read(self, schema: type[schemas.Schema] | None = None) -> pd.DataFrame:
+        """Read a dataframe from a dataset.
+
+        Args:
+            schema (type[schemas.Schema] | None): schema expected for the dataframe.
+
+        Returns:
+            pd.DataFrame: dataframe representation.
+        """
+
+    def read_batches(self, batch_size: int, schema: type[schemas.Schema] | None = None) -> T.Iterator[pd.DataFrame]:
+        """Read a dataset as a stream of dataframe batches.
+
+        The default implementation reads the full dataframe then slices it:
+        override it to keep the memory bounded by the batch size.
+
+        Args:
+            batch_size (int): maximum number of rows per batch.
+            schema (type[schemas.Schema] | None): schema expected for the dataframe.
+
+        Yields:
+            pd.DataFrame: dataframe representation of the next batch.
+        """
+        data = self.read(schema=schema)
+        for start in range(0, len(data), batch_size):
+            yield data.iloc[start : start + batch_size]
+
+    def projection(self, schema: type[schemas.Schema] | None = None) -> list[str] | None:
+        """Resolve the column names to read from the dataset.
+
+        Args:
+            schema (type[schemas.Schema] | None): schema expected for the dataframe.
+
+        Returns:
+            list[str] | None: column names to read, or None to read all of them.
+        """
+        if self.columns == "schema":
+            return schema.names() if schema is not None else None
+        return self.columns
+
+    def casting(self, schema: type[schemas.Schema] | None = None) -> type[schemas.Schema] | None:
+        """Resolve the schema to cast the columns to before the conversion to pandas.
+
+        Args:
+            schema (type[schemas.Schema] | None): schema expected for the dataframe.
+
+        Returns:
+            type[schemas.Schema] | None: schema to cast the columns to, or None to keep them.
+        """
+        return schema if self.cast else None
+
+    def checking(self, schema: type[schemas.Schema] | None = None) -> type[schemas.Schema] | None:
+        """Resolve the schema to check the arrow tables with before the conversion to pandas.
+
+        Args:
+            schema (type[schemas.Schema] | None): schema expected for the dataframe.
+
+        Returns:
+            type[schemas.Schema] | None: schema to check the arrow tables with, or None to skip it.
+        """
+        return schema if self.check else None
+
+    def sources(self) -> list[str]:
+        """Return the local files of the dataset, to detect their changes in the caches.
+
+        Returns:
+            list[str]: paths of the local files.
+        """
+        return []
+
+    def fingerprint(self, schema: type[schemas.Schema] | None = None) -> str:
+        """Hash the options of the reader, the schema, and the size and mtime of the sources.
+
+        Args:
+            schema (type[schemas.Schema] | None): schema expected for the dataframe.
+
+        Returns:
+            str: key of the dataframe in the caches.
+        """
+        stats = []
+        for source in self.sources():
+            stat = pathlib.Path(source).stat()
+            stats.append((source, stat.st_size, stat.st_mtime_ns))
+        options = self.model_dump(exclude={"memory_cache", "disk_cache", "lineage_mode"})
+        name = None if schema is None else f"{schema.__module__}.{schema.__qualname__}"
+        key = repr((options, name, stats))
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def digest(self, data: pd.DataFrame) -> str | None:
+        """Compute the lineage digest of a dataframe read by this reader.
+
+        The metadata mode hashes the fingerprint and the parquet footers of the sources,
+        and the sample mode hashes the first rows of the dataframe. Both include its shape.
+
+        Args:
+            data (pd.DataFrame): dataframe read by this reader.
+
+        Returns:
+            str | None: digest of the dataframe, or None to let mlflow hash the full dataframe.
+        """
+        if self.lineage_mode == "full":
+            return None
+        if self.lineage_mode == "metadata":
+            parts = [self.fingerprint().encode(), *map(parquet_footer, self.sources())]
+        else:
+            parts = [pd.util.hash_pandas_object(data.head(LINEAGE_SAMPLE_SIZE)).to_numpy().tobytes()]
+        parts.append(repr((data.shape, list(data.columns))).encode())
+        return hashlib.sha256(b"".join(parts)).hexdigest()[:8]
+
+    @abc.abstractmethod
+    def lineage(
+        self,
+        name: str,
+        data: pd.DataFrame,
+        targets: str | None = None,
+        predictions: str | None = None,
+    ) -> Lineage:
+        """Generate lineage information.
+
+        Args:
+            name (str): dataset name.
+            data (pd.DataFrame): reader dataframe.
+            targets (str | None): name of the target column.
+            predictions (str | None): name of the prediction column.
+
+        Returns:
+            Lineage: lineage information.
+        """
+
+
+class ParquetReader(Reader):
+    """Read a dataframe from a parquet file.
+
+    The limit, the columns, and the window are pushed down to the parquet file:
+    record batches are streamed until enough rows are read,
+    the columns outside the projection are never decoded,
+    and the row groups outside the window are skipped from their statistics.
+
+    Parameters:
+        path (str): local path to the dataset.
+        backend (Backend): dtype backend of the dataframe.
+        window (str): column (or stored index) used to filter rows by range.
+        start (int | float | str, optional): lower bound of the window (inclusive).
+        end (int | float | str, optional): upper bound of the window (exclusive).
+    """
+
+    KIND: T.Literal["ParquetReader"] = "ParquetReader"
+
+    path: str
+    backend: Backend = "pyarrow"
+    window: str = "instant"
+    start: int | float | str | None = None
+    end: int | float | str | None = None
+
+    @T.override
+    @cached
+    def read(self, schema: type[schemas.Schema] | None = None) -> pd.DataFrame:
+        file = self._open()
+        projection = self.projection(schema=schema)
+        columns = self._columns(file=file, projection=projection)
+        if self.limit is None:  # no-op for local files
+            self._prefetch(file=file, columns=columns, row_groups=self._row_groups(file=file))
+        casting = self.casting(schema=schema)
+        types = {} if casting is None else arrow_types(schema=casting)
+        stored = file.schema_arrow
+        if self.limit is None and cast(stored.empty_table(), types=types).schema != stored:
+            # stored types differ: cast each row group to never hold all the stored columns in memory
+            tables = [
+                cast(self._filter(file.read_row_group(group, columns=columns, use_pandas_metadata=True)), types=types)
+                for group in self._row_groups(file=file)
+            ] or [file.read_row_groups([], columns=columns, use_pandas_metadata=True)]
+            table = pa.concat_tables(tables, promote_options="permissive")
+        elif self.limit is None:
+            table = self._filter(
+                file.read_row_groups(self._row_groups(file=file), columns=columns, use_pandas_metadata=True)
+            )
+        else:
+            batches = list(self._batches(file=file, columns=columns, batch_size=max(self.limit, 1)))
+            # skipped or empty files have no batches to carry the schema
+            if batches:
+                table = pa.Table.from_batches(batches)
+            else:
+                table = file.read_row_groups([], columns=columns, use_pandas_metadata=True)
+        if columns != projection:  # window column only decoded to filter rows
+            table = table.drop_columns([self.window])
+        return to_pandas(table, backend=self.backend, schema=casting, check=self.checking(schema=schema))
+
+    @T.override
+    def read_batches(self, batch_size: int, schema: type[schemas.Schema] | None = None) -> T.Iterator[pd.DataFrame]:
+        file = self._open()
+        projection = self.projection(schema=schema)
+        columns = self._columns(file=file, projection=projection)
+        for batch in self._batches(file=file, columns=columns, batch_size=batch_size):
+            table = pa.Table.from_batches([batch])
+            if columns != projection:  # window column only decoded to filter rows
+                table = table.drop_columns([self.window])
+            yield to_pandas(
+                table, backend=self.backend, schema=self.casting(schema=schema), check=self.checking(schema=schema)
+            )
+
+    def row_groups(self) -> list[int]:
+        """Return the row groups overlapping with the window.
+
+        Returns:
+            list[int]: indexes of the row groups to read.
+        """
+        return self._row_groups(file=self._open())
+
+    def _open(self) -> pq.ParquetFile:
+        """Open the parquet file and read its footer.
+
+        Returns:
+            pq.ParquetFile: parquet file to read.
+        """
+        return pq.ParquetFile(self.path)
+
+    def _prefetch(self, file: pq.ParquetFile, columns: list[str] | None, row_groups: list[int]) -> None:
+        """Fetch the column chunks of the row groups before decoding them (e.g., from remote storage).
+
+        Args:
+            file (pq.ParquetFile): parquet file to read.
+            columns (list[str] | None): columns to decode.
+            row_groups (list[int]): indexes of the row groups to read.
+        """
+
+    def _windowed(self) -> bool:
+        """Check if the rows are filtered by a window.
+
+        Returns:
+            bool: True if a window bound is set.
+        """
+        return self.start is not None or self.end is not None
+
+    def _columns(self, file: pq.ParquetFile, projection: list[str] | None) -> list[str] | None:
+        """Add the window column to the projection if it's needed to filter rows.
+
+        Args:
+            file (pq.ParquetFile): parquet file to read.
+            projection (list[str] | None): columns to read.
+
+        Returns:
+            list[str] | None: columns to decode.
+        """
+        if projection is None or self.window in projection or not self._windowed():
+            return projection
+        # index columns are always decoded with the pandas metadata
+        if self.window in index_columns(file.schema_arrow):
+            return projection
+        return [*projection, self.window]
+
+    def _batches(self, file: pq.ParquetFile, columns: list[str] | None, batch_size: int) -> T.Iterator[pa.RecordBatch]:
+        """Stream the record batches inside the window until the limit is reached.
+
+        Args:
+            file (pq.ParquetFile): parquet file to read.
+            columns (list[str] | None): columns to decode.
+            batch_size (int): maximum number of rows per batch.
+
+        Yields:
+            pa.RecordBatch: next record batch with at least one row.
+        """
+        remaining = self.limit
+        for batch in file.iter_batches(
+            batch_size=batch_size,
+            row_groups=self._row_groups(file=file),
+            columns=columns,
+            use_pandas_metadata=True,
+        ):
+            batch = self._filter(batch)
+            if remaining is not None:
+                batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+            if batch.num_rows > 0:
+                yield batch
+            if remaining is not None and remaining <= 0:
+                break  # stop decoding once the limit is reached
+
+    def _row_groups(self, file: pq.ParquetFile) -> list[int]:
+        """Select the row groups overlapping with the window from their statistics.
+
+        Args:
+            file (pq.ParquetFile): parquet file to read.
+
+        Raises:
+            ValueError: if the window column is not stored in the file.
+
+        Returns:
+            list[int]: indexes of the row groups to read.
+        """
+        row_groups = list(range(file.metadata.num_row_groups))
+        if not self._windowed():
+            return row_groups
+        if self.window not in file.schema_arrow.names:
+            raise ValueError(f"Window column is not stored in the dataset: {self.window}")
+        type_ = file.schema_arrow.field(self.window).type
+        metadata = file.metadata
+        index = metadata.schema.names.index(self.window)
+        start = pa.scalar(self.start).cast(type_).as_py() if self.start is not None else None
+        end = pa.scalar(self.end).cast(type_).as_py() if self.end is not None else None
+        selected = []
+        for row_group in row_groups:
+            statistics = metadata.row_group(row_group).column(index).statistics
+            # row groups without statistics are kept and filtered row by row
+            if statistics is not None and statistics.has_min_max:
+                if start is not None and statistics.max < start:
+                    continue
+                if end is not None and statistics.min >= end:
+                    continue
+            selected.append(row_group)
+        return selected
+
+    def _filter(self, data: pa.Table | pa.RecordBatch) -> pa.Table | pa.RecordBatch:
+        """Filter out the rows outside the window.
+
+        Args:
+            data (pa.Table | pa.RecordBatch): arrow data to filter.
+
+        Returns:
+            pa.Table | pa.RecordBatch: arrow data inside the window.
+        """
+        if not self._windowed():
+            return data
+        type_ = data.schema.field(self.window).type
+        mask = pc.scalar(True)
+        if self.start is not None:
+            mask &= pc.field(self.window) >= pa.scalar(self.start).cast(type_)
+        if self.end is not None:
+            mask &= pc.field(self.window) < pa.scalar(self.end).cast(type_)
+        return data.filter(mask)
+
+    @T.override
+    def sources(self) -> list[str]:
+        return [self.path]
+
+    @T.override
+    def lineage(
+        self,
+        name: str,
+        data: pd.DataFrame,
+        targets: str | None = None,
+        predictions: str | None = None,
+    ) -> Lineage:
+        return to_lineage(
+            data=data,
+            name=name,
+            source=self.path,
+            targets=targets,
+            predictions=predictions,
+            digest=self.digest(data=data),
+        )
+
+
+class RemoteParquetReader(ParquetReader):
+    """Read a dataframe from a parquet file on remote storage (e.g., S3-compatible or HTTP server).
+
+    The footer is fetched first, then the column chunks of the row groups inside the window
+    are fetched concurrently with HTTP range requests, by blocks of a fixed size.
+    The blocks can be kept in a local folder to skip the network on the next reads.
+    S3-compatible objects are read from public or presigned URLs (e.g., `aws s3 presign`).
+    The size and version of the object are fetched once per read, for its cache key and its blocks.
+
+    Parameters:
+        path (str): URL of the dataset (http or https).
+        headers (dict[str, pdt.SecretStr]): headers of the requests (e.g., authorization), hidden from the logs.
+        block_size (int): size of the blocks fetched by each request, in bytes.
+        block_cache (str, optional): local folder of the block cache. Defaults to None.
+        block_cache_bytes (int): maximum size of the block cache, in bytes.
+        max_workers (int): number of concurrent requests.
+        timeout (float): timeout of each request, in seconds.
+        max_blocks (int): number of blocks kept in memory beyond the current read or prefetch.
+    """
+
+    KIND: T.Literal["RemoteParquetReader"] = "RemoteParquetReader"
+
+    headers: dict[str, pdt.SecretStr] = pdt.Field(default={}, repr=False)
+    block_size: int = 4 << 20
+    block_cache: str | None = None
+    block_cache_bytes: int = 1 << 30
+    max_workers: int = 8
+    timeout: float = 30.0
+    max_blocks: int = 16
+
+    @T.override
+    def read(self, schema: type[schemas.Schema] | None = None) -> pd.DataFrame:
+        token = OPENED.set((self, self.remote()))  # shared by the fingerprint and the file of the read
+        try:
+            return super().read(schema=schema)
+        finally:
+            OPENED.reset(token)
+
+    def remote(self) -> RemoteFile:
+        """Open the remote object of the dataset, or return the one of the current read.
+
+        Returns:
+            RemoteFile: remote object of the dataset.
+        """
+        opened = OPENED.get()
+        if opened is not None and opened[0] is self:
+            return opened[1]
+        cache = (
+            None if self.block_cache is None else BlockCache(path=self.block_cache, max_bytes=self.block_cache_bytes)
+        )
+        return RemoteFile(
+            url=self.path,
+            headers={name: value.get_secret_value() for name, value in self.headers.items()},
+            block_size=self.block_size,
+            cache=cache,
+            max_workers=self.max_workers,
+            timeout=self.timeout,
+            max_blocks=self.max_blocks,
+        )
+
+    @T.override
+    def _open(self) -> pq.ParquetFile:
+        return RemoteParquetFile(source=self.remote())
+
+    @T.override
+    def _prefetch(self, file: pq.ParquetFile, columns: list[str] | None, row_groups: list[int]) -> None:
+        if isinstance(file, RemoteParquetFile):
+            file.prefetch(columns=columns, row_groups=row_groups)
+
+    @T.override
+    def sources(self) -> list[str]:
+        return []  # remote objects are versioned in the fingerprint
+
+    @T.override
+    def fingerprint(self, schema: type[schemas.Schema] | None = None) -> str:
+        remote = self.remote()
+        key = repr((super().fingerprint(schema=schema), remote.size, remote.version))
+        return hashlib.sha256(key.encode()).hexdigest()
+
+
+class ArrowIPCReader(Reader):
+    """Read a dataframe from an arrow IPC file (i.e., feather v2).
+
+    Uncompressed files are memory-mapped and converted without copies:
+    reads are almost free, and processes on the same host share the pages.
+
+    Parameters:
+        path (str): local path to the dataset.
+        backend (Backend): dtype backend of the dataframe.
+        memory_map (bool): memory-map the file instead of reading it.
+    """
+
+    KIND: T.Literal["ArrowIPCReader"] = "ArrowIPCReader"
+
+    path: str
+    backend: Backend = "pyarrow"
+    memory_map: bool = True
+
+    @T.override
+    @cached
+    def read(self, schema: type[schemas.Schema] | None = None) -> pd.DataFrame:
+        with self._open() as file:
+            columns = self._columns(file=file, projection=self.projection(schema=schema))
+            batches = list(self._batches(file=file, columns=columns))
+            table = pa.Table.from_batches(
+                batches, schema=file.schema if columns is None else self._schema(file, columns)
+            )
+        return to_pandas(
+            table, backend=self.backend, schema=self.casting(schema=schema), check=self.checking(schema=schema)
+        )
+
+    @T.override
+    def read_batches(self, batch_size: int, schema: type[schemas.Schema] | None = None) -> T.Iterator[pd.DataFrame]:
+        with self._open() as file:
+            columns = self._columns(file=file, projection=self.projection(schema=schema))
+            for batch in self._batches(file=file, columns=columns):
+                for start in range(0, batch.num_rows, batch_size):
+                    table = pa.Table.from_batches([batch.slice(start, batch_size)])
+                    yield to_pandas(
+                        table,
+                        backend=self.backend,
+                        schema=self.casting(schema=schema),
+                        check=self.checking(schema=schema),
+                    )
+
+    @contextlib.contextmanager
+    def _open(self) -> T.Iterator[pa.ipc.RecordBatchFileReader]:
+        """Open the arrow IPC file for reading, and close it on exit.
+
+        The batches read from a memory map stay valid after the close: they keep the mapping alive.
+
+        Yields:
+            pa.ipc.RecordBatchFileReader: reader of the file record batches.
+        """
+        with pa.memory_map(self.path) if self.memory_map else pa.OSFile(self.path) as source:
+            yield pa.ipc.open_file(source)
+
+    def _columns(self, file: pa.ipc.RecordBatchFileReader, projection: list[str] | None) -> list[str] | None:
+        """Add the index columns to the projection.
 
-# %% READERS
+        Args:
+            file (pa.ipc.RecordBatchFileReader): reader of the file record batches.
+            projection (list[str] | None): columns to read.
 
+        Returns:
+            list[str] | None: columns to select.
+        """
+        if projection is None:
+            return None
+        return [*projection, *(column for column in index_columns(file.schema) if column not in projection)]
 
-class Reader(abc.ABC, pdt.BaseModel, strict=True, frozen=True, extra="forbid"):
-    """Base class for a dataset reader.
+    def _schema(self, file: pa.ipc.RecordBatchFileReader, columns: list[str]) -> pa.Schema:
+        """Select columns from the file schema, keeping its metadata.
 
-    Use a reader to load a dataset in memory.
-    e.g., to read file, database, cloud storage, ...
+        Args:
+            file (pa.ipc.RecordBatchFileReader): reader of the file record batches.
+            columns (list[str]): columns to select.
+
+        Returns:
+            pa.Schema: schema of the selected columns.
+        """
+        return pa.schema([file.schema.field(column) for column in columns], metadata=file.schema.metadata)
+
+    def _batches(self, file: pa.ipc.RecordBatchFileReader, columns: list[str] | None) -> T.Iterator[pa.RecordBatch]:
+        """Stream the record batches of the file until the limit is reached.
+
+        Args:
+            file (pa.ipc.RecordBatchFileReader): reader of the file record batches.
+            columns (list[str] | None): columns to select.
+
+        Yields:
+            pa.RecordBatch: next record batch with at least one row.
+        """
+        remaining = self.limit
+        for i in range(file.num_record_batches):
+            if remaining is not None and remaining <= 0:
+                break  # stop reading once the limit is reached
+            batch = file.get_batch(i)
+            if columns is not None:
+                batch = pa.RecordBatch.from_arrays(
+                    [batch.column(column) for column in columns], schema=self._schema(file, columns)
+                )
+            if remaining is not None:
+                batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+            if batch.num_rows > 0:
+                yield batch
+
+    @T.override
+    def sources(self) -> list[str]:
+        return [self.path]
+
+    @T.override
+    def lineage(
+        self,
+        name: str,
+        data: pd.DataFrame,
+        targets: str | None = None,
+        predictions: str | None = None,
+    ) -> Lineage:
+        return to_lineage(
+            data=data,
+            name=name,
+            source=self.path,
+            targets=targets,
+            predictions=predictions,
+            digest=self.digest(data=data),
+        )
+
+
+class ParquetDatasetReader(Reader):
+    """Read a dataframe from a directory or glob of parquet files.
+
+    The files are partitioned with hive keys in their paths (e.g., year=2012/month=1/).
+    Partitions are pruned from their keys before reading, and the remaining files
+    are decoded concurrently on a thread pool then concatenated without copies.
 
     Parameters:
-        limit (int, optional): maximum number of rows to read. Defaults to None.
+        path (str): local directory or glob pattern of the parquet files.
+        backend (Backend): dtype backend of the dataframe.
+        partitions (dict[str, list[str | int]]): values to keep per partition key.
+        max_workers (int, optional): number of threads to decode files. Defaults to None.
     """
 
-    KIND: str
+    KIND: T.Literal["ParquetDatasetReader"] = "ParquetDatasetReader"
 
-    limit: int | None = None
+    path: str
+    backend: Backend = "pyarrow"
+    partitions: dict[str, list[str | int]] = {}
+    max_workers: int | None = None
 
-    @abc.abstractmethod
-    def read(self) -> pd.DataFrame:
-        """Read a dataframe from a dataset.
+    @T.override
+    @cached
+    def read(self, schema: type[schemas.Schema] | None = None) -> pd.DataFrame:
+        files = self.files()
+        if not files:
+            raise FileNotFoundError(f"No parquet files found for the dataset: {self.path}")
+        columns = self.projection(schema=schema)
+        casting = self.casting(schema=schema)
+        types = {} if casting is None else arrow_types(schema=casting)
+        tables, rows = [], 0
+        with CF.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._read, file, columns, types) for file in files]
+            for future in futures:  # keep the file order
+                tables.append(future.result())
+                rows += tables[-1].num_rows
+                if self.limit is not None and rows >= self.limit:
+                    for pending in futures:
+                        pending.cancel()  # skip the files not started yet
+                    break
+        table = pa.concat_tables(tables, promote_options="permissive")  # zero-copy: tables become chunks
+        if self.limit is not None:
+            table = table.slice(0, self.limit)
+        return to_pandas(table, backend=self.backend, schema=casting, check=self.checking(schema=schema))
+
+    @T.override
+    def read_batches(self, batch_size: int, schema: type[schemas.Schema] | None = None) -> T.Iterator[pd.DataFrame]:
+        columns = self.projection(schema=schema)
+        remaining = self.limit
+        for file in self.files():
+            for batch in pq.ParquetFile(file).iter_batches(
+                batch_size=batch_size, columns=columns, use_pandas_metadata=True
+            ):
+                if remaining is not None:
+                    if remaining <= 0:
+                        return  # stop decoding once the limit is reached
+                    batch = batch.slice(0, remaining)
+                    remaining -= batch.num_rows
+                yield to_pandas(
+                    pa.Table.from_batches([batch]),
+                    backend=self.backend,
+                    schema=self.casting(schema=schema),
+                    check=self.checking(schema=schema),
+                )
+
+    def files(self) -> list[str]:
+        """Find the parquet files of the dataset inside the selected partitions.
 
         Returns:
-            pd.DataFrame: dataframe representation.
+            list[str]: paths of the parquet files to read, in partition order.
         """
+        path = pathlib.Path(self.path)
+        pattern = str(path / "**" / "*.parquet") if path.is_dir() else self.path
+        files = glob.glob(pattern, recursive=True)  # noqa: PTH207  # Path.glob rejects absolute patterns
+        files.sort(key=self._order)  # e.g., month=2 before month=10
+        return [file for file in files if self._selected(file=file)]
 
-    @abc.abstractmethod
+    @classmethod
+    def _order(cls, file: str) -> list[tuple[int, int, str]]:
+        """Sort key of a file path comparing the numeric hive values as integers.
+
+        Args:
+            file (str): path of the parquet file.
+
+        Returns:
+            list[tuple[int, int, str]]: key per path part, numeric values first.
+        """
+        order = []
+        for part in pathlib.Path(file).parts:
+            _, sep, value = part.partition("=")
+            parsed = cls._parse(value) if sep else part
+            order.append((0, parsed, part) if isinstance(parsed, int) else (1, 0, part))
+        return order
+
+    @staticmethod
+    def _parse(value: str | int) -> str | int:
+        """Parse a hive partition value, as an integer if it is numeric (e.g., 01 is 1).
+
+        Args:
+            value (str | int): value of the partition key.
+
+        Returns:
+            str | int: parsed value of the partition key.
+        """
+        text = str(value)
+        return int(text) if text.lstrip("-").isdigit() else text
+
+    def _selected(self, file: str) -> bool:
+        """Check if the hive keys of a file path match the selected partitions.
+
+        The values are compared once parsed: month=01 matches the partition value 1.
+
+        Args:
+            file (str): path of the parquet file.
+
+        Returns:
+            bool: True if the file is inside the selected partitions.
+        """
+        keys = dict(part.split("=", 1) for part in pathlib.Path(file).parts if "=" in part)
+        for key, values in self.partitions.items():
+            if key in keys and self._parse(keys[key]) not in {self._parse(value) for value in values}:
+                return False
+        return True
+
+    def _read(self, file: str, columns: list[str] | None, types: dict[str, pa.DataType]) -> pa.Table:
+        """Decode a single parquet file.
+
+        Args:
+            file (str): path of the parquet file.
+            columns (list[str] | None): columns to read.
+            types (dict[str, pa.DataType]): arrow types to cast the columns to.
+
+        Returns:
+            pa.Table: arrow table of the file.
+        """
+        # files are decoded concurrently, so avoid nested threads
+        table = pq.read_table(file, columns=columns, use_pandas_metadata=True, use_threads=False)
+        return cast(table, types=types)
+
+    @T.override
+    def sources(self) -> list[str]:
+        return self.files()
+
+    @T.override
     def lineage(
         self,
         name: str,
@@ -46,38 +1593,325 @@ class Reader(abc.ABC, pdt.BaseModel, strict=True, frozen=True, extra="forbid"):
         targets: str | None = None,
         predictions: str | None = None,
     ) -> Lineage:
-        """Generate lineage information.
+        return to_lineage(
+            data=data,
+            name=name,
+            source=self.path,
+            targets=targets,
+            predictions=predictions,
+            digest=self.digest(data=data),
+        )
+
+
+class CSVReader(Reader):
+    """Read a dataframe from a CSV file.
+
+    The file is parsed by arrow on multiple threads, and the columns are converted
+    to the schema types (e.g., uint8, float16, bool) while parsing instead of the pandas defaults.
+    Unlike the other readers, CSV parsing always uses the schema types given to `read`, even
+    without `cast`: the text has to be parsed to some type, so the schema types cost no extra pass.
+    `cast` only selects the numpy dtypes over the dtype backend for the conversion to pandas.
+    The parsed data can be cached as a parquet file, keyed by the size and mtime of the CSV file.
+
+    Parameters:
+        path (str): local path to the dataset.
+        backend (Backend): dtype backend of the dataframe.
+        index (str, optional): column to set as the dataframe index. Defaults to "instant".
+        cache (str, optional): local folder of the parquet cache. Defaults to None.
+    """
+
+    KIND: T.Literal["CSVReader"] = "CSVReader"
+
+    path: str
+    backend: Backend = "pyarrow"
+    index: str | None = "instant"
+    cache: str | None = None
+
+    @T.override
+    @cached
+    def read(self, schema: type[schemas.Schema] | None = None) -> pd.DataFrame:
+        columns = self._columns(projection=self.projection(schema=schema))
+        types = {} if schema is None else arrow_types(schema=schema)
+        if self.cache is None:
+            table = self._parse(columns=columns, types=types, limit=self.limit)
+        else:
+            table = self._cached(cache=self.cache, columns=columns, types=types)
+            if self.limit is not None:
+                table = table.slice(0, self.limit)
+        return self._to_pandas(table=table, schema=schema)
+
+    @T.override
+    def read_batches(self, batch_size: int, schema: type[schemas.Schema] | None = None) -> T.Iterator[pd.DataFrame]:
+        columns = self._columns(projection=self.projection(schema=schema))
+        types = {} if schema is None else arrow_types(schema=schema)
+        remaining = self.limit
+        with pv.open_csv(self.path, convert_options=self._options(columns=columns, types=types)) as reader:
+            for block in reader:
+                table = cast(pa.Table.from_batches([block]), types=types)
+                for start in range(0, table.num_rows, batch_size):
+                    if remaining is not None and remaining <= 0:
+                        return  # stop parsing once the limit is reached
+                    batch = table.slice(start, batch_size if remaining is None else min(batch_size, remaining))
+                    if remaining is not None:
+                        remaining -= batch.num_rows
+                    yield self._to_pandas(table=batch, schema=schema)
+
+    def _columns(self, projection: list[str] | None) -> list[str] | None:
+        """Add the index column to the projected columns.
 
         Args:
-            name (str): dataset name.
-            data (pd.DataFrame): reader dataframe.
-            targets (str | None): name of the target column.
-            predictions (str | None): name of the prediction column.
+            projection (list[str] | None): projected columns, or None for all.
 
         Returns:
-            Lineage: lineage information.
+            list[str] | None: columns to parse, or None for all.
         """
+        if projection is None or self.index is None or self.index in projection:
+            return projection
+        return [self.index, *projection]
 
+    def _options(self, columns: list[str] | None, types: dict[str, pa.DataType]) -> pv.ConvertOptions:
+        """Build the conversion options of the CSV parser.
 
-class ParquetReader(Reader):
-    """Read a dataframe from a parquet file.
+        Args:
+            columns (list[str] | None): columns to parse, or None for all.
+            types (dict[str, pa.DataType]): arrow types of the columns.
+
+        Returns:
+            pv.ConvertOptions: options of the arrow CSV parser.
+        """
+        # arrow cannot parse float16 directly: parse to float32, then cast
+        types = {name: pa.float32() if kind == pa.float16() else kind for name, kind in types.items()}
+        return pv.ConvertOptions(column_types=types, include_columns=columns or [])
+
+    def _parse(self, columns: list[str] | None, types: dict[str, pa.DataType], limit: int | None) -> pa.Table:
+        """Parse the CSV file to an arrow table.
+
+        Args:
+            columns (list[str] | None): columns to parse, or None for all.
+            types (dict[str, pa.DataType]): arrow types of the columns.
+            limit (int | None): maximum number of rows to parse, or None for all.
+
+        Returns:
+            pa.Table: arrow table of the file.
+        """
+        options = self._options(columns=columns, types=types)
+        if limit is None:  # parse the blocks on multiple threads
+            table = pv.read_csv(self.path, convert_options=options)
+        else:  # stream the blocks until the limit is reached
+            with pv.open_csv(self.path, convert_options=options) as reader:
+                blocks, rows = [], 0
+                for block in reader:
+                    if rows >= limit:
+                        break
+                    blocks.append(block)
+                    rows += block.num_rows
+                table = pa.Table.from_batches(blocks, schema=reader.schema).slice(0, limit)
+        return cast(table, types=types)
+
+    def _cached(self, cache: str, columns: list[str] | None, types: dict[str, pa.DataType]) -> pa.Table:
+        """Load the parsed CSV file from the parquet cache, or parse and cache it.
+
+        Args:
+            cache (str): local folder of the parquet cache.
+            columns (list[str] | None): columns to parse, or None for all.
+            types (dict[str, pa.DataType]): arrow types of the columns.
+
+        Returns:
+            pa.Table: arrow table of the file.
+        """
+        path = pathlib.Path(self.path)
+        stat = path.stat()
+        key = repr((str(path.resolve()), stat.st_size, stat.st_mtime_ns, columns, sorted(map(str, types.items()))))
+        file = pathlib.Path(cache) / f"{path.stem}-{hashlib.sha256(key.encode()).hexdigest()[:16]}.parquet"
+        if file.exists():
+            return pq.read_table(file)
+        table = self._parse(columns=columns, types=types, limit=None)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        with replacing(str(file)) as path:
+            pq.write_table(table, path)
+        return table
+
+    def _to_pandas(self, table: pa.Table, schema: type[schemas.Schema] | None) -> pd.DataFrame:
+        """Convert an arrow table to a dataframe indexed by the index column.
+
+        Args:
+            table (pa.Table): arrow table of the parsed columns.
+            schema (type[schemas.Schema] | None): schema expected for the dataframe.
+
+        Returns:
+            pd.DataFrame: dataframe representation.
+        """
+        return to_pandas(
+            table,
+            backend=self.backend,
+            schema=self.casting(schema=schema),
+            check=self.checking(schema=schema),
+            index=self.index,
+        )
+
+    @T.override
+    def sources(self) -> list[str]:
+        return [self.path]
+
+    @T.override
+    def lineage(
+        self,
+        name: str,
+        data: pd.DataFrame,
+        targets: str | None = None,
+        predictions: str | None = None,
+    ) -> Lineage:
+        return to_lineage(
+            data=data,
+            name=name,
+            source=self.path,
+            targets=targets,
+            predictions=predictions,
+            digest=self.digest(data=data),
+        )
+
+
+class SQLReader(Reader):
+    """Read a dataframe from the results of an SQL query on a DB-API connection.
+
+    The rows are fetched in batches and converted column-wise to arrow record batches,
+    typed as the schema (e.g., uint8, float16, bool) instead of one Python object per row.
+    The columns and the window are pushed down to the query with bound parameters,
+    and the connections are reused across reads from a small pool.
+
+    Note: the caches and the metadata lineage only hash the reader options, not the database content.
 
     Parameters:
-        path (str): local path to the dataset.
+        query (str): SQL query or table selection (e.g., SELECT * FROM hour).
+        driver (str): module name of the DB-API driver (e.g., sqlite3, psycopg).
+        connection (dict[str, T.Any]): keyword arguments of the driver `connect` function.
+        parameters (list[int | float | str]): positional parameters of the query
+            (bound as :p1, :p2, ... for the drivers with the named paramstyle).
+        backend (Backend): dtype backend of the dataframe.
+        index (str, optional): column to set as the dataframe index. Defaults to "instant".
+        window (str): column used to filter rows by range.
+        start (int | float | str, optional): lower bound of the window (inclusive).
+        end (int | float | str, optional): upper bound of the window (exclusive).
+        fetch_size (int): number of rows fetched per round trip.
     """
 
-    KIND: T.Literal["ParquetReader"] = "ParquetReader"
+    KIND: T.Literal["SQLReader"] = "SQLReader"
 
-    path: str
-    backend: T.Literal["pyarrow", "numpy_nullable"] = "pyarrow"
+    query: str
+    driver: str = "sqlite3"
+    connection: dict[str, T.Any] = {}
+    parameters: list[int | float | str] = []
+    backend: Backend = "pyarrow"
+    index: str | None = "instant"
+    window: str = "instant"
+    start: int | float | str | None = None
+    end: int | float | str | None = None
+    fetch_size: int = 10_000
 
     @T.override
-    def read(self) -> pd.DataFrame:
-        # can't limit rows at read time
-        data = pd.read_parquet(self.path, dtype_backend=self.backend)
-        if self.limit is not None:
-            data = data.head(self.limit)
-        return data
+    @cached
+    def read(self, schema: type[schemas.Schema] | None = None) -> pd.DataFrame:
+        tables = list(self._fetch(schema=schema))
+        table = pa.concat_tables(tables, promote_options="permissive")  # e.g., null columns in a batch
+        types = {} if schema is None else arrow_types(schema=schema)
+        return self._to_pandas(table=cast(table, types=types), schema=schema)
+
+    @T.override
+    def read_batches(self, batch_size: int, schema: type[schemas.Schema] | None = None) -> T.Iterator[pd.DataFrame]:
+        for table in self._fetch(schema=schema, fetch_size=batch_size):
+            if table.num_rows > 0:
+                yield self._to_pandas(table=table, schema=schema)
+
+    def statement(self, schema: type[schemas.Schema] | None = None) -> tuple[str, Parameters]:
+        """Build the SQL statement and its parameters with the projection and the window.
+
+        Args:
+            schema (type[schemas.Schema] | None): schema expected for the dataframe.
+
+        Returns:
+            tuple[str, Parameters]: SQL statement and its parameters bound in the paramstyle of the driver.
+        """
+        projection = self.projection(schema=schema)
+        if projection is not None and self.index is not None and self.index not in projection:
+            projection = [self.index, *projection]
+        bounds = [(operator, bound) for operator, bound in ((">=", self.start), ("<", self.end)) if bound is not None]
+        (parameters,) = bind(self.driver, rows=[(*self.parameters, *(bound for _, bound in bounds))])
+        if projection is None and not bounds:
+            return self.query, parameters
+        columns = ", ".join(map(quote, projection)) if projection is not None else "*"
+        statement = f"SELECT {columns} FROM ({self.query}) AS data"  # noqa: S608
+        markers = placeholders(self.driver, count=len(bounds), offset=len(self.parameters))
+        conditions = [
+            f"{quote(self.window)} {operator} {marker}" for (operator, _), marker in zip(bounds, markers, strict=True)
+        ]
+        if conditions:
+            statement += " WHERE " + " AND ".join(conditions)
+        return statement, parameters
+
+    def _fetch(self, schema: type[schemas.Schema] | None, fetch_size: int | None = None) -> T.Iterator[pa.Table]:
+        """Execute the query and fetch its rows as arrow tables.
+
+        Args:
+            schema (type[schemas.Schema] | None): schema expected for the dataframe.
+            fetch_size (int | None): number of rows per batch. Defaults to the reader fetch size.
+
+        Yields:
+            pa.Table: next batch of rows cast to the schema types, or a single empty one without rows.
+        """
+        size = fetch_size or self.fetch_size
+        types = {} if schema is None else arrow_types(schema=schema)
+        statement, parameters = self.statement(schema=schema)
+        remaining = self.limit
+        with POOL.connect(self.driver, arguments=self.connection) as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.arraysize = size
+                cursor.execute(statement, parameters)
+                names = [description[0] for description in cursor.description]
+                fetched = 0
+                while remaining is None or remaining > fetched:
+                    rows = cursor.fetchmany(size if remaining is None else min(size, remaining - fetched))
+                    if not rows:
+                        break
+                    fetched += len(rows)
+                    yield self._to_arrow(rows=rows, names=names, types=types)
+                if fetched == 0:  # keep the columns of an empty result
+                    yield self._to_arrow(rows=[], names=names, types=types)
+            finally:
+                cursor.close()
+
+    def _to_arrow(self, rows: list[tuple[T.Any, ...]], names: list[str], types: dict[str, pa.DataType]) -> pa.Table:
+        """Convert fetched rows to an arrow table, one column at a time.
+
+        Args:
+            rows (list[tuple[T.Any, ...]]): rows fetched from the cursor.
+            names (list[str]): names of the columns.
+            types (dict[str, pa.DataType]): arrow types of the columns.
+
+        Returns:
+            pa.Table: arrow table of the rows.
+        """
+        columns = list(zip(*rows, strict=True)) if rows else [() for _ in names]
+        table = pa.Table.from_arrays([pa.array(column) for column in columns], names=names)
+        return cast(table, types=types)
+
+    def _to_pandas(self, table: pa.Table, schema: type[schemas.Schema] | None) -> pd.DataFrame:
+        """Convert an arrow table to a dataframe indexed by the index column.
+
+        Args:
+            table (pa.Table): arrow table of the fetched rows.
+            schema (type[schemas.Schema] | None): schema expected for the dataframe.
+
+        Returns:
+            pd.DataFrame: dataframe representation.
+        """
+        return to_pandas(
+            table,
+            backend=self.backend,
+            schema=self.casting(schema=schema),
+            check=self.checking(schema=schema),
+            index=self.index,
+        )
 
     @T.override
     def lineage(
@@ -87,16 +1921,16 @@ class ParquetReader(Reader):
         targets: str | None = None,
         predictions: str | None = None,
     ) -> Lineage:
-        return lineage.from_pandas(
-            df=data,
+        return to_lineage(
+            data=data,
             name=name,
-            source=self.path,
             targets=targets,
             predictions=predictions,
+            digest=self.digest(data=data),
         )
 
 
-ReaderKind = ParquetReader
+ReaderKind = ParquetReader | RemoteParquetReader | ArrowIPCReader | ParquetDatasetReader | CSVReader | SQLReader
 
 # %% WRITERS
 
@@ -118,21 +1952,292 @@ class Writer(abc.ABC, pdt.BaseModel, strict=True, frozen=True, extra="forbid"):
             data (pd.DataFrame): dataframe representation.
         """
 
+    def write_batches(self, batches: T.Iterable[pd.DataFrame]) -> None:
+        """Write a stream of dataframe batches to a dataset.
+
+        The default implementation concatenates the batches then writes them:
+        override it to append each batch and keep the memory bounded.
+        Nothing is written if there is no batch.
+
+        Args:
+            batches (T.Iterable[pd.DataFrame]): dataframe representations.
+        """
+        data = list(batches)
+        if data:
+            self.write(data=pd.concat(data))
+
 
 class ParquetWriter(Writer):
     """Writer a dataframe to a parquet file.
 
+    Row groups should be sized for the readers: smaller row groups let
+    readers skip more data from their statistics, larger ones compress better.
+    Streamed batches are buffered until they fill a row group.
+    The file is replaced once complete: a failed write leaves the previous file untouched.
+
     Parameters:
         path (str): local or S3 path to the dataset.
+        row_group_size (int, optional): maximum number of rows per row group. Defaults to None.
+        compression (str): compression codec of the column chunks.
+        compression_level (int, optional): compression level of the codec. Defaults to None.
+        use_dictionary (bool): enable dictionary encoding of the columns.
+        write_statistics (bool): write min/max statistics of the column chunks.
     """
 
     KIND: T.Literal["ParquetWriter"] = "ParquetWriter"
 
     path: str
+    row_group_size: int | None = None
+    compression: T.Literal["none", "snappy", "gzip", "brotli", "lz4", "zstd"] = "snappy"
+    compression_level: int | None = None
+    use_dictionary: bool = True
+    write_statistics: bool = True
+
+    @T.override
+    def write(self, data: pd.DataFrame) -> None:
+        with replacing(self.path) as path:
+            pd.DataFrame.to_parquet(data, path, engine="pyarrow", row_group_size=self.row_group_size, **self._options())
+
+    @T.override
+    def write_batches(self, batches: T.Iterable[pd.DataFrame]) -> None:
+        with replacing(self.path) as path:
+            self._write_batches(path=path, batches=batches)
+
+    def _write_batches(self, path: str, batches: T.Iterable[pd.DataFrame]) -> None:
+        """Write a stream of dataframe batches to a parquet file, by row groups.
+
+        Args:
+            path (str): path of the parquet file.
+            batches (T.Iterable[pd.DataFrame]): dataframe representations.
+        """
+        writer: pq.ParquetWriter | None = None
+        schema: pa.Schema | None = None
+        pending: pa.Table | None = None  # rows waiting to fill a row group
+        try:
+            for batch in batches:
+                table = pa.Table.from_pandas(batch, schema=schema, preserve_index=True)
+                if writer is None:  # the first batch defines the file schema
+                    schema = table.schema
+                    writer = pq.ParquetWriter(path, schema=schema, **self._options())
+                if self.row_group_size is None:
+                    writer.write_table(table)
+                    continue
+                pending = table if pending is None else pa.concat_tables([pending, table])
+                # write the full row groups and keep the remaining rows
+                full = pending.num_rows - pending.num_rows % self.row_group_size
+                if full > 0:
+                    writer.write_table(pending.slice(0, full), row_group_size=self.row_group_size)
+                    pending = pending.slice(full)
+            if writer is not None and pending is not None and pending.num_rows > 0:
+                writer.write_table(pending, row_group_size=self.row_group_size)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _options(self) -> dict[str, T.Any]:
+        """Return the options of the parquet file writer.
+
+        Returns:
+            dict[str, T.Any]: options of the pyarrow parquet writer.
+        """
+        return {
+            "compression": None if self.compression == "none" else self.compression,
+            "compression_level": self.compression_level,
+            "use_dictionary": self.use_dictionary,
+            "write_statistics": self.write_statistics,
+        }
+
+
+class ArrowIPCWriter(Writer):
+    """Write a dataframe to an arrow IPC file (i.e., feather v2).
+
+    Keep the file uncompressed to let readers memory-map it without copies.
+    The file is replaced once complete: a failed write leaves the previous file untouched.
+
+    Parameters:
+        path (str): local path to the dataset.
+        compression (str): compression codec of the record batches.
+    """
+
+    KIND: T.Literal["ArrowIPCWriter"] = "ArrowIPCWriter"
+
+    path: str
+    compression: T.Literal["uncompressed", "lz4", "zstd"] = "uncompressed"
+
+    @T.override
+    def write(self, data: pd.DataFrame) -> None:
+        self.write_batches(batches=[data])
+
+    @T.override
+    def write_batches(self, batches: T.Iterable[pd.DataFrame]) -> None:
+        compression = None if self.compression == "uncompressed" else self.compression
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        writer: pa.ipc.RecordBatchFileWriter | None = None
+        schema: pa.Schema | None = None
+        with replacing(self.path) as path:
+            try:
+                for batch in batches:
+                    table = pa.Table.from_pandas(batch, schema=schema, preserve_index=True)
+                    if writer is None:  # the first batch defines the file schema
+                        schema = table.schema
+                        writer = pa.ipc.new_file(path, schema=schema, options=options)
+                    writer.write_table(table)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+
+class PartitionedParquetWriter(Writer):
+    """Write a dataframe to a directory of parquet files partitioned by a key.
+
+    Each partition is written to its own hive path (e.g., dteday=2012-12-31/part-0.parquet)
+    on a thread pool. Only the partitions found in the data are replaced:
+    a rerun on a day of data rewrites this day and leaves the others untouched.
+    The buckets are merged instead: a rerun replaces the rows of its keys and keeps the others.
+    Streamed batches are written one at a time: the rows of a partition already written
+    by the previous batches of the stream are kept, and the new rows are appended to them.
+
+    The partition must be a column or an index of the data: the explanations of
+    the ExplanationsJob have no instant, so partition them by another key (e.g., feature).
+
+    Datetime keys are partitioned by date, and integer keys by bucket of consecutive values.
+    The default buckets hold 720 instants: about a month of hours, but not calendar months,
+    since the instants have gaps (e.g., hours without records). Other keys (e.g., strings)
+    are partitioned by value.
+
+    Parameters:
+        path (str): local directory of the dataset.
+        partition (str): column or index name to partition the data by.
+        bucket_size (int, optional): group integer keys in buckets of this size (required for them).
+        compression (str): compression codec of the column chunks.
+        max_workers (int, optional): number of threads to write partitions. Defaults to None.
+    """
+
+    KIND: T.Literal["PartitionedParquetWriter"] = "PartitionedParquetWriter"
+
+    path: str
+    partition: str = "instant"
+    bucket_size: int | None = pdt.Field(default=720, ge=1)
+    compression: T.Literal["none", "snappy", "gzip", "brotli", "lz4", "zstd"] = "snappy"
+    max_workers: int | None = None
+
+    @T.override
+    def write(self, data: pd.DataFrame) -> None:
+        self.write_batches(batches=[data])
+
+    @T.override
+    def write_batches(self, batches: T.Iterable[pd.DataFrame]) -> None:
+        written: set[str] = set()  # partitions written by the previous batches
+        with CF.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for data in batches:
+                keys = self.keys(data=data)
+                table = pa.Table.from_pandas(data, preserve_index=True)  # convert once for all partitions
+                groups = pd.Series(keys).groupby(keys, sort=True).indices
+                futures = [
+                    executor.submit(self._write, key, table.take(rows), key in written) for key, rows in groups.items()
+                ]
+                for future in futures:
+                    future.result()  # raise the first error
+                written.update(groups)
+
+    def keys(self, data: pd.DataFrame) -> list[str]:
+        """Compute the partition key of each row.
+
+        Datetime values are partitioned by date, integer values by bucket, and other values by value.
+
+        Args:
+            data (pd.DataFrame): dataframe representation.
+
+        Raises:
+            ValueError: if the partition is missing from the data (e.g., explanations without instant).
+            ValueError: if the partition is an integer key without bucket size (i.e., one partition per row).
+
+        Returns:
+            list[str]: partition key of each row.
+        """
+        if self.partition in data.index.names:
+            values = data.index.get_level_values(self.partition).to_series(index=data.index)
+        elif self.partition in data.columns:
+            values = data[self.partition]
+        else:
+            raise ValueError(f"Partition '{self.partition}' is not a column or an index of the data!")
+        if pd.api.types.is_datetime64_any_dtype(values.dtype):
+            values = values.dt.strftime("%Y-%m-%d")
+        elif pd.api.types.is_integer_dtype(values.dtype):
+            if self.bucket_size is None:
+                raise ValueError(f"Partition '{self.partition}' has integer keys: set a bucket size!")
+            values = values // self.bucket_size * self.bucket_size
+        return values.astype(str).tolist()
+
+    def _write(self, key: str, table: pa.Table, append: bool = False) -> None:
+        """Replace the file of a single partition, or merge the rows of a bucket into it.
+
+        Args:
+            key (str): partition key of the data.
+            table (pa.Table): arrow table of the partition.
+            append (bool): keep the rows of the file written by the previous batches of the stream.
+        """
+        folder = pathlib.Path(self.path) / f"{self.partition}={key}"
+        folder.mkdir(parents=True, exist_ok=True)
+        file = folder / "part-0.parquet"
+        if file.exists() and pa.types.is_integer(table.schema.field(self.partition).type):  # bucket
+            existing = pq.read_table(file)
+            kept = existing.filter(pc.invert(pc.is_in(existing[self.partition], value_set=table[self.partition])))
+            table = pa.concat_tables([kept.cast(table.schema), table]).sort_by(self.partition)
+        elif file.exists() and append:
+            table = pa.concat_tables([pq.read_table(file).cast(table.schema), table])
+        compression = None if self.compression == "none" else self.compression
+        with replacing(str(file)) as path:
+            pq.write_table(table, path, compression=compression)
+
+
+class SQLWriter(Writer):
+    """Write a dataframe to an existing table on a DB-API connection.
+
+    The rows are inserted in bulk with `executemany`, one batch of rows per call,
+    and committed in a single transaction per write (rolled back on errors).
+    The connections are reused across writes from a small pool.
+
+    Parameters:
+        table (str): name of the table to insert the rows into.
+        driver (str): module name of the DB-API driver (e.g., sqlite3, psycopg).
+        connection (dict[str, T.Any]): keyword arguments of the driver `connect` function.
+        mode (str): append the rows to the table, or replace its rows.
+        batch_size (int): number of rows per `executemany` call.
+    """
+
+    KIND: T.Literal["SQLWriter"] = "SQLWriter"
+
+    table: str
+    driver: str = "sqlite3"
+    connection: dict[str, T.Any] = {}
+    mode: T.Literal["append", "replace"] = "append"
+    batch_size: int = 10_000
 
     @T.override
     def write(self, data: pd.DataFrame) -> None:
-        pd.DataFrame.to_parquet(data, self.path)
+        self.write_batches(batches=[data])
+
+    @T.override
+    def write_batches(self, batches: T.Iterable[pd.DataFrame]) -> None:
+        with POOL.connect(self.driver, arguments=self.connection) as connection:
+            cursor = connection.cursor()
+            try:
+                if self.mode == "replace":
+                    cursor.execute(f"DELETE FROM {quote(self.table)}")  # noqa: S608
+                for data in batches:
+                    if any(name is not None for name in data.index.names):
+                        data = data.reset_index()  # store the named index as columns
+                    table = pa.Table.from_pandas(data, preserve_index=False)
+                    columns = ", ".join(map(quote, table.column_names))
+                    markers = ", ".join(placeholders(self.driver, count=table.num_columns))
+                    statement = f"INSERT INTO {quote(self.table)} ({columns}) VALUES ({markers})"  # noqa: S608
+                    for batch in table.to_batches(max_chunksize=self.batch_size):
+                        rows = zip(*(column.to_pylist() for column in batch.columns), strict=True)
+                        cursor.executemany(statement, bind(self.driver, rows=rows))
+                connection.commit()
+            finally:
+                cursor.close()
 
 
-WriterKind = ParquetWriter
+WriterKind = ParquetWriter | ArrowIPCWriter | PartitionedParquetWriter | SQLWriter
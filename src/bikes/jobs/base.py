@@ -3,21 +3,62 @@
 # %% IMPORTS
 
 import abc
+import concurrent.futures as CF
+import contextvars
+import dataclasses
 import types as TS
 import typing as T
 
+import pandas as pd
+import pandera.typing.pandas as papd
 import pydantic as pdt
 
-from bikes.io import services
+from bikes.core import schemas
+from bikes.io import datasets, services
 
 # %% TYPES
 
 # Local job variables
 Locals = dict[str, T.Any]
 
+# %% HELPERS
+
+
+def load(
+    reader: datasets.Reader, schema: type[schemas.TSchema]
+) -> tuple[pd.DataFrame, papd.DataFrame[schemas.TSchema]]:
+    """Read a dataset and check it with its schema.
+
+    Submit it to the job threads to load several datasets concurrently:
+    decompression and decoding happen in arrow without holding the GIL.
+
+    Args:
+        reader (datasets.Reader): reader of the dataset.
+        schema (type[schemas.TSchema]): schema of the dataset.
+
+    Returns:
+        tuple[pd.DataFrame, papd.DataFrame[schemas.TSchema]]: unchecked and checked dataframes.
+    """
+    data_ = reader.read(schema=schema)  # unchecked!
+    return data_, schema.check(data_)
+
+
 # %% JOBS
 
 
+@dataclasses.dataclass
+class Context:
+    """Mutable state of a job while its context is entered.
+
+    Parameters:
+        validation (contextvars.Token[schemas.Validation] | None): token to reset the validation settings.
+        executor (CF.ThreadPoolExecutor | None): threads to run the job functions in the background.
+    """
+
+    validation: contextvars.Token[schemas.Validation] | None = None
+    executor: CF.ThreadPoolExecutor | None = None
+
+
 class Job(abc.ABC, pdt.BaseModel, strict=True, frozen=True, extra="forbid"):
     """Base class for a job.
 
@@ -28,6 +69,7 @@ class Job(abc.ABC, pdt.BaseModel, strict=True, frozen=True, extra="forbid"):
         logger_service (services.LoggerService): manage the logger system.
         alerts_service (services.AlertsService): manage the alerts system.
         mlflow_service (services.MlflowService): manage the mlflow system.
+        validation (schemas.Validation): settings to check the job dataframes with their schemas.
     """
 
     KIND: str
@@ -35,6 +77,9 @@ class Job(abc.ABC, pdt.BaseModel, strict=True, frozen=True, extra="forbid"):
     logger_service: services.LoggerService = services.LoggerService()
     alerts_service: services.AlertsService = services.AlertsService()
     mlflow_service: services.MlflowService = services.MlflowService()
+    validation: schemas.Validation = schemas.Validation()
+
+    _context: Context = pdt.PrivateAttr(default_factory=Context)  # the job itself is frozen
 
     def __enter__(self) -> T.Self:
         """Enter the job context.
@@ -49,6 +94,10 @@ class Job(abc.ABC, pdt.BaseModel, strict=True, frozen=True, extra="forbid"):
         self.alerts_service.start()
         logger.debug("[START] Mlflow service: {}", self.mlflow_service)
         self.mlflow_service.start()
+        logger.debug("[START] Validation: {}", self.validation)
+        self._context.validation = schemas.VALIDATION.set(self.validation)
+        logger.debug("[START] Executor: {}", self.KIND)
+        self._context.executor = CF.ThreadPoolExecutor(thread_name_prefix=self.KIND)
         return self
 
     def __exit__(
@@ -68,6 +117,14 @@ class Job(abc.ABC, pdt.BaseModel, strict=True, frozen=True, extra="forbid"):
             T.Literal[False]: always propagate exceptions.
         """
         logger = self.logger_service.logger()
+        if self._context.executor is not None:
+            logger.debug("[STOP] Executor: {}", self.KIND)
+            self._context.executor.shutdown(wait=True, cancel_futures=True)
+            self._context.executor = None
+        if self._context.validation is not None:
+            logger.debug("[STOP] Validation: {}", self.validation)
+            schemas.VALIDATION.reset(self._context.validation)
+            self._context.validation = None
         logger.debug("[STOP] Mlflow service: {}", self.mlflow_service)
         self.mlflow_service.stop()
         logger.debug("[STOP] Alerts service: {}", self.alerts_service)
@@ -76,6 +133,25 @@ class Job(abc.ABC, pdt.BaseModel, strict=True, frozen=True, extra="forbid"):
         self.logger_service.stop()
         return False  # re-raise
 
+    def submit(self, function: T.Callable[..., T.Any], **kwargs: T.Any) -> CF.Future[T.Any]:
+        """Submit a function to the job threads in a copy of the current context (e.g., the validation settings).
+
+        Args:
+            function (T.Callable[..., T.Any]): function to run in the background.
+            kwargs (T.Any): keyword arguments of the function.
+
+        Raises:
+            ValueError: if the job context is not entered.
+
+        Returns:
+            CF.Future[T.Any]: future result of the function.
+        """
+        executor = self._context.executor
+        if executor is None:
+            raise ValueError("Job context is not entered!")
+        context = contextvars.copy_context()
+        return executor.submit(context.run, function, **kwargs)
+
     @abc.abstractmethod
     def run(self) -> Locals:
         """Run the job in context.
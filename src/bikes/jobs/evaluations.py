@@ -2,6 +2,7 @@
 
 # %% IMPORTS
 
+import hashlib
 import typing as T
 
 import mlflow
@@ -60,18 +61,18 @@ class EvaluationsJob(base.Job):
         logger.info("With client: {}", client.tracking_uri)
         with self.mlflow_service.run_context(run_config=self.run_config) as run:
             logger.info("With run context: {}", run.info)
-            # data
-            # - inputs
+            # data (read and checked concurrently)
             logger.info("Read inputs: {}", self.inputs)
-            inputs_ = self.inputs.read()  # unchecked!
-            inputs = schemas.InputsSchema.check(inputs_)
+            inputs_future = self.submit(base.load, reader=self.inputs, schema=schemas.InputsSchema)
+            logger.info("Read targets: {}", self.targets)
+            targets_future = self.submit(base.load, reader=self.targets, schema=schemas.TargetsSchema)
+            # - inputs
+            inputs_, inputs = inputs_future.result()
             logger.debug("- Inputs shape: {}", inputs.shape)
             # - targets
-            logger.info("Read targets: {}", self.targets)
-            targets_ = self.targets.read()  # unchecked!
-            targets = schemas.TargetsSchema.check(targets_)
+            targets_, targets = targets_future.result()
             logger.debug("- Targets shape: {}", targets.shape)
-            # lineage
+            # lineage (logged before the predictions, e.g., for the failed runs)
             # - inputs
             logger.info("Log lineage: inputs")
             inputs_lineage = self.inputs.lineage(data=inputs, name="inputs")
@@ -100,11 +101,18 @@ class EvaluationsJob(base.Job):
             # dataset
             logger.info("Create dataset: inputs & targets & outputs")
             dataset_ = pd.concat([inputs, targets, outputs], axis="columns")
-            dataset = mlflow.data.from_pandas(  # type: ignore[attr-defined]
-                df=dataset_,
+            # - digest the dataset from its lineage instead of hashing it in full
+            digest = None
+            if self.inputs.lineage_mode != "full" and self.targets.lineage_mode != "full":
+                digest = hashlib.sha256(
+                    f"{inputs_lineage.digest}/{targets_lineage.digest}/{model_uri}".encode()
+                ).hexdigest()[:8]
+            dataset = datasets.to_lineage(
+                data=dataset_,
                 name="evaluation",
                 targets=schemas.TargetsSchema.cnt,
                 predictions=schemas.OutputsSchema.prediction,
+                digest=digest,
             )
             logger.debug("- Dataset: {}", dataset.to_dict())
             # metrics
@@ -43,7 +43,7 @@ class ExplanationsJob(base.Job):
         logger.info("With logger: {}", logger)
         # inputs
         logger.info("Read samples: {}", self.inputs_samples)
-        inputs_samples = self.inputs_samples.read()  # unchecked!
+        inputs_samples = self.inputs_samples.read(schema=schemas.InputsSchema)  # unchecked!
         inputs_samples = schemas.InputsSchema.check(inputs_samples)
         logger.debug("- Inputs samples shape: {}", inputs_samples.shape)
         # model
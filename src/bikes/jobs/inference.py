@@ -16,11 +16,16 @@ from bikes.jobs import base
 class InferenceJob(base.Job):
     """Generate batch predictions from a registered model.
 
+    Set a batch size to stream the inputs and outputs:
+    each batch is read, checked, predicted, and written in turn,
+    so the memory stays bounded by the batch size instead of the dataset size.
+
     Parameters:
         inputs (datasets.ReaderKind): reader for the inputs data.
         outputs (datasets.WriterKind): writer for the outputs data.
         alias_or_version (str | int): alias or version for the  model.
         loader (registries.LoaderKind): registry loader for the model.
+        batch_size (int, optional): number of rows per batch to stream. Defaults to None.
     """
 
     KIND: T.Literal["InferenceJob"] = "InferenceJob"
@@ -33,15 +38,19 @@ class InferenceJob(base.Job):
     alias_or_version: str | int = "Champion"
     # Loader
     loader: registries.LoaderKind = pdt.Field(registries.CustomLoader(), discriminator="KIND")
+    # Batch
+    batch_size: int | None = pdt.Field(default=None, ge=1)
 
     @T.override
     def run(self) -> base.Locals:
         # services
         logger = self.logger_service.logger()
         logger.info("With logger: {}", logger)
+        if self.batch_size is not None:
+            return self.stream(batch_size=self.batch_size)
         # inputs
         logger.info("Read inputs: {}", self.inputs)
-        inputs_ = self.inputs.read()  # unchecked!
+        inputs_ = self.inputs.read(schema=schemas.InputsSchema)  # unchecked!
         inputs = schemas.InputsSchema.check(inputs_)
         logger.debug("- Inputs shape: {}", inputs.shape)
         # model
@@ -65,3 +74,47 @@ class InferenceJob(base.Job):
         # notify
         self.alerts_service.notify(title="Inference Job Finished", message=f"Outputs Shape: {outputs.shape}")
         return locals()
+
+    def stream(self, batch_size: int) -> base.Locals:
+        """Run the job in context by streaming batches of inputs and outputs.
+
+        Args:
+            batch_size (int): number of rows per batch.
+
+        Returns:
+            base.Locals: local job variables.
+        """
+        # services
+        logger = self.logger_service.logger()
+        # model
+        logger.info("With model: {}", self.mlflow_service.registry_name)
+        model_uri = registries.uri_for_model_alias_or_version(
+            name=self.mlflow_service.registry_name,
+            alias_or_version=self.alias_or_version,
+        )
+        logger.debug("- Model URI: {}", model_uri)
+        # loader
+        logger.info("Load model: {}", self.loader)
+        model = self.loader.load(uri=model_uri)
+        logger.debug("- Model: {}", model)
+        # batches
+        rows = 0
+
+        def predict_batches() -> T.Iterator[schemas.Outputs]:
+            """Read, check, and predict the inputs batch by batch."""
+            nonlocal rows
+            batches = self.inputs.read_batches(batch_size=batch_size, schema=schemas.InputsSchema)
+            for i, inputs_ in enumerate(batches, start=1):
+                inputs = schemas.InputsSchema.check(inputs_)
+                outputs = model.predict(inputs=inputs)  # checked
+                logger.debug("- Batch {} outputs shape: {}", i, outputs.shape)
+                rows += len(outputs)
+                yield outputs
+
+        # write
+        logger.info("Stream outputs: {} ({} rows per batch)", self.outputs, batch_size)
+        self.outputs.write_batches(batches=predict_batches())
+        logger.debug("- Outputs rows: {}", rows)
+        # notify
+        self.alerts_service.notify(title="Inference Job Finished", message=f"Outputs Rows: {rows}")
+        return locals()
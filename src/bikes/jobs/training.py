@@ -52,6 +52,21 @@ class TrainingJob(base.Job):
     # - avoid shadowing pydantic `register` pydantic function
     registry: registries.RegisterKind = pdt.Field(registries.MlflowRegister(), discriminator="KIND")
 
+    @pdt.model_validator(mode="after")
+    def check_compaction(self) -> T.Self:
+        """Check that the model supports the compaction of the saver, before the training.
+
+        Raises:
+            ValueError: if the saver compacts a model that can't be compacted.
+
+        Returns:
+            T.Self: validated training job.
+        """
+        compaction = getattr(self.saver, "compaction", None)
+        if compaction is not None and not self.model.COMPACTABLE:
+            raise ValueError(f"Model {self.model.KIND} can't be compacted: remove the compaction of the saver!")
+        return self
+
     @T.override
     def run(self) -> base.Locals:
         # services
@@ -63,18 +78,18 @@ class TrainingJob(base.Job):
         logger.info("With client: {}", client.tracking_uri)
         with self.mlflow_service.run_context(run_config=self.run_config) as run:
             logger.info("With run context: {}", run.info)
-            # data
-            # - inputs
+            # data (read and checked concurrently)
             logger.info("Read inputs: {}", self.inputs)
-            inputs_ = self.inputs.read()  # unchecked!
-            inputs = schemas.InputsSchema.check(inputs_)
+            inputs_future = self.submit(base.load, reader=self.inputs, schema=schemas.InputsSchema)
+            logger.info("Read targets: {}", self.targets)
+            targets_future = self.submit(base.load, reader=self.targets, schema=schemas.TargetsSchema)
+            # - inputs
+            inputs_, inputs = inputs_future.result()
             logger.debug("- Inputs shape: {}", inputs.shape)
             # - targets
-            logger.info("Read targets: {}", self.targets)
-            targets_ = self.targets.read()  # unchecked!
-            targets = schemas.TargetsSchema.check(targets_)
+            targets_, targets = targets_future.result()
             logger.debug("- Targets shape: {}", targets.shape)
-            # lineage
+            # lineage (logged before the fit, e.g., for the failed runs)
             # - inputs
             logger.info("Log lineage: inputs")
             inputs_lineage = self.inputs.lineage(data=inputs, name="inputs")
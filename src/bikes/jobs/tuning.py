@@ -60,18 +60,18 @@ class TuningJob(base.Job):
         logger.info("With logger: {}", logger)
         with self.mlflow_service.run_context(run_config=self.run_config) as run:
             logger.info("With run context: {}", run.info)
-            # data
-            # - inputs
+            # data (read and checked concurrently)
             logger.info("Read inputs: {}", self.inputs)
-            inputs_ = self.inputs.read()  # unchecked!
-            inputs = schemas.InputsSchema.check(inputs_)
+            inputs_future = self.submit(base.load, reader=self.inputs, schema=schemas.InputsSchema)
+            logger.info("Read targets: {}", self.targets)
+            targets_future = self.submit(base.load, reader=self.targets, schema=schemas.TargetsSchema)
+            # - inputs
+            inputs_, inputs = inputs_future.result()
             logger.debug("- Inputs shape: {}", inputs.shape)
             # - targets
-            logger.info("Read targets: {}", self.targets)
-            targets_ = self.targets.read()  # unchecked!
-            targets = schemas.TargetsSchema.check(targets_)
+            targets_, targets = targets_future.result()
             logger.debug("- Targets shape: {}", targets.shape)
-            # lineage
+            # lineage (logged before the search, e.g., for the failed runs)
             # - inputs
             logger.info("Log lineage: inputs")
             inputs_lineage = self.inputs.lineage(data=inputs, name="inputs")
@@ -72,7 +72,13 @@ class GridCVSearcher(Searcher):
 
     Convention: metric returns higher values for better models.
 
+    With cache, the fitted transformers and trees are kept in memory during the search:
+    the candidates reuse the features of each fold, and only fit their regressor (or the
+    trees missing from the largest forest of the fold, e.g., to tune n_estimators).
+    The cache is shared by the sequential fits (i.e., n_jobs=None or 1).
+
     Parameters:
+        cache (bool): cache the fitted transformers and trees across the candidates.
         n_jobs (int, optional): number of jobs to run in parallel.
         refit (bool): refit the model after the tuning.
         verbose (int): set the searcher verbosity level.
@@ -82,6 +88,7 @@ class GridCVSearcher(Searcher):
 
     KIND: T.Literal["GridCVSearcher"] = "GridCVSearcher"
 
+    cache: bool = True
     n_jobs: int | None = None
     refit: bool = True
     verbose: int = 3
@@ -108,7 +115,11 @@ class GridCVSearcher(Searcher):
             error_score=self.error_score,
             return_train_score=self.return_train_score,
         )
-        searcher.fit(inputs, targets)
+        memory = models.MEMORY.set(models.Memory() if self.cache else None)
+        try:
+            searcher.fit(inputs, targets)
+        finally:
+            models.MEMORY.reset(memory)
         results = pd.DataFrame(searcher.cv_results_)
         return results, searcher.best_score_, searcher.best_params_
 
@@ -2,7 +2,10 @@
 
 # %% IMPORTS
 
+import functools
+import http.server
 import os
+import threading
 import typing as T
 
 import omegaconf
@@ -324,6 +327,57 @@ def mlflow_service(tmp_path: str) -> T.Generator[services.MlflowService]:
     service.stop()
 
 
+# %% - Servers
+
+
+class RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Serve the files of a folder with the HTTP range requests of object stores."""
+
+    def do_GET(self) -> None:
+        """Send a file, or the range of bytes given in the request header."""
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as file:
+            data = file.read()
+        header = self.headers.get("Range")
+        if header is None:
+            self.send_response(200)
+            body = data
+        else:
+            first, last = header.removeprefix("bytes=").split("-")
+            start, end = int(first), min(int(last), len(data) - 1)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+            body = data[start : end + 1]
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", f'"{os.stat(path).st_mtime_ns}"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: T.Any) -> None:  # noqa: A002
+        """Silence the request logs."""
+
+
+@pytest.fixture(scope="session")
+def http_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Return the folder served by the HTTP server."""
+    return str(tmp_path_factory.mktemp("http"))
+
+
+@pytest.fixture(scope="session")
+def http_url(http_path: str) -> T.Generator[str]:
+    """Return the URL of an HTTP server with range requests (e.g., an S3-compatible stand-in)."""
+    handler = functools.partial(RangeRequestHandler, directory=http_path)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
 # %% - Resolvers
 
 
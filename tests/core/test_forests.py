@@ -0,0 +1,114 @@
+# %% IMPORTS
+
+import numpy as np
+import pytest
+from sklearn import ensemble
+
+from bikes.core import forests
+
+# %% FORESTS
+
+
+@pytest.mark.parametrize("regressor", [ensemble.RandomForestRegressor, ensemble.ExtraTreesRegressor])
+def test_forest(regressor: type[forests.Ensemble]) -> None:
+    # given
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(500, 5)).astype(np.float32)
+    features[rng.random(size=features.shape) < 0.1] = np.nan  # missing values go left or right
+    targets = np.nansum(features, axis=1) + rng.normal(size=500)
+    ensemble_ = regressor(n_estimators=10, max_depth=6, random_state=0).fit(features, targets)
+    # when
+    forest = forests.Forest.from_sklearn(ensemble_)
+    predictions = forest.predict(features)
+    predictions_float64 = forest.predict(features.astype(np.float64))
+    predictions_row = forest.predict(features[:1])
+    predictions_empty = forest.predict(features[:0])
+    # then
+    assert len(forest.roots) == len(ensemble_.estimators_), "Forest should have one root per tree!"
+    assert len(forest.nodes) == sum(tree.tree_.node_count for tree in ensemble_.estimators_), (
+        "Forest should have the nodes of all the trees!"
+    )
+    assert np.array_equal(predictions, ensemble_.predict(features)), "Forest should match the ensemble!"
+    assert np.array_equal(predictions_float64, predictions), "Forest should cast the features like the ensemble!"
+    assert np.array_equal(predictions_row, predictions[:1]), "Forest should predict a single row!"
+    assert predictions_empty.shape == (0,), "Forest should predict an empty batch!"
+
+
+@pytest.mark.parametrize(
+    "compaction",
+    [
+        forests.Compaction(precision="float64"),
+        forests.Compaction(precision="float32"),
+        forests.Compaction(precision="float32", tolerance=0.5),
+    ],
+)
+def test_forest_compaction(compaction: forests.Compaction) -> None:
+    # given
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(500, 5)).astype(np.float32)
+    targets = features.sum(axis=1) + rng.normal(size=500)
+    ensemble_ = ensemble.RandomForestRegressor(n_estimators=10, random_state=0).fit(features, targets)
+    expected = ensemble_.predict(features)
+    # when
+    forest = forests.Forest.from_sklearn(ensemble_, compaction=compaction)
+    predictions = forest.predict(features)
+    # then
+    assert forest.nodes.dtype == forests.NODES[compaction.precision], "Forest should have the compact nodes!"
+    assert forest.nodes.dtype.itemsize <= forests.NODE.itemsize, "Compact nodes should not be larger!"
+    if compaction.tolerance:
+        assert len(forest.nodes) < sum(tree.tree_.node_count for tree in ensemble_.estimators_), (
+            "Forest should prune the subtrees within the tolerance!"
+        )
+    assert np.abs(predictions - expected).max() <= compaction.tolerance + 1e-5, (
+        "Forest should change the predictions within the tolerance!"
+    )
+
+
+def test_forest_regressor() -> None:
+    # given
+    features = np.arange(40, dtype=np.float32).reshape(20, 2)
+    targets = features.sum(axis=1)
+    ensemble_ = ensemble.RandomForestRegressor(n_estimators=2, random_state=0).fit(features, targets)
+    # when
+    regressor = forests.ForestRegressor.from_sklearn(ensemble_, compaction=forests.Compaction())
+    with pytest.raises(TypeError, match="can't be fitted") as fit_error:
+        regressor.fit(features, targets)
+    # then
+    assert fit_error.match("can't be fitted"), "Regressor should not be fitted again!"
+    assert np.array_equal(regressor.feature_importances_, ensemble_.feature_importances_), (
+        "Regressor should keep the feature importances!"
+    )
+    assert forests.compile_forest(regressor) is regressor.forest, "Regressor should provide its compiled forest!"
+    assert np.allclose(regressor.predict(features), ensemble_.predict(features)), "Regressor should match the ensemble!"
+
+
+def test_forest_errors() -> None:
+    # given
+    features = np.arange(20, dtype=np.float32).reshape(10, 2)
+    targets = np.stack([features.sum(axis=1), features.prod(axis=1)], axis=1)
+    ensemble_ = ensemble.RandomForestRegressor(n_estimators=2).fit(features, targets)
+    # when
+    with pytest.raises(ValueError, match="single output") as error:
+        forests.Forest.from_sklearn(ensemble_)
+    # then
+    assert error.match("single output"), "Forest should reject the ensembles with several outputs!"
+
+
+def test_compile_forest() -> None:
+    # given
+    features = np.arange(40, dtype=np.float32).reshape(20, 2)
+    targets = features.sum(axis=1)
+    ensemble_ = ensemble.RandomForestRegressor(n_estimators=2, warm_start=True, random_state=0)
+    ensemble_.fit(features, targets)
+    # when
+    forest = forests.compile_forest(ensemble_)
+    forest_again = forests.compile_forest(ensemble_)
+    ensemble_.set_params(n_estimators=4).fit(features, targets)
+    forest_grown = forests.compile_forest(ensemble_)
+    # then
+    assert forest_again is forest, "Compiled forest should be reused!"
+    assert forest_grown is not forest, "Compiled forest should be rebuilt when the ensemble grows!"
+    assert len(forest_grown.roots) == 4, "Compiled forest should have the new trees!"
+    assert np.array_equal(forest_grown.predict(features), ensemble_.predict(features)), (
+        "Compiled forest should match the grown ensemble!"
+    )
@@ -2,9 +2,32 @@
 
 import typing as T
 
+import numpy as np
+import pydantic as pdt
 import pytest
 
-from bikes.core import models, schemas
+from bikes.core import forests, models, schemas
+
+# %% CACHES
+
+
+def test_memory() -> None:
+    # given
+    calls = []
+    memory = models.Memory()
+
+    def square(x: int, message: str = "") -> int:
+        calls.append((x, message))
+        return x * x
+
+    cached = memory.cache(square, ignore=["message"])
+    # when
+    results = [cached(2, message="a"), cached(2, message="b"), cached(3)]
+    # then
+    assert results == [4, 4, 9], "Cached function should return the function results!"
+    assert calls == [(2, "a"), (3, "")], "Cached function should only run once per key!"
+    assert len(memory.results) == 2, "Memory should store one result per key!"
+
 
 # %% MODELS
 
@@ -60,7 +83,7 @@ def test_baseline_sklearn_model(
     train_test_sets: tuple[schemas.Inputs, schemas.Targets, schemas.Inputs, schemas.Targets],
 ) -> None:
     # given
-    params = {"max_depth": 3, "n_estimators": 5, "random_state": 0}
+    params = {"max_depth": 3, "n_estimators": 5, "random_state": 0, "engine": "numba"}
     inputs_train, targets_train, inputs_test, _ = train_test_sets
     model = models.BaselineSklearnModel().set_params(**params)
     # when
@@ -68,15 +91,21 @@ def test_baseline_sklearn_model(
         model.get_internal_model()
     model.fit(inputs=inputs_train, targets=targets_train)
     outputs = model.predict(inputs=inputs_test)
+    outputs_sklearn = model.model_copy(update={"engine": "sklearn"}).predict(inputs=inputs_test)
+    features = model.get_internal_model().named_steps["transformer"].transform(X=inputs_test)
     shap_values = model.explain_samples(inputs=inputs_test)
     feature_importances = model.explain_model()
     # then
     assert not_fitted_error.match("Model is not fitted yet!"), "Model should raise an error when not fitted!"
     # - model
-    assert model.get_params() == params, "Model should have the given params!"
+    assert model.get_params().items() >= params.items(), "Model should have the given params!"
     assert model.get_internal_model() is not None, "Internal model should be fitted!"
+    # - features
+    assert features.dtype == np.float32, "Features should be in the compute dtype!"
+    assert features.flags["C_CONTIGUOUS"], "Features should be a single contiguous matrix!"
     # - outputs
     assert outputs.ndim == 2, "Outputs should be a dataframe!"
+    assert outputs.equals(outputs_sklearn), "Outputs should be the same for all the engines!"
     # - shap values
     assert len(shap_values.index) == len(inputs_test.index), "SHAP values should be the same length as inputs!"
     assert len(shap_values.columns) >= len(inputs_test.columns), "SHAP values should have more features than inputs!"
@@ -85,3 +114,117 @@ def test_baseline_sklearn_model(
     assert len(feature_importances["feature"]) >= len(inputs_train.columns), (
         "Feature importances should have more features than inputs!"
     )
+
+
+def test_baseline_sklearn_model_warm_start(
+    train_test_sets: tuple[schemas.Inputs, schemas.Targets, schemas.Inputs, schemas.Targets],
+) -> None:
+    # given
+    inputs_train, targets_train, inputs_test, _ = train_test_sets
+    small = models.BaselineSklearnModel(max_depth=3, n_estimators=3, random_state=0)
+    large = models.BaselineSklearnModel(max_depth=3, n_estimators=6, random_state=0)
+    scratch = models.BaselineSklearnModel(max_depth=3, n_estimators=6, random_state=0)
+    # when
+    memory = models.MEMORY.set(models.Memory())
+    try:
+        small.fit(inputs=inputs_train, targets=targets_train)
+        large.fit(inputs=inputs_train, targets=targets_train)
+    finally:
+        models.MEMORY.reset(memory)
+    scratch.fit(inputs=inputs_train, targets=targets_train)
+    small_trees = small.get_internal_model().named_steps["regressor"].estimators_
+    large_regressor = large.get_internal_model().named_steps["regressor"]
+    # then
+    assert large_regressor.estimators_[:3] == small_trees, "Large forest should grow from the small forest!"
+    assert not large_regressor.warm_start, "Forest should not grow after its fit!"
+    assert large.predict(inputs=inputs_test).equals(scratch.predict(inputs=inputs_test)), (
+        "Grown forest should be the same as a forest fitted from scratch!"
+    )
+
+
+def test_baseline_sklearn_model_early_stopping(
+    train_test_sets: tuple[schemas.Inputs, schemas.Targets, schemas.Inputs, schemas.Targets],
+) -> None:
+    # given
+    params = {"n_estimators_step": 5, "n_iter_no_change": 1, "tol": 1.0}  # no step improves the R2 by 1
+    inputs_train, targets_train, _, _ = train_test_sets
+    model = models.BaselineSklearnModel(max_depth=3, n_estimators=100, early_stopping=True, random_state=0)
+    # when
+    model.set_params(**params).fit(inputs=inputs_train, targets=targets_train)
+    regressor = model.get_internal_model().named_steps["regressor"]
+    with pytest.raises(pdt.ValidationError, match="greater than or equal to 1") as step_error:
+        models.BaselineSklearnModel(early_stopping=True, n_estimators_step=0)
+    # then
+    assert step_error.match("n_estimators_step"), "Model should reject the empty steps!"
+    assert len(regressor.estimators_) == 10, "Forest should stop growing when the out-of-bag score plateaus!"
+    assert regressor.n_estimators == len(regressor.estimators_), "Forest should have the number of trees it grew!"
+
+
+def test_baseline_sklearn_model_compact(
+    train_test_sets: tuple[schemas.Inputs, schemas.Targets, schemas.Inputs, schemas.Targets],
+) -> None:
+    # given
+    compaction = forests.Compaction(tolerance=1.0)
+    inputs_train, targets_train, inputs_test, _ = train_test_sets
+    model = models.BaselineSklearnModel(max_depth=5, n_estimators=5, random_state=0)
+    model.fit(inputs=inputs_train, targets=targets_train)
+    # when
+    compacted = model.compact(compaction=compaction)
+    outputs = model.predict(inputs=inputs_test)
+    outputs_compacted = compacted.predict(inputs=inputs_test)
+    outputs_numba = compacted.model_copy(update={"engine": "numba"}).predict(inputs=inputs_test)
+    with pytest.raises(TypeError, match="explain samples") as explain_error:
+        compacted.explain_samples(inputs=inputs_test)
+    # then
+    assert compacted.get_internal_model() is not model.get_internal_model(), "Model should not be compacted!"
+    assert isinstance(compacted.get_internal_model().named_steps["regressor"], forests.ForestRegressor), (
+        "Compacted model should predict with a compact forest!"
+    )
+    assert (outputs - outputs_compacted).abs().max().item() <= compaction.tolerance + 1e-3, (
+        "Compacted model should change the outputs within the tolerance!"
+    )
+    assert outputs_numba.equals(outputs_compacted), "Outputs should be the same for all the engines!"
+    assert compacted.explain_model().equals(model.explain_model()), "Compacted model should explain the model!"
+    assert explain_error.match("explain samples"), "Compacted model should not explain the samples!"
+
+
+def test_hist_gradient_boosting_model(
+    train_test_sets: tuple[schemas.Inputs, schemas.Targets, schemas.Inputs, schemas.Targets],
+) -> None:
+    # given
+    params = {"learning_rate": 0.5, "max_iter": 100, "n_iter_no_change": 2, "random_state": 0}
+    inputs_train, targets_train, inputs_test, _ = train_test_sets
+    model = models.HistGradientBoostingModel().set_params(**params)
+    # when
+    with pytest.raises(ValueError, match="not fitted") as not_fitted_error:
+        model.get_internal_model()
+    model.fit(inputs=inputs_train, targets=targets_train)
+    outputs = model.predict(inputs=inputs_test)
+    regressor = model.get_internal_model().named_steps["regressor"]
+    shap_values = model.explain_samples(inputs=inputs_test)
+    predictions = model.get_internal_model().predict(inputs_test)
+    base_values = predictions - shap_values.to_numpy().sum(axis=1)
+    feature_importances = model.explain_model()
+    with pytest.raises(pdt.ValidationError, match="less than 1") as fraction_error:
+        models.HistGradientBoostingModel(validation_fraction=1.0)
+    # then
+    assert not_fitted_error.match("Model is not fitted yet!"), "Model should raise an error when not fitted!"
+    # - model
+    assert model.get_params().items() >= params.items(), "Model should have the given params!"
+    assert fraction_error.match("validation_fraction"), "Model should keep some training data!"
+    assert regressor.n_iter_ < params["max_iter"], "Regressor should stop early!"
+    assert regressor.is_categorical_.sum() == 2, "Regressor should handle the categoricals natively!"
+    # - outputs
+    assert outputs.ndim == 2, "Outputs should be a dataframe!"
+    assert len(outputs.index) == len(inputs_test.index), "Outputs should be the same length as inputs!"
+    # - shap values
+    assert len(shap_values.index) == len(inputs_test.index), "SHAP values should be the same length as inputs!"
+    assert len(shap_values.columns) == regressor.n_features_in_, "SHAP values should have one column per feature!"
+    assert base_values == pytest.approx(np.full(len(base_values), base_values.mean()), abs=1e-2), (
+        "SHAP values and the base value should add up to the predictions!"
+    )
+    # - feature importances
+    assert feature_importances["importance"].sum() == pytest.approx(1.0), "Feature importances should add up to 1.0!"
+    assert len(feature_importances["feature"]) == regressor.n_features_in_, (
+        "Feature importances should have one row per feature!"
+    )
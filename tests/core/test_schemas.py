@@ -1,5 +1,11 @@
 # %% IMPORTS
 
+import numpy as np
+import pandas as pd
+import pandera.errors
+import pyarrow as pa
+import pytest
+
 from bikes.core import models, schemas
 from bikes.io import datasets
 
@@ -24,6 +30,15 @@ def test_targets_schema(targets_reader: datasets.Reader) -> None:
     assert schema.check(data) is not None, "Targets data should be valid!"
 
 
+def test_schema_names() -> None:
+    # given
+    schema = schemas.TargetsSchema
+    # when
+    names = schema.names()
+    # then
+    assert names == ["instant", "cnt"], "Schema names should be the index and columns!"
+
+
 def test_outputs_schema(outputs_reader: datasets.Reader) -> None:
     # given
     schema = schemas.OutputsSchema
@@ -53,3 +68,316 @@ def test_feature_importances_schema(model: models.Model) -> None:
     data = model.explain_model()
     # then
     assert schema.check(data) is not None, "Feature importance data should be valid!"
+
+
+# %% VALIDATORS
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [schemas.InputsSchema, schemas.TargetsSchema, schemas.OutputsSchema],
+)
+def test_compile_schema(schema: type[schemas.Schema]) -> None:
+    # given
+    plan = schemas.compile_schema(schema=schema)
+    # when
+    names = None if plan is None else plan.names
+    # then
+    assert plan is not None, "Schema should be compiled!"
+    assert names == set(schema.to_schema().columns), "Plan should have the schema columns!"
+    assert schemas.compile_schema(schema=schema) is plan, "Schema should be compiled once!"
+
+
+def test_compile_schema_unsupported() -> None:
+    # given
+    schema = schemas.FeatureImportancesSchema  # strings are checked element-wise by pandera
+    # when
+    plan = schemas.compile_schema(schema=schema)
+    # then
+    assert plan is None, "Schema should not be compiled!"
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        "none",
+        "empty",
+        "int64",
+        "string dates",
+        "reordered",
+        "out of range",
+        "not in set",
+        "missing value",
+        "invalid dates",
+        "extra column",
+        "missing column",
+        "negative index",
+    ],
+)
+def test_schema_check_numpy(change: str, inputs_reader: datasets.Reader) -> None:
+    # given
+    data = inputs_reader.read()
+    first = data.index[0]
+    match change:
+        case "empty":
+            data = data.head(0)
+        case "int64":
+            data = data.astype({"hr": "int64", "season": "int64", "casual": "int64"})
+        case "string dates":
+            data = data.assign(dteday=data["dteday"].astype(str))
+        case "reordered":
+            data = data[data.columns[::-1]]
+        case "out of range":
+            data = data.assign(hr=data["hr"].where(data.index != first, 24))
+        case "not in set":
+            data = data.assign(season=np.uint8(0))
+        case "missing value":
+            data = data.assign(temp=data["temp"].where(data.index != first))
+        case "invalid dates":
+            data = data.assign(dteday="invalid")
+        case "extra column":
+            data = data.assign(extra=1)
+        case "missing column":
+            data = data.drop(columns="hr")
+        case "negative index":
+            data = data.set_axis(data.index.astype("int64") - data.index.max() - 1)
+    engines: list[schemas.Engine] = ["pandera", "numpy"]
+    # when
+    results = {}
+    for engine in engines:
+        try:
+            results[engine] = schemas.InputsSchema.check(data, engine=engine)
+        except (pandera.errors.SchemaError, pandera.errors.SchemaErrors) as error:
+            results[engine] = type(error)
+    # then
+    expected, result = results["pandera"], results["numpy"]
+    if isinstance(expected, pd.DataFrame):
+        assert isinstance(result, pd.DataFrame), "Numpy engine should pass like pandera!"
+        pd.testing.assert_frame_equal(result, expected, obj="Numpy engine should validate like pandera!")
+        assert not np.shares_memory(result["hr"].to_numpy(), data["hr"].to_numpy()), "Result should be a copy!"
+    else:
+        assert result is expected, "Numpy engine should fail with the pandera error!"
+
+
+# %% ARROW
+
+
+def test_arrow_schema() -> None:
+    # given
+    schema = schemas.InputsSchema
+    # when
+    arrow_schema = schema.arrow_schema()
+    # then
+    assert arrow_schema.names == schema.names(), "Arrow schema should have the index and columns!"
+    assert arrow_schema.field("instant").type == pa.uint32(), "Index field should have the index type!"
+    assert arrow_schema.field("dteday").type == pa.timestamp("ns"), "Date field should be a timestamp!"
+    assert arrow_schema.field("temp").type == pa.float16(), "Float field should keep its precision!"
+    assert arrow_schema.field("holiday").type == pa.bool_(), "Bool field should be a boolean!"
+
+
+def test_compile_arrow() -> None:
+    # given
+    supported = [schemas.InputsSchema, schemas.TargetsSchema, schemas.OutputsSchema]
+    unsupported = [schemas.SHAPValuesSchema, schemas.FeatureImportancesSchema]
+    # when
+    plans = [schemas.compile_arrow(schema=schema) for schema in supported]
+    plans_unsupported = [schemas.compile_arrow(schema=schema) for schema in unsupported]
+    # then
+    assert all(plan is not None for plan in plans), "Project schemas should be compiled!"
+    assert all(plan is None for plan in plans_unsupported), "Schemas without index or numbers should not be!"
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        "none",
+        "empty",
+        "string dates",
+        "reordered",
+        "index column",
+        "out of range",
+        "not in set",
+        "missing value",
+        "invalid dates",
+        "overflow",
+        "extra column",
+        "missing column",
+        "negative index",
+    ],
+)
+def test_schema_check_arrow(change: str, inputs_reader: datasets.Reader) -> None:
+    # given
+    data = inputs_reader.read()
+    first = data.index[0]
+    match change:
+        case "empty":
+            data = data.head(0)
+        case "string dates":
+            data = data.assign(dteday=data["dteday"].astype(str))
+        case "reordered":
+            data = data[data.columns[::-1]]
+        case "index column":
+            data = data.reset_index()
+        case "out of range":
+            data = data.assign(hr=data["hr"].where(data.index != first, 24))
+        case "not in set":
+            data = data.assign(season=data["season"].where(data.index != first, 0))
+        case "missing value":
+            data = data.assign(temp=data["temp"].where(data.index != first))
+        case "invalid dates":
+            data = data.assign(dteday="invalid")
+        case "overflow":
+            data = data.assign(casual=data["casual"].where(data.index != first, 2**40))
+        case "extra column":
+            data = data.assign(extra=1)
+        case "missing column":
+            data = data.drop(columns="hr")
+        case "negative index":
+            data = data.set_axis(data.index - data.index.max() - 1)
+    table = pa.Table.from_pandas(data)
+    # when
+    try:
+        result = schemas.InputsSchema.check_arrow(table).to_pandas()
+    except (pandera.errors.SchemaError, pandera.errors.SchemaErrors) as error:
+        result = error
+    try:
+        expected = schemas.InputsSchema.validate(schemas.arrow_frame(schema=schemas.InputsSchema, table=table))
+    except (pandera.errors.SchemaError, pandera.errors.SchemaErrors) as error:
+        expected = error
+    # then
+    if isinstance(expected, pd.DataFrame):
+        assert isinstance(result, pd.DataFrame), "Arrow check should pass like pandera!"
+        pd.testing.assert_frame_equal(result, expected, obj="Arrow check should validate like pandera!")
+    else:
+        assert type(result) is type(expected), "Arrow check should fail with the pandera error!"
+        assert str(result) == str(expected), "Arrow check should report the pandera failure!"
+        assert str(result.failure_cases) == str(expected.failure_cases), (
+            "Arrow check should report the pandera failure cases!"
+        )
+
+
+# %% TOKENS
+
+
+def test_schema_check_token(inputs_reader: datasets.Reader) -> None:
+    # given
+    data = schemas.InputsSchema.check(inputs_reader.read())
+    mutated = schemas.InputsSchema.check(inputs_reader.read())
+    edited = schemas.InputsSchema.check(inputs_reader.read())
+    # when
+    mutated["hr"] = mutated["hr"] + 99  # replace the column
+    edited.loc[edited.index[7], "season"] = 9  # edit a value in place, not only in the first and last rows
+    # then
+    assert schemas.is_validated(data=data, schema=schemas.InputsSchema), "Data should be validated!"
+    assert not schemas.is_validated(data=data, schema=schemas.TargetsSchema), "Data should be validated by its schema!"
+    assert schemas.InputsSchema.check(data) is data, "Check should be a no-op for validated data!"
+    assert not schemas.is_validated(data=data.copy(), schema=schemas.InputsSchema), "Copies should not be validated!"
+    assert not schemas.is_validated(data=mutated, schema=schemas.InputsSchema), "Mutated data should not be validated!"
+    assert not schemas.is_validated(data=edited, schema=schemas.InputsSchema), "Edited data should not be validated!"
+    with pytest.raises(pandera.errors.SchemaError):
+        schemas.InputsSchema.check(mutated)
+    with pytest.raises(pandera.errors.SchemaError):
+        schemas.InputsSchema.check(edited)
+
+
+def test_schema_check_token_mode(inputs_reader: datasets.Reader) -> None:
+    # given
+    data = inputs_reader.read()
+    data.loc[data.index[len(data) // 2], "hr"] = 24  # outside the head and tail
+    validation = schemas.Validation(head_tail=100, min_rows=100)
+    # when
+    token = schemas.VALIDATION.set(validation)
+    try:
+        validated = schemas.InputsSchema.check(data, mode="head_tail")
+    finally:
+        schemas.VALIDATION.reset(token)
+    # then
+    assert schemas.is_validated(data=validated, schema=schemas.InputsSchema, mode="head_tail"), "Same mode should skip!"
+    assert not schemas.is_validated(data=validated, schema=schemas.InputsSchema, mode="sample"), (
+        "Other subsets should not skip!"
+    )
+    assert not schemas.is_validated(data=validated, schema=schemas.InputsSchema), "Subsets should not skip full!"
+    with pytest.raises(pandera.errors.SchemaError, match="hr") as error:
+        schemas.InputsSchema.check(validated, mode="full")
+    assert error.match("less_than_or_equal_to"), "Full check should check all the rows!"
+
+
+@pytest.mark.parametrize("mode", ["full", "sample", "head_tail", "chunks", "off"])
+@pytest.mark.parametrize("engine", ["pandera", "numpy"])
+def test_schema_check_mode(mode: schemas.Mode, engine: schemas.Engine, inputs_reader: datasets.Reader) -> None:
+    # given
+    data = inputs_reader.read()
+    invalid = data.assign(hr=np.uint8(24))
+    middle = data.copy()
+    middle.loc[middle.index[len(middle) // 2], "hr"] = 24  # outside the head and tail
+    validation = schemas.Validation(mode=mode, engine=engine, fraction=0.1, head_tail=100, min_rows=100, chunk_size=400)
+    # when
+    token = schemas.VALIDATION.set(validation)
+    try:
+        validated = schemas.InputsSchema.check(data)
+        if mode == "off":
+            validated_invalid = schemas.InputsSchema.check(invalid)
+        else:
+            with pytest.raises((pandera.errors.SchemaError, pandera.errors.SchemaErrors)):
+                schemas.InputsSchema.check(invalid)
+        if mode == "head_tail":
+            validated_middle = schemas.InputsSchema.check(middle)
+    finally:
+        schemas.VALIDATION.reset(token)
+    # then
+    if mode == "off":
+        assert validated is data, "Data should not be validated!"
+        assert validated_invalid is invalid, "Invalid data should not be validated!"
+    else:
+        expected = schemas.InputsSchema.validate(data)
+        pd.testing.assert_frame_equal(validated, expected, obj="Data should be coerced like pandera!")
+    if mode == "head_tail":
+        assert validated_middle["hr"].dtype == np.uint8, "Rows outside the head and tail should be coerced!"
+        assert validated_middle["hr"].max() == 24, "Rows outside the head and tail should not be checked!"
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_schema_check_chunks(pool: schemas.Pool, inputs_reader: datasets.Reader) -> None:
+    # given
+    data = inputs_reader.read()
+    invalid = data.copy()
+    invalid.loc[invalid.index[[10, 1000]], "hr"] = 24  # first and third chunks
+    invalid.loc[invalid.index[1001], "season"] = 5  # third chunk, another check
+    validation = schemas.Validation(mode="chunks", chunk_size=400, pool=pool, max_workers=2)
+    # when
+    token = schemas.VALIDATION.set(validation)
+    try:
+        validated = schemas.InputsSchema.check(data)
+        with pytest.raises(pandera.errors.SchemaErrors) as error:
+            schemas.InputsSchema.check(invalid)
+    finally:
+        schemas.VALIDATION.reset(token)
+    # then
+    failure_cases = error.value.failure_cases
+    expected = schemas.InputsSchema.validate(data)
+    pd.testing.assert_frame_equal(validated, expected, obj="Chunks should be validated like pandera!")
+    assert set(failure_cases["column"]) == {"hr", "season"}, "Failure cases should be merged across checks!"
+    assert set(failure_cases["index"]) == set(invalid.index[[10, 1000, 1001]]), (
+        "Failure cases should be merged across chunks!"
+    )
+
+
+def test_validation_rows() -> None:
+    # given
+    validation = schemas.Validation(fraction=0.1, seed=42, head_tail=10, min_rows=50)
+    # when
+    sample = validation.rows(mode="sample", length=1000)
+    sample_again = validation.rows(mode="sample", length=1000)
+    head_tail = validation.rows(mode="head_tail", length=1000)
+    # then
+    assert sample is not None, "Sample should be a subset of the rows!"
+    assert len(sample) == 100, "Sample should have the fraction of the rows!"
+    assert np.array_equal(sample, np.unique(sample)), "Sample should be sorted and unique!"
+    assert np.array_equal(sample, sample_again), "Sample should be reproducible with its seed!"
+    assert head_tail is not None, "Head and tail should be a subset of the rows!"
+    assert head_tail.tolist() == [*range(10), *range(990, 1000)], "Head and tail should be the rows at each end!"
+    assert validation.rows(mode="sample", length=50) is None, "Small dataframes should be fully checked!"
+    assert validation.model_copy(update={"head_tail": 40}).rows(mode="head_tail", length=60) is None, (
+        "Overlapping ends should be fully checked!"
+    )
+    assert validation.rows(mode="full", length=1000) is None, "Full mode should check all the rows!"
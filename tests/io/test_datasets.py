@@ -1,12 +1,89 @@
 # %% IMPORTS
 
 import os
+import sqlite3
+import typing as T
 
+import pandas as pd
+import pandera.errors
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from bikes.core import schemas
 from bikes.io import datasets
 
+# %% CACHES
+
+
+def test_memory_cache(inputs: schemas.Inputs) -> None:
+    # given
+    size = int(inputs.memory_usage(index=True).sum())
+    cache = datasets.MemoryCache(max_bytes=2 * size)
+    # when
+    cache.put("a", inputs)
+    cache.put("b", inputs)
+    hit = cache.get("a")  # "b" becomes the least recently used
+    cache.put("c", inputs)
+    # then
+    assert hit is inputs, "Cached dataframe should be returned!"
+    assert cache.get("b") is None, "Least recently used dataframe should be evicted!"
+    assert cache.get("a") is not None, "Recent dataframes should be kept!"
+    assert cache.get("c") is not None, "Recent dataframes should be kept!"
+    assert cache.nbytes() == 2 * size, "Cache should stay under its maximum size!"
+
+
+@pytest.mark.parametrize(("memory_cache", "disk_cache"), [(True, False), (False, True), (True, True)])
+def test_reader_cache(memory_cache: bool, disk_cache: bool, inputs: schemas.Inputs, tmp_path: str) -> None:
+    # given
+    path = os.path.join(tmp_path, "inputs.parquet")
+    folder = os.path.join(tmp_path, "cache") if disk_cache else None
+    inputs.to_parquet(path)
+    reader = datasets.ParquetReader(path=path, columns="schema", memory_cache=memory_cache, disk_cache=folder)
+    # when
+    data = reader.read(schema=schemas.InputsSchema)
+    data_cached = reader.read(schema=schemas.InputsSchema)
+    data_cached.loc[data_cached.index[3], "hr"] = 99  # changes of a caller
+    data_again = reader.read(schema=schemas.InputsSchema)
+    data_disk = reader.model_copy(update={"memory_cache": False}).read(schema=schemas.InputsSchema)
+    data_unchecked = reader.read()
+    inputs.head(10).to_parquet(path)  # new size and mtime
+    data_changed = reader.read(schema=schemas.InputsSchema)
+    # then
+    assert data.equals(inputs), "Cached reads should return validated dataframes!"
+    assert data_again.equals(data), "Cached dataframe should not change with the returned copies!"
+    assert schemas.is_validated(data=data_again, schema=schemas.InputsSchema), "Cached copies should be validated!"
+    assert not data_unchecked.equals(data), "Reads without a schema should not be cached!"
+    assert len(data_changed) == 10, "Changed files should be read again!"
+    if memory_cache:
+        key = f"{reader.fingerprint(schema=schemas.InputsSchema)}-full"
+        assert datasets.CACHE.get(key) is not None, "Data should be cached!"
+    if disk_cache:
+        assert data_disk.equals(data), "Disk cache should return the validated dataframe!"
+        assert len(os.listdir(str(folder))) == 2, "Each version of the file should be stored on disk!"
+
+
+def test_reader_cache_mode(inputs: schemas.Inputs, tmp_path: str) -> None:
+    # given
+    path = os.path.join(tmp_path, "inputs.parquet")
+    folder = os.path.join(tmp_path, "cache")
+    inputs.assign(season=9).to_parquet(path)  # invalid for the schema
+    reader = datasets.ParquetReader(path=path, columns="schema", disk_cache=folder)
+    # when
+    token = schemas.VALIDATION.set(schemas.Validation(mode="off"))
+    try:
+        data = reader.read(schema=schemas.InputsSchema)
+    finally:
+        schemas.VALIDATION.reset(token)
+    # then
+    assert not schemas.is_validated(data=data, schema=schemas.InputsSchema, mode="sample"), "Data should be unchecked!"
+    with pytest.raises(pandera.errors.SchemaError, match="season") as error:
+        schemas.InputsSchema.check(data)
+    assert error.match("isin"), "Full check should fail on the unchecked data!"
+    with pytest.raises(pandera.errors.SchemaError, match="season"):
+        reader.read(schema=schemas.InputsSchema)  # not served from the cache of the off mode
+
+
 # %% READERS
 
 
@@ -32,6 +109,409 @@ def test_parquet_reader(limit: int | None, inputs_path: str) -> None:
     ), "Lineage profile should contain the data row count!"
 
 
+@pytest.mark.parametrize("lineage_mode", ["metadata", "sample"])
+def test_parquet_reader_lineage_mode(lineage_mode: str, inputs: schemas.Inputs, tmp_path: str) -> None:
+    # given
+    path = os.path.join(tmp_path, "inputs.parquet")
+    inputs.to_parquet(path)
+    reader = datasets.ParquetReader(path=path, lineage_mode=lineage_mode)
+    data = reader.read()
+    # when
+    lineage = reader.lineage(name="inputs", data=data)
+    lineage_again = reader.lineage(name="inputs", data=reader.read())
+    inputs.assign(hr=inputs["hr"].clip(upper=0)).to_parquet(path)
+    lineage_changed = reader.lineage(name="inputs", data=reader.read())
+    # then
+    assert isinstance(lineage, datasets.LineageDataset), "Lineage should not hash the full dataframe!"
+    assert lineage.digest == lineage_again.digest, "Lineage digest should be stable!"
+    assert lineage.digest != lineage_changed.digest, "Lineage digest should change with the data!"
+    assert lineage.schema is not None, "Lineage schema should be inferred from a sample!"
+    assert set(lineage.schema.input_names()) == set(data.columns), "Lineage schema names should be the data columns!"
+    assert lineage.profile == {"num_rows": len(data), "num_elements": data.size}, "Lineage profile should be set!"
+    assert datasets.parquet_footer(path), "Footer should not be empty for a parquet file!"
+
+
+@pytest.mark.parametrize("limit", [0, 1, 100, 10_000])
+def test_parquet_reader_limit(limit: int, inputs_path: str) -> None:
+    # given
+    reader = datasets.ParquetReader(path=inputs_path, limit=limit)
+    # when
+    data = reader.read()
+    # then
+    expected = pd.read_parquet(inputs_path, dtype_backend="pyarrow").head(limit)
+    pd.testing.assert_frame_equal(data, expected, obj="Data should be the head of the dataset!")
+
+
+def test_parquet_reader_columns(inputs: schemas.Inputs, tmp_outputs_path: str) -> None:
+    # given
+    inputs.assign(extra=1).to_parquet(tmp_outputs_path)
+    explicit = datasets.ParquetReader(path=tmp_outputs_path, columns=["hr", "temp"])
+    automatic = datasets.ParquetReader(path=tmp_outputs_path, columns="schema", limit=10)
+    # when
+    data_explicit = explicit.read()
+    data_automatic = automatic.read(schema=schemas.InputsSchema)
+    data_fallback = automatic.read()
+    # then
+    assert list(data_explicit.columns) == ["hr", "temp"], "Explicit columns should be read!"
+    assert data_explicit.index.name == "instant", "Index should be kept with explicit columns!"
+    assert "extra" not in data_automatic.columns, "Columns outside the schema should not be read!"
+    assert schemas.InputsSchema.check(data_automatic) is not None, "Schema columns should be read!"
+    assert "extra" in data_fallback.columns, "All columns should be read without a schema!"
+
+
+@pytest.mark.parametrize(
+    ("window", "start", "end", "columns"),
+    [
+        ("instant", 100, 300, None),
+        ("instant", None, 250, ["hr"]),
+        ("dteday", 400, 600, ["hr"]),
+        ("dteday", 1200, None, "schema"),
+    ],
+)
+def test_parquet_reader_window(
+    window: str,
+    start: int | None,
+    end: int | None,
+    columns: list[str] | str | None,
+    inputs: schemas.Inputs,
+    tmp_outputs_path: str,
+) -> None:
+    # given
+    inputs.to_parquet(tmp_outputs_path, row_group_size=100)
+    values = inputs.reset_index()[window]
+    # - bounds from the row positions
+    lower = None if start is None else str(values.iloc[start].date()) if window == "dteday" else int(values.iloc[start])
+    upper = None if end is None else str(values.iloc[end].date()) if window == "dteday" else int(values.iloc[end])
+    reader = datasets.ParquetReader(path=tmp_outputs_path, window=window, start=lower, end=upper, columns=columns)
+    full = datasets.ParquetReader(path=tmp_outputs_path, columns=columns).read(schema=schemas.InputsSchema)
+    # when
+    row_groups = reader.row_groups()
+    data = reader.read(schema=schemas.InputsSchema)
+    # then
+    inside = (values >= lower if lower is not None else True) & (values < upper if upper is not None else True)
+    assert 0 < len(row_groups) < len(inputs) // 100, "Row groups outside the window should be skipped!"
+    assert list(data.columns) == list(full.columns), "Data should have the projected columns!"
+    assert len(data) == inside.sum() > 0, "Data should only contain the rows inside the window!"
+
+
+@pytest.mark.parametrize("limit", [None, 100])
+def test_parquet_reader_cast(limit: int | None, inputs: schemas.Inputs, tmp_path: str) -> None:
+    # given
+    raw = os.path.join(tmp_path, "raw.parquet")
+    invalid = os.path.join(tmp_path, "invalid.parquet")
+    inputs.astype({"hr": "int64", "temp": "float64", "holiday": "int64"}).to_parquet(raw, row_group_size=200)
+    inputs.astype({"hr": "int64"}).assign(hr=-1).to_parquet(invalid)
+    reader = datasets.ParquetReader(path=raw, limit=limit, columns="schema", cast=True)
+    # when
+    data = reader.read(schema=schemas.InputsSchema)
+    batches = list(reader.read_batches(batch_size=100, schema=schemas.InputsSchema))
+    data_invalid = datasets.ParquetReader(path=invalid, cast=True).read(schema=schemas.InputsSchema)
+    with pytest.raises(pandera.errors.SchemaErrors) as error:
+        schemas.InputsSchema.check(data_invalid)
+    # then
+    expected = inputs if limit is None else inputs.head(limit)
+    checked = schemas.InputsSchema.check(data)
+    assert checked.dtypes.equals(data.dtypes), "Columns should have the schema types before the check!"
+    assert checked.equals(expected), "Data should be the inputs!"
+    assert all(batch.dtypes.equals(data.dtypes) for batch in batches), "Batches should have the schema types!"
+    assert data_invalid["hr"].dtype == "int64", "Columns should be kept if they cannot be cast!"
+    assert error.match("hr"), "Schema check should report the columns that cannot be cast!"
+
+
+@pytest.mark.parametrize("limit", [None, 100])
+def test_parquet_reader_check(limit: int | None, inputs: schemas.Inputs, tmp_path: str) -> None:
+    # given
+    raw = os.path.join(tmp_path, "raw.parquet")
+    invalid = os.path.join(tmp_path, "invalid.parquet")
+    inputs.astype({"hr": "int64", "temp": "float64", "holiday": "int64"}).to_parquet(raw)
+    inputs.assign(hr=inputs["hr"].where(inputs.index != inputs.index[-1], 24)).to_parquet(invalid)
+    reader = datasets.ParquetReader(path=raw, limit=limit, check=True)
+    # when
+    data = reader.read(schema=schemas.InputsSchema)
+    batches = list(reader.read_batches(batch_size=100, schema=schemas.InputsSchema))
+    with pytest.raises(pandera.errors.SchemaError) as error:
+        list(datasets.ParquetReader(path=invalid, check=True).read_batches(batch_size=100, schema=schemas.InputsSchema))
+    # then
+    expected = schemas.InputsSchema.check(datasets.ParquetReader(path=raw, limit=limit).read())
+    pd.testing.assert_frame_equal(data, expected, obj="Data should be validated like pandera!")
+    assert schemas.InputsSchema.check(data) is data, "Data should be marked as validated!"
+    assert all(schemas.is_validated(data=batch, schema=schemas.InputsSchema) for batch in batches), (
+        "Batches should be marked as validated!"
+    )
+    assert error.match("hr"), "Arrow check should report the invalid column!"
+    assert error.value.failure_cases["index"].tolist() == [inputs.index[-1]], "Arrow check should report the row!"
+
+
+@pytest.mark.parametrize("limit", [None, 250])
+def test_parquet_reader_batches(limit: int | None, inputs_path: str) -> None:
+    # given
+    reader = datasets.ParquetReader(path=inputs_path, limit=limit, columns="schema")
+    # when
+    batches = list(reader.read_batches(batch_size=100, schema=schemas.InputsSchema))
+    # then
+    expected = reader.read(schema=schemas.InputsSchema)
+    assert all(len(batch) <= 100 for batch in batches), "Batches should have at most the batch size!"
+    pd.testing.assert_frame_equal(pd.concat(batches), expected, obj="Batches should be the dataset!")
+
+
+@pytest.mark.parametrize(("start", "end", "columns"), [(None, None, None), (12_000, 12_500, "schema")])
+def test_remote_parquet_reader(
+    start: int | None,
+    end: int | None,
+    columns: str | None,
+    inputs: schemas.Inputs,
+    http_path: str,
+    http_url: str,
+    tmp_path: str,
+) -> None:
+    # given
+    inputs.to_parquet(os.path.join(http_path, "inputs.parquet"), row_group_size=100)
+    url = f"{http_url}/inputs.parquet"
+    cache = os.path.join(tmp_path, "blocks")
+    reader = datasets.RemoteParquetReader(
+        path=url, start=start, end=end, columns=columns, block_size=1 << 12, block_cache=cache, max_workers=4
+    )
+    local = datasets.ParquetReader(
+        path=os.path.join(http_path, "inputs.parquet"), start=start, end=end, columns=columns
+    )
+    # when
+    data = reader.read(schema=schemas.InputsSchema)
+    batches = list(reader.read_batches(batch_size=300, schema=schemas.InputsSchema))
+    remote = reader.remote()
+    remote.prefetch(ranges=[(0, remote.size)])
+    lineage = reader.lineage(name="inputs", data=data)
+    # then
+    expected = local.read(schema=schemas.InputsSchema)
+    assert reader.row_groups() == local.row_groups(), "Row groups should be selected from the remote footer!"
+    pd.testing.assert_frame_equal(data, expected, obj="Remote data should be the local data!")
+    pd.testing.assert_frame_equal(pd.concat(batches), expected, obj="Remote batches should be the local data!")
+    assert remote.fetched < remote.size // remote.block_size, "Blocks should be served from the block cache!"
+    assert reader.fingerprint() == reader.fingerprint(), "Fingerprint should be stable for the same object!"
+    assert lineage.source.url == url, "Lineage source url should be the remote url!"  # type: ignore[attr-defined]
+
+
+def test_remote_parquet_reader_headers(
+    inputs: schemas.Inputs, http_path: str, http_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # given
+    inputs.to_parquet(os.path.join(http_path, "inputs.parquet"))
+    reader = datasets.RemoteParquetReader(
+        path=f"{http_url}/inputs.parquet", headers={"Authorization": "Bearer secret"}, memory_cache=True
+    )
+    requests, send = [], datasets.request
+
+    def request(url: str, headers: dict[str, str], **kwargs: T.Any) -> tuple[int, dict[str, str], bytes]:
+        requests.append((headers, kwargs.get("byte_range")))
+        return send(url, headers=headers, **kwargs)
+
+    monkeypatch.setattr(datasets, "request", request)
+    # when
+    reader.read(schema=schemas.InputsSchema)
+    # then
+    sizes = [headers for headers, byte_range in requests if byte_range == (0, 0)]
+    assert sizes == [{"Authorization": "Bearer secret"}], "Size should be fetched once per read, with the headers!"
+    assert "secret" not in repr(reader), "Headers should be hidden from the repr!"
+    assert "secret" not in str(reader.model_dump()), "Headers should be hidden from the dumps!"
+
+
+def test_remote_file_blocks(inputs: schemas.Inputs, http_path: str, http_url: str) -> None:
+    # given
+    path = os.path.join(http_path, "inputs.parquet")
+    inputs.to_parquet(path)
+    remote = datasets.RemoteFile(url=f"{http_url}/inputs.parquet", headers={}, block_size=1 << 10, max_blocks=2)
+    sizes = []
+    # when
+    chunks = []
+    for start in range(0, remote.size, 1000):
+        chunks.append(remote.pread(start=start, length=1000))
+        sizes.append(remote.nbytes())
+    remote.prefetch(ranges=[(0, 8 << 10)])
+    # then
+    with open(path, "rb") as file:
+        assert b"".join(chunks) == file.read(), "Blocks should be read in order!"
+    assert max(sizes) <= 2 * remote.block_size, "Streamed blocks should be evicted beyond the maximum!"
+    assert remote.nbytes() == 8 << 10, "Prefetched blocks should be kept for the current read!"
+
+
+def test_block_cache(tmp_path: str) -> None:
+    # given
+    cache = datasets.BlockCache(path=str(tmp_path), max_bytes=250)
+    # when
+    cache.put("a", b"a" * 100)
+    cache.put("b", b"b" * 100)
+    hit = cache.get("a")  # mark "a" as recently used
+    os.utime(os.path.join(tmp_path, "b.block"), ns=(0, 0))
+    cache.put("c", b"c" * 100)
+    # then
+    assert hit == b"a" * 100, "Cache should return the block!"
+    assert cache.get("b") is None, "Least recently used block should be evicted!"
+    assert cache.get("c") == b"c" * 100, "Cache should keep the new block!"
+    assert cache.nbytes() == 200, "Cache should be bounded by its maximum size!"
+    assert cache.nbytes() == cache._total, "Cache should track its size between the scans!"
+
+
+@pytest.mark.parametrize("compression", ["uncompressed", "lz4"])
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_arrow_ipc_reader(compression: str, memory_map: bool, inputs: schemas.Inputs, tmp_path: str) -> None:
+    # given
+    path = os.path.join(tmp_path, "inputs.arrow")
+    datasets.ArrowIPCWriter(path=path, compression=compression).write(data=inputs)
+    reader = datasets.ArrowIPCReader(path=path, memory_map=memory_map)
+    limited = datasets.ArrowIPCReader(path=path, memory_map=memory_map, limit=50, columns=["hr"])
+    # when
+    data = reader.read()
+    data_limited = limited.read()
+    batches = list(reader.read_batches(batch_size=400))
+    lineage = reader.lineage(name="inputs", data=data)
+    # then
+    assert schemas.InputsSchema.check(data).equals(inputs), "Data should be the written inputs!"
+    assert list(data_limited.columns) == ["hr"], "Data should have the projected columns!"
+    assert data_limited.index.name == "instant", "Index should be kept with explicit columns!"
+    assert len(data_limited) == 50, "Data should have the limit size!"
+    assert [len(batch) for batch in batches] == [400, 400, 400, 300], "Batches should have the batch size!"
+    assert lineage.source.uri == path, "Lineage source uri should be the inputs path!"  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("limit", [None, 100])
+def test_parquet_dataset_reader(limit: int | None, inputs: schemas.Inputs, tmp_path: str) -> None:
+    # given
+    dates = inputs["dteday"].dt
+    for key, group in inputs.groupby([dates.year, dates.month, dates.day]):
+        year, month, day = T.cast(tuple[int, int, int], key)
+        folder = os.path.join(tmp_path, f"year={year}", f"month={month}")
+        os.makedirs(folder, exist_ok=True)
+        group.to_parquet(os.path.join(folder, f"{day:02d}.parquet"))
+    month = int(inputs["dteday"].dt.month.iloc[-1])
+    reader = datasets.ParquetDatasetReader(path=str(tmp_path), limit=limit, max_workers=4)
+    pruned = datasets.ParquetDatasetReader(path=str(tmp_path), partitions={"month": [month]}, columns="schema")
+    globbed = datasets.ParquetDatasetReader(path=os.path.join(tmp_path, "*", f"month={month}", "*.parquet"))
+    # when
+    data = reader.read()
+    data_pruned = pruned.read(schema=schemas.InputsSchema)
+    data_globbed = globbed.read()
+    batches = list(reader.read_batches(batch_size=10))
+    lineage = reader.lineage(name="inputs", data=data)
+    # then
+    expected = inputs if limit is None else inputs.head(limit)
+    in_month = inputs[inputs["dteday"].dt.month == month]
+    assert schemas.InputsSchema.check(data).equals(expected), "Data should be the partitioned inputs!"
+    assert schemas.InputsSchema.check(data_pruned).equals(in_month), "Data should be the selected partitions!"
+    assert len(data_globbed) == len(in_month), "Data should be the globbed files!"
+    assert sum(len(batch) for batch in batches) == len(expected), "Batches should cover the dataset!"
+    assert lineage.source.uri == str(tmp_path), "Lineage source uri should be the dataset path!"  # type: ignore[attr-defined]
+
+
+def test_parquet_dataset_reader_order(inputs: schemas.Inputs, tmp_path: str) -> None:
+    # given
+    half = len(inputs) // 2
+    for month, group in [(9, inputs.iloc[:half]), (10, inputs.iloc[half:])]:
+        folder = os.path.join(tmp_path, "year=2011", f"month={month}")
+        os.makedirs(folder, exist_ok=True)
+        group.to_parquet(os.path.join(folder, "part.parquet"))
+    reader = datasets.ParquetDatasetReader(path=str(tmp_path))
+    limited = datasets.ParquetDatasetReader(path=str(tmp_path), limit=1)
+    # when
+    files = reader.files()
+    data = reader.read()
+    data_limited = limited.read()
+    # then
+    assert "month=9" in files[0], "Files should be in partition order!"
+    assert "month=10" in files[1], "Files should be in partition order!"
+    assert schemas.InputsSchema.check(data).equals(inputs), "Data should be in partition order!"
+    assert schemas.InputsSchema.check(data_limited).equals(inputs.head(1)), "Limit should keep the first rows!"
+
+
+def test_parquet_dataset_reader_padded(inputs: schemas.Inputs, tmp_path: str) -> None:
+    # given
+    folder = os.path.join(tmp_path, "year=2011", "month=01")
+    os.makedirs(folder)
+    inputs.to_parquet(os.path.join(folder, "part.parquet"))
+    selected = datasets.ParquetDatasetReader(path=str(tmp_path), partitions={"month": [1]})
+    pruned = datasets.ParquetDatasetReader(path=str(tmp_path), partitions={"month": ["2"]})
+    # when
+    files = selected.files()
+    files_pruned = pruned.files()
+    # then
+    assert len(files) == 1, "Padded partition values should match their numeric values!"
+    assert files_pruned == [], "Other partition values should be pruned!"
+
+
+def test_parquet_dataset_reader_missing(tmp_path: str) -> None:
+    # given
+    reader = datasets.ParquetDatasetReader(path=str(tmp_path))
+    # when
+    with pytest.raises(FileNotFoundError) as error:
+        reader.read()
+    # then
+    assert error.match("No parquet files found"), "Reader should raise an error without files!"
+
+
+@pytest.mark.parametrize("limit", [None, 100])
+def test_csv_reader(limit: int | None, inputs: schemas.Inputs, targets: schemas.Targets, tmp_path: str) -> None:
+    # given
+    path = os.path.join(tmp_path, "hour.csv")
+    cache = os.path.join(tmp_path, "cache")
+    inputs.join(targets).astype({"holiday": int, "workingday": int}).to_csv(path, date_format="%Y-%m-%d")
+    reader = datasets.CSVReader(path=path, limit=limit, columns="schema", cache=cache)
+    # when
+    data = reader.read(schema=schemas.InputsSchema)
+    data_cached = reader.read(schema=schemas.InputsSchema)
+    data_targets = datasets.CSVReader(path=path, limit=limit, columns="schema").read(schema=schemas.TargetsSchema)
+    data_checked = datasets.CSVReader(path=path, limit=limit, columns="schema", check=True).read(
+        schema=schemas.InputsSchema
+    )
+    batches = list(reader.read_batches(batch_size=40, schema=schemas.InputsSchema))
+    lineage = reader.lineage(name="inputs", data=data)
+    # then
+    expected = inputs if limit is None else inputs.head(limit)
+    assert data["hr"].dtype == pd.ArrowDtype(pa.uint8()), "Columns should be parsed to the schema types!"
+    assert data["temp"].dtype == pd.ArrowDtype(pa.float16()), "Columns should be cast to the schema types!"
+    assert data["holiday"].dtype == pd.ArrowDtype(pa.bool_()), "Columns should be parsed to the schema types!"
+    assert schemas.InputsSchema.check(data).equals(expected), "Data should be the inputs!"
+    assert schemas.InputsSchema.check(data_checked) is data_checked, "Checked data should be marked as validated!"
+    assert data_checked.equals(expected), "Checked data should be the inputs!"
+    assert list(data_targets.columns) == ["cnt"], "Data should have the projected columns!"
+    assert len(os.listdir(cache)) == 1, "Data should be cached once!"
+    pd.testing.assert_frame_equal(data_cached, data, obj="Cached data should be the parsed data!")
+    pd.testing.assert_frame_equal(pd.concat(batches), data, obj="Batches should be the parsed data!")
+    assert lineage.source.uri == path, "Lineage source uri should be the inputs path!"  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(("start", "end", "limit"), [(None, None, None), (12_000, 12_500, None), (None, None, 50)])
+def test_sql_reader(
+    start: int | None, end: int | None, limit: int | None, inputs: schemas.Inputs, tmp_path: str
+) -> None:
+    # given
+    connection = {"database": os.path.join(tmp_path, "bikes.db"), "check_same_thread": False}
+    with sqlite3.connect(connection["database"]) as database:
+        inputs.reset_index().astype({"dteday": str}).to_sql("hour", database, index=False)
+    reader = datasets.SQLReader(
+        query="SELECT * FROM hour WHERE hr >= ?",
+        parameters=[0],
+        connection=connection,
+        start=start,
+        end=end,
+        limit=limit,
+        columns="schema",
+        fetch_size=128,
+    )
+    datasets.POOL.clear()
+    # when
+    data = reader.read(schema=schemas.InputsSchema)
+    batches = list(reader.read_batches(batch_size=40, schema=schemas.InputsSchema))
+    lineage = reader.lineage(name="inputs", data=data)
+    # then
+    expected = inputs if start is None or end is None else inputs[(inputs.index >= start) & (inputs.index < end)]
+    expected = expected if limit is None else expected.head(limit)
+    assert data["hr"].dtype == pd.ArrowDtype(pa.uint8()), "Columns should be fetched to the schema types!"
+    assert data["dteday"].dtype == pd.ArrowDtype(pa.timestamp("ns")), "Columns should be cast to the schema types!"
+    assert schemas.InputsSchema.check(data).equals(expected), "Data should be the inputs inside the window!"
+    pd.testing.assert_frame_equal(pd.concat(batches), data, obj="Batches should be the fetched data!")
+    assert datasets.POOL.size() == 1, "Connection should be reused across reads!"
+    assert lineage.name == "inputs", "Lineage name should be inputs!"
+    datasets.POOL.clear()
+
+
 # %% WRITERS
 
 
@@ -42,3 +522,146 @@ def test_parquet_writer(targets: schemas.Targets, tmp_outputs_path: str) -> None
     writer.write(data=targets)
     # then
     assert os.path.exists(tmp_outputs_path), "Data should be written!"
+
+
+@pytest.mark.parametrize("compression", ["none", "zstd"])
+def test_parquet_writer_options(compression: str, targets: schemas.Targets, tmp_outputs_path: str) -> None:
+    # given
+    writer = datasets.ParquetWriter(
+        path=tmp_outputs_path,
+        row_group_size=500,
+        compression=compression,
+        compression_level=3 if compression == "zstd" else None,
+        use_dictionary=False,
+        write_statistics=False,
+    )
+    # when
+    writer.write(data=targets)
+    # then
+    metadata = pq.ParquetFile(tmp_outputs_path).metadata
+    column = metadata.row_group(0).column(0)
+    assert metadata.num_row_groups == len(targets) // 500, "Row groups should have the given size!"
+    assert column.compression == compression.upper().replace("NONE", "UNCOMPRESSED"), "Codec should be set!"
+    assert not column.is_stats_set, "Statistics should not be written!"
+
+
+@pytest.mark.parametrize("row_group_size", [None, 250])
+def test_parquet_writer_batches(row_group_size: int | None, outputs: schemas.Outputs, tmp_outputs_path: str) -> None:
+    # given
+    writer = datasets.ParquetWriter(path=tmp_outputs_path, row_group_size=row_group_size)
+    batches = [outputs.iloc[start : start + 100] for start in range(0, len(outputs), 100)]
+    # when
+    writer.write_batches(batches=iter(batches))
+    # then
+    data = datasets.ParquetReader(path=tmp_outputs_path).read()
+    metadata = pq.ParquetFile(tmp_outputs_path).metadata
+    sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    assert schemas.OutputsSchema.check(data).equals(outputs), "Batches should be appended to the file!"
+    assert sizes == ([100] * 15 if row_group_size is None else [250] * 6), "Batches should fill the row groups!"
+
+
+@pytest.mark.parametrize("kind", ["ParquetWriter", "ArrowIPCWriter"])
+def test_writer_batches_error(kind: str, outputs: schemas.Outputs, tmp_path: str) -> None:
+    # given
+    path = os.path.join(tmp_path, "outputs.data")
+    writer = getattr(datasets, kind)(path=path)
+    writer.write(data=outputs)
+    size = os.path.getsize(path)
+
+    def batches() -> T.Iterator[schemas.Outputs]:
+        yield outputs.iloc[:100]
+        raise RuntimeError("Batch failed!")
+
+    # when
+    with pytest.raises(RuntimeError, match="Batch failed") as error:
+        writer.write_batches(batches=batches())
+    writer.write_batches(batches=[])
+    # then
+    assert error.match("Batch failed"), "Error should be raised!"
+    assert os.path.getsize(path) == size, "Failed writes should leave the previous file untouched!"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")], "Temporary files should be removed!"
+
+
+@pytest.mark.parametrize(("partition", "bucket_size"), [("dteday", None), ("instant", 1000)])
+def test_partitioned_parquet_writer(
+    partition: str, bucket_size: int | None, inputs: schemas.Inputs, tmp_path: str
+) -> None:
+    # given
+    writer = datasets.PartitionedParquetWriter(path=str(tmp_path), partition=partition, bucket_size=bucket_size)
+    writer.write(data=inputs)
+    keys = writer.keys(data=inputs)
+    rerun = inputs[[key == keys[-1] for key in keys]].copy()
+    rerun["hr"] = rerun["hr"].clip(upper=0)
+    files = datasets.ParquetDatasetReader(path=str(tmp_path)).files()
+    mtimes = {file: os.stat(file).st_mtime_ns for file in files}
+    # when
+    writer.write(data=rerun)
+    # then
+    data = datasets.ParquetDatasetReader(path=str(tmp_path)).read().sort_index()
+    changed = [file for file in files if os.stat(file).st_mtime_ns != mtimes[file]]
+    assert len(files) == len(set(keys)) > 1, "Each partition should be written to its own file!"
+    assert changed == [os.path.join(tmp_path, f"{partition}={keys[-1]}", "part-0.parquet")], (
+        "Only the rerun partition should be rewritten!"
+    )
+    expected = inputs.copy()
+    expected.update(rerun)
+    assert schemas.InputsSchema.check(data).equals(expected), "Data should have the rerun partition replaced!"
+
+
+@pytest.mark.parametrize(("partition", "bucket_size"), [("dteday", None), ("instant", 1000)])
+def test_partitioned_parquet_writer_batches(
+    partition: str, bucket_size: int | None, inputs: schemas.Inputs, tmp_path: str
+) -> None:
+    # given
+    writer = datasets.PartitionedParquetWriter(path=str(tmp_path), partition=partition, bucket_size=bucket_size)
+    batches = (inputs.iloc[start : start + 100] for start in range(0, len(inputs), 100))  # splits the partitions
+    # when
+    writer.write_batches(batches=batches)
+    with pytest.raises(ValueError, match="not a column or an index") as error:
+        writer.write(data=inputs.reset_index(drop=True).drop(columns=[partition], errors="ignore"))
+    # then
+    data = datasets.ParquetDatasetReader(path=str(tmp_path)).read().sort_index()
+    assert schemas.InputsSchema.check(data).equals(inputs), "Batches should be appended to their partitions!"
+    assert error.match("not a column or an index"), "Data without the partition should be rejected!"
+
+
+def test_partitioned_parquet_writer_buckets(inputs: schemas.Inputs, tmp_path: str) -> None:
+    # given
+    writer = datasets.PartitionedParquetWriter(path=str(tmp_path))
+    unbucketed = writer.model_copy(update={"bucket_size": None})
+    writer.write(data=inputs)
+    rerun = inputs.tail(5).copy()  # a few instants of the last bucket
+    rerun["hr"] = rerun["hr"].clip(upper=0)
+    # when
+    keys = writer.keys(data=inputs)
+    with pytest.raises(ValueError, match="bucket size") as error:
+        unbucketed.keys(data=inputs)
+    writer.write(data=rerun)
+    # then
+    assert len(set(keys)) <= len(inputs) // 720 + 2, "Instants should be grouped in buckets of the default size!"
+    assert error.match("bucket size"), "Integer keys should require a bucket size!"
+    data = schemas.InputsSchema.check(datasets.ParquetDatasetReader(path=str(tmp_path)).read().sort_index())
+    expected = inputs.copy()
+    expected.update(rerun)
+    assert len(data) == len(inputs), "Rerun should keep the other rows of its bucket!"
+    assert data.equals(expected), "Rerun should replace the rows of its keys!"
+
+
+@pytest.mark.parametrize("paramstyle", ["qmark", "named"])
+def test_sql_writer(paramstyle: str, outputs: schemas.Outputs, tmp_path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    # given
+    monkeypatch.setattr(sqlite3, "paramstyle", paramstyle)  # sqlite3 binds both markers
+    connection = {"database": os.path.join(tmp_path, "bikes.db")}
+    with sqlite3.connect(connection["database"]) as database:
+        database.execute("CREATE TABLE predictions (instant INTEGER PRIMARY KEY, prediction INTEGER)")
+    writer = datasets.SQLWriter(table="predictions", connection=connection, mode="replace", batch_size=100)
+    start = int(outputs.index[0])  # bound in the window of the query
+    reader = datasets.SQLReader(query="SELECT * FROM predictions", connection=connection, start=start)
+    datasets.POOL.clear()
+    # when
+    writer.write(data=outputs)
+    writer.write_batches(batches=[outputs.iloc[:250], outputs.iloc[250:]])  # replace the rows
+    data = reader.read(schema=schemas.OutputsSchema)
+    # then
+    assert schemas.OutputsSchema.check(data).equals(outputs), "Data should be the outputs!"
+    datasets.POOL.clear()
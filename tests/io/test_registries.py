@@ -1,6 +1,9 @@
 # %% IMPORTS
 
-from bikes.core import models, schemas
+import numpy as np
+import pytest
+
+from bikes.core import forests, models, schemas
 from bikes.io import registries, services
 from bikes.utils import signers
 
@@ -45,17 +48,19 @@ def test_uri_for_model_alias_or_version() -> None:
 # %% SAVERS/LOADERS/REGISTERS
 
 
+@pytest.mark.parametrize("compaction", [None, forests.Compaction()])
 def test_custom_pipeline(
     model: models.Model,
     inputs: schemas.Inputs,
     signature: signers.Signature,
     mlflow_service: services.MlflowService,
+    compaction: forests.Compaction | None,
 ) -> None:
     # given
     path = "custom"
     name = "Custom"
     tags = {"registry": "mlflow"}
-    saver = registries.CustomSaver(path=path)
+    saver = registries.CustomSaver(path=path, compaction=compaction)
     loader = registries.CustomLoader()
     register = registries.MlflowRegister(tags=tags)
     run_config = mlflow_service.RunConfig(name="Custom-Run")
@@ -65,7 +70,8 @@ def test_custom_pipeline(
         version = register.register(name=name, model_uri=info.model_uri)
     model_uri = registries.uri_for_model_version(name=name, version=version.version)
     adapter = loader.load(uri=model_uri)
-    outputs = adapter.predict(inputs=inputs)
+    outputs = adapter.predict(inputs=inputs)  # validated: signature enforcement skipped
+    outputs_enforced = adapter.predict(inputs=inputs.copy())
     # then
     # - uri
     assert model_uri == f"models:/{name}/{version.version}", "The model URI should be valid!"
@@ -87,6 +93,8 @@ def test_custom_pipeline(
     )
     # - output
     assert schemas.OutputsSchema.check(outputs) is not None, "Outputs should be valid!"
+    assert outputs.equals(outputs_enforced), "Outputs should not depend on the signature enforcement!"
+    assert np.allclose(outputs, model.predict(inputs=inputs), rtol=1e-5), "Outputs should match the saved model!"
 
 
 def test_builtin_pipeline(
@@ -1,6 +1,11 @@
 # %% IMPORTS
 
-from bikes.io import services
+import concurrent.futures as CF
+
+import pytest
+
+from bikes.core import schemas
+from bikes.io import datasets, services
 from bikes.jobs import base
 
 # %% JOBS
@@ -34,3 +39,49 @@ def test_job(
     assert hasattr(job, "mlflow_service"), "Job should have an Mlflow service!"
     # - outputs
     assert set(out) == {"self", "a", "b"}, "Run should return local variables!"
+
+
+def test_job_validation(
+    logger_service: services.LoggerService,
+    alerts_service: services.AlertsService,
+    mlflow_service: services.MlflowService,
+) -> None:
+    # given
+    class MyJob(base.Job):
+        KIND: str = "MyJob"
+
+        def run(self) -> base.Locals:
+            validation = schemas.VALIDATION.get()
+            validation_background = self.submit(schemas.VALIDATION.get).result()
+            return locals()
+
+    job = MyJob(
+        logger_service=logger_service,
+        alerts_service=alerts_service,
+        mlflow_service=mlflow_service,
+        validation=schemas.Validation(mode="sample", engine="numpy"),
+    )
+    # when
+    with job as runner:
+        out = runner.run()
+    with pytest.raises(ValueError, match="not entered") as error:
+        job.submit(schemas.VALIDATION.get)
+    # then
+    assert error.match("not entered"), "Job should shut down its threads on exit!"
+    assert out["validation"] == job.validation, "Job should set the validation context!"
+    assert out["validation_background"] == job.validation, "Submitted tasks should share the context!"
+    assert schemas.VALIDATION.get() == schemas.Validation(), "Job should reset the validation context!"
+
+
+def test_load(inputs_reader: datasets.ParquetReader, targets_reader: datasets.ParquetReader) -> None:
+    # given
+    executor = CF.ThreadPoolExecutor()
+    inputs_future = executor.submit(base.load, reader=inputs_reader, schema=schemas.InputsSchema)
+    targets_future = executor.submit(base.load, reader=targets_reader, schema=schemas.TargetsSchema)
+    # when
+    inputs_, inputs = inputs_future.result()
+    targets_, targets = targets_future.result()
+    executor.shutdown()
+    # then
+    assert inputs.equals(schemas.InputsSchema.check(inputs_)), "Inputs should be checked!"
+    assert targets.equals(schemas.TargetsSchema.check(targets_)), "Targets should be checked!"
@@ -76,15 +76,18 @@ def test_evaluations_job(
         "run",
         "inputs",
         "inputs_",
+        "inputs_future",
         "inputs_lineage",
         "targets",
         "targets_",
+        "targets_future",
         "targets_lineage",
         "outputs",
         "model",
         "model_uri",
         "dataset",
         "dataset_",
+        "digest",
         "extra_metrics",
         "validation_thresholds",
         "evaluations",
@@ -1,6 +1,7 @@
 # %% IMPORTS
 
 import _pytest.capture as pc
+import pydantic as pdt
 import pytest
 
 from bikes import jobs
@@ -62,3 +63,58 @@ def test_inference_job(
     assert out["outputs"].ndim == 2, "Outputs should be a dataframe!"
     # - alerting service
     assert "Inference Job Finished" in capsys.readouterr().out, "Alerting service should be called!"
+
+
+def test_inference_job_stream(
+    mlflow_service: services.MlflowService,
+    alerts_service: services.AlertsService,
+    logger_service: services.LoggerService,
+    inputs_reader: datasets.ParquetReader,
+    tmp_outputs_writer: datasets.ParquetWriter,
+    model_alias: registries.Version,
+    loader: registries.CustomLoader,
+    capsys: pc.CaptureFixture[str],
+) -> None:
+    # given
+    batch_size = 400
+    # when
+    job = jobs.InferenceJob(
+        logger_service=logger_service,
+        alerts_service=alerts_service,
+        mlflow_service=mlflow_service,
+        inputs=inputs_reader,
+        outputs=tmp_outputs_writer,
+        alias_or_version=model_alias.version,
+        loader=loader,
+        batch_size=batch_size,
+    )
+    with job as runner:
+        out = runner.run()
+    # then
+    # - vars
+    assert set(out) == {
+        "self",
+        "logger",
+        "batch_size",
+        "model_uri",
+        "model",
+        "predict_batches",
+        "rows",
+    }
+    # - outputs
+    outputs = datasets.ParquetReader(path=tmp_outputs_writer.path).read()
+    assert out["rows"] == len(outputs) == inputs_reader.limit, "Outputs should be written for every input!"
+    # - alerting service
+    assert "Inference Job Finished" in capsys.readouterr().out, "Alerting service should be called!"
+
+
+def test_inference_job_batch_size(
+    inputs_reader: datasets.ParquetReader, tmp_outputs_writer: datasets.ParquetWriter
+) -> None:
+    # given
+    batch_size = 0
+    # when
+    with pytest.raises(pdt.ValidationError, match="greater than or equal to 1") as error:
+        jobs.InferenceJob(inputs=inputs_reader, outputs=tmp_outputs_writer, batch_size=batch_size)
+    # then
+    assert error.match("batch_size"), "Batch size should be positive!"
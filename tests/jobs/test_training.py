@@ -1,9 +1,11 @@
 # %% IMPORTS
 
 import _pytest.capture as pc
+import pydantic as pdt
+import pytest
 
 from bikes import jobs
-from bikes.core import metrics, models, schemas
+from bikes.core import forests, metrics, models, schemas
 from bikes.io import datasets, registries, services
 from bikes.utils import signers, splitters
 
@@ -56,9 +58,11 @@ def test_training_job(
         "run",
         "inputs",
         "inputs_",
+        "inputs_future",
         "inputs_lineage",
         "targets",
         "targets_",
+        "targets_future",
         "targets_lineage",
         "train_index",
         "test_index",
@@ -139,3 +143,16 @@ def test_training_job(
     assert model_version.run_id == out["run"].info.run_id, "MLFlow model version run id should be the same!"
     # - alerting service
     assert "Training Job Finished" in capsys.readouterr().out, "Alerting service should be called!"
+
+
+def test_training_job_compaction(inputs_reader: datasets.ParquetReader, targets_reader: datasets.ParquetReader) -> None:
+    # given
+    saver = registries.CustomSaver(compaction=forests.Compaction())
+    model = models.HistGradientBoostingModel()
+    # when
+    job = jobs.TrainingJob(inputs=inputs_reader, targets=targets_reader, saver=saver)
+    with pytest.raises(pdt.ValidationError, match="can't be compacted") as error:
+        jobs.TrainingJob(inputs=inputs_reader, targets=targets_reader, model=model, saver=saver)
+    # then
+    assert job.model.COMPACTABLE, "Baseline model should be saved compacted!"
+    assert error.match("can't be compacted"), "Job should reject the compaction of other models before training!"
@@ -49,9 +49,11 @@ def test_tuning_job(
         "run",
         "inputs",
         "inputs_",
+        "inputs_future",
         "inputs_lineage",
         "targets",
         "targets_",
+        "targets_future",
         "targets_lineage",
         "results",
         "best_params",
@@ -1,12 +1,16 @@
 # %% IMPORTS
 
+import pytest
+
 from bikes.core import metrics, models, schemas
 from bikes.utils import searchers, splitters
 
 # %% SEARCHERS
 
 
+@pytest.mark.parametrize("cache", [True, False])
 def test_grid_cv_searcher(
+    cache: bool,
     model: models.Model,
     metric: metrics.Metric,
     inputs: schemas.Inputs,
@@ -15,7 +19,7 @@ def test_grid_cv_searcher(
 ) -> None:
     # given
     param_grid = {"max_depth": [3, 5, 7]}
-    searcher = searchers.GridCVSearcher(param_grid=param_grid)
+    searcher = searchers.GridCVSearcher(param_grid=param_grid, cache=cache)
     # when
     result, best_score, best_params = searcher.search(
         model=model,
@@ -25,6 +29,42 @@ def test_grid_cv_searcher(
         cv=train_test_splitter,
     )
     # then
+    assert models.MEMORY.get() is None, "Memory should be reset after the search!"
     assert set(best_params) == set(param_grid), "Best params should have the same keys as grid!"
     assert float("-inf") < best_score < float("+inf"), "Best score should be a floating number!"
     assert len(result) == sum(len(vs) for vs in param_grid.values()), "Results should have one row per candidate!"
+
+
+def test_grid_cv_searcher_cache(
+    model: models.Model,
+    metric: metrics.Metric,
+    inputs: schemas.Inputs,
+    targets: schemas.Targets,
+    train_test_splitter: splitters.Splitter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # given
+    memories: list[models.Memory] = []
+
+    class SpyMemory(models.Memory):
+        def __init__(self) -> None:
+            super().__init__()
+            memories.append(self)
+
+    monkeypatch.setattr(models, "Memory", SpyMemory)
+    param_grid = {"n_estimators": [5, 10, 20]}  # the candidates share the transformer config
+    cached = searchers.GridCVSearcher(param_grid=param_grid, cache=True, refit=False, verbose=0)
+    uncached = cached.model_copy(update={"cache": False})
+    # when
+    cached_results, cached_score, cached_params = cached.search(
+        model=model, metric=metric, inputs=inputs, targets=targets, cv=train_test_splitter
+    )
+    results, best_score, best_params = uncached.search(
+        model=model, metric=metric, inputs=inputs, targets=targets, cv=train_test_splitter
+    )
+    # then
+    assert len(memories) == 1, "Memory should only be created with cache!"
+    assert len(memories[0].results) == 1, "Candidates should reuse the transformer fitted on the fold!"
+    assert [len(trees) for trees in memories[0].trees.values()] == [20], "Memory should keep the largest forest!"
+    assert cached_results["mean_test_score"].equals(results["mean_test_score"]), "Cache should keep the scores!"
+    assert (cached_score, cached_params) == (best_score, best_params), "Cache should keep the best candidate!"